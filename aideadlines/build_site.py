@@ -0,0 +1,239 @@
+"""Build the served site in ``html/`` from the package's assets and the published data.
+
+``make_website.sh`` used to copy every asset into ``html/`` and gzip every file with
+``--best`` on every run, although usually only a few data files change. This builds the site
+incrementally instead:
+
+- every asset is read and hashed; only files whose content changed are written, and only
+  those get new ``.gz`` (and, with the optional ``brotli`` package, ``.br``) variants,
+  compressed in parallel;
+- scripts, stylesheets and fonts are fingerprinted (``scripts.3f9a2b1c4d5e.js``) so they can
+  be cached forever; the references in ``index.html`` and the stylesheets are rewritten to
+  match. Data files, icons and ``index.html`` keep their names (the data URLs are a public
+  API, see ``series_api`` and ``ics``);
+- ``index.html`` is prerendered from the upcoming deadlines (see ``prerender``);
+- ``assets.json`` maps each asset's logical name to its served path, sha256 and size, and
+  ``status.json`` carries the manifest's hash, so a monitor can tell which build is live.
+
+Files that no longer exist are removed; fingerprinted files of the previous build are kept
+for one more build, so pages loaded just before a deploy still find their scripts. A run in
+which nothing changed writes only ``assets.json``, if that.
+
+    python3 -m aideadlines.build_site html --status ok
+"""
+
+import argparse
+import fnmatch
+import gzip
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .codec import JSONDecodeError, json_dumps, json_load, write_if_changed
+from .log_config import logger
+from .prerender import prerender
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+PACKAGE_DIR = os.path.dirname(__file__)
+OUTPUT_FOLDER = "html"
+ASSET_MANIFEST = "assets.json"
+STATUS_FILE = "status.json"
+MANIFEST_VERSION = 1
+
+# (source folder relative to the package, file patterns, served folder, recursive)
+SOURCES = (
+    ("", ("*.html", "*.js", "*.css", "*.ico", "*.svg", "*.png", "site.webmanifest", "robots.txt", "sitemap.xml"), "", False),
+    ("fonts", ("*.woff2",), "fonts", False),
+    ("data", ("*.json",), "data", False),
+    ("data/archive", ("*.json",), "data/archive", True),
+    ("data/series", ("*.json",), "data/series", True),
+    ("data/ics", ("*.ics",), "data/ics", True),
+)
+# Written into the output folder by other steps (ansi_to_html.py); only compressed here.
+IN_PLACE = ("status.html",)
+FINGERPRINTED = ("fonts/*.woff2", "*.css", "*.js")  # in this order: stylesheets reference fonts
+REWRITTEN = (".css", ".html")  # files whose references to fingerprinted assets are rewritten
+COMPRESSED = (".json", ".html", ".js", ".css", ".ttf", ".woff2", ".xml", ".svg", ".jpg", ".webp", ".ics")
+
+
+def _sha256(content):
+    return hashlib.sha256(content).hexdigest()
+
+
+def fingerprint(name, sha256):
+    """``fonts/a.woff2`` -> ``fonts/a.<first 12 hex digits of sha256>.woff2``."""
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{sha256[:12]}{ext}"
+
+
+def variants(path):
+    """The compressed variants ``path`` should have."""
+    if not path.endswith(COMPRESSED):
+        return []
+    return [path + ".gz"] + ([path + ".br"] if brotli is not None else [])
+
+
+def _compress(path):
+    with open(path, "rb") as f:
+        content = f.read()
+    write_if_changed(path + ".gz", gzip.compress(content, 9, mtime=0))  # mtime=0: same input, same bytes
+    if brotli is not None:
+        write_if_changed(path + ".br", brotli.compress(content))
+
+
+def collect(source=PACKAGE_DIR):
+    """``{logical name: absolute source path}`` of every asset, in ``SOURCES`` order."""
+    assets = {}
+    for folder, patterns, served, recursive in SOURCES:
+        root = os.path.join(source, folder)
+        if not os.path.isdir(root):
+            continue
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            if not recursive:
+                dirnames.clear()
+            for name in sorted(filenames):
+                if not name.startswith(".") and any(fnmatch.fnmatch(name, pattern) for pattern in patterns):
+                    rel = os.path.relpath(os.path.join(dirpath, name), root)
+                    assets[os.path.join(served, rel).replace(os.sep, "/")] = os.path.join(dirpath, name)
+    return assets
+
+
+def _read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _index_page(template, source):
+    """``index.html`` prerendered from the published upcoming deadlines, or as is without them."""
+    try:
+        with open(os.path.join(source, "data", "conferences.json"), "rb") as f:
+            records = json_load(f)
+        if records and "deadlineMs" not in records[0]:
+            raise ValueError("the data predates the precomputed record fields")
+        return prerender(template.decode(), records, round(time.time() * 1000)).encode()
+    except (OSError, JSONDecodeError, ValueError) as e:
+        logger.warning(f"serving index.html without prerendered cards: {e}")
+        return template
+
+
+def render(source=PACKAGE_DIR):
+    """``{logical name: (served path, content)}`` of every asset, references rewritten."""
+    contents = {name: _read(path) for name, path in collect(source).items()}
+    if "index.html" in contents:
+        contents["index.html"] = _index_page(contents["index.html"], source)
+
+    served = {}
+    for pattern in FINGERPRINTED:
+        for name in [name for name in contents if fnmatch.fnmatch(name, pattern) and name not in served]:
+            if name.endswith(REWRITTEN):
+                contents[name] = _rewrite(contents[name], served)
+            served[name] = fingerprint(name, _sha256(contents[name]))
+    for name in contents:
+        if name not in served and name.endswith(REWRITTEN):
+            contents[name] = _rewrite(contents[name], served)
+    return {name: (served.get(name, name), content) for name, content in contents.items()}
+
+
+def _rewrite(content, served):
+    """Point quoted references to fingerprinted assets (``"fonts/a.woff2"``) at their served path."""
+    for name, path in served.items():
+        content = content.replace(f'"{name}"'.encode(), f'"{path}"'.encode())
+    return content
+
+
+def load_manifest(output):
+    try:
+        with open(os.path.join(output, ASSET_MANIFEST), "rb") as f:
+            manifest = json_load(f)
+    except (OSError, JSONDecodeError, ValueError):
+        return {"assets": {}, "retired": []}
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        return {"assets": {}, "retired": []}
+    return manifest
+
+
+def _remove(output, path):
+    for name in [path, *variants(path)]:
+        try:
+            os.remove(os.path.join(output, name))
+        except FileNotFoundError:
+            pass
+
+
+def build(output=OUTPUT_FOLDER, source=PACKAGE_DIR, workers=None):
+    """Bring ``output`` up to date with ``source``; returns the asset manifest."""
+    start = time.perf_counter()
+    previous = load_manifest(output)
+    old = previous["assets"]
+    assets, changed, compress = {}, [], []
+    for name, (path, content) in render(source).items():
+        entry = {"path": path, "sha256": _sha256(content), "size": len(content)}
+        assets[name] = entry
+        target = os.path.join(output, path)
+        if old.get(name) != entry or not os.path.exists(target):
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            write_if_changed(target, content)
+            changed.append(path)
+            compress.extend([path] if variants(path) else [])
+        elif not all(os.path.exists(os.path.join(output, variant)) for variant in variants(path)):
+            compress.append(path)
+    for name in IN_PLACE:
+        path = os.path.join(output, name)
+        if os.path.exists(path):
+            sha256 = _sha256(_read(path))
+            if old.get(name, {}).get("sha256") != sha256 or not all(map(os.path.exists, variants(path))):
+                compress.append(name)
+            assets[name] = {"path": name, "sha256": sha256, "size": os.path.getsize(path)}
+
+    current = {entry["path"] for entry in assets.values()}
+    retired = sorted({entry["path"] for entry in old.values()} - current)
+    for path in retired:
+        if not any(fnmatch.fnmatch(path, fingerprint(pattern, "?" * 12)) for pattern in FINGERPRINTED):
+            _remove(output, path)  # a renamed or deleted file: gone now
+    for path in set(previous.get("retired", ())) - current:
+        _remove(output, path)  # fingerprinted, and not used for a whole build
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(lambda path: _compress(os.path.join(output, path)), compress))
+
+    manifest = {"version": MANIFEST_VERSION, "assets": assets,
+                "retired": [path for path in retired if os.path.exists(os.path.join(output, path))]}
+    write_if_changed(os.path.join(output, ASSET_MANIFEST), json_dumps(manifest))
+    logger.info(f"built {len(assets)} assets in {time.perf_counter() - start:.2f}s: {len(changed)} written, "
+                f"{len(compress)} compressed{'' if brotli is not None else ' (gzip only, brotli is not installed)'}")
+    return manifest
+
+
+def write_status(output, ok, now=None):
+    """``status.json`` for the uptime monitor: when the site was built, whether the pipeline
+    passed, and which asset manifest is live."""
+    with open(os.path.join(output, ASSET_MANIFEST), "rb") as f:
+        assets = _sha256(f.read())
+    status = {"updated": int(now if now is not None else time.time()), "ok": ok, "assets": assets[:12]}
+    path = os.path.join(output, STATUS_FILE)
+    write_if_changed(path, json_dumps(status))
+    _compress(path)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("output", nargs="?", default=OUTPUT_FOLDER, help="The folder the site is served from")
+    parser.add_argument("--status", choices=("ok", "failed"), help="Also write status.json with this pipeline result")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    build(args.output)
+    if args.status:
+        write_status(args.output, args.status == "ok")
+
+
+if __name__ == "__main__":
+    main()
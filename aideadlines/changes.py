@@ -0,0 +1,106 @@
+"""The ``changes.json`` delta feed between publishes.
+
+Consumers that want to know what changed used to poll and diff the whole
+``conferences.json``. ``data_to_json`` now compares the records it is about to publish
+with the previously published ones (upcoming and archive together, by record id) and appends
+the difference to a feed. It finds the changed records by their content hash, which the
+publish state keeps for every record, and reads back only the old versions of those:
+
+    {
+      "version": 1,
+      "sequence": 42,
+      "deltas": [
+        {"sequence": 42, "published": "2025-03-01T06:00:00Z",
+         "added": {"abc2025-1": {...record...}},
+         "removed": ["old2024-1"],
+         "modified": {"xyz2025-1": {"deadline": {"from": "...", "to": "..."}, "note": {"to": "..."}}}},
+        ...
+      ]
+    }
+
+``sequence`` increases by one with every publish that changes something; publishes that
+change nothing leave the feed as it is. A modified field has ``from`` and/or ``to``; a side
+is missing when the field didn't exist there. Only the last ``CHANGES_HISTORY`` deltas are
+kept. A client notes the feed's ``sequence`` when it downloads the full data. Later, at
+sequence N, it applies every delta after N in order (``apply_delta``); if N is older than
+the oldest kept delta (``catch_up`` returns None), it downloads everything again.
+"""
+
+from .codec import JSONDecodeError, json_dumps, json_load, write_if_changed
+
+CHANGES_VERSION = 1
+CHANGES_HISTORY = 100
+_MISSING = object()
+
+
+def diff_records(old, new):
+    """The delta (without sequence) turning ``{id: record}`` ``old`` into ``new``."""
+    added = {record_id: record for record_id, record in new.items() if record_id not in old}
+    removed = [record_id for record_id in old if record_id not in new]
+    modified = {}
+    for record_id, record in new.items():
+        before = old.get(record_id)
+        if before is None or before == record:
+            continue
+        fields = {}
+        for field in sorted(before.keys() | record.keys()):
+            if before.get(field, _MISSING) != record.get(field, _MISSING):
+                fields[field] = {side: value[field] for side, value in (("from", before), ("to", record)) if field in value}
+        modified[record_id] = fields
+    return {"added": added, "removed": removed, "modified": modified}
+
+
+def is_empty(delta):
+    return not (delta["added"] or delta["removed"] or delta["modified"])
+
+
+def apply_delta(records, delta):
+    """Apply ``delta`` to ``{id: record}`` in place (what a client does to catch up)."""
+    for record_id in delta["removed"]:
+        records.pop(record_id, None)
+    records.update(delta["added"])
+    for record_id, fields in delta["modified"].items():
+        record = records[record_id]
+        for field, change in fields.items():
+            if "to" in change:
+                record[field] = change["to"]
+            else:
+                record.pop(field, None)
+    return records
+
+
+def load_feed(path):
+    """The feed at ``path``; an empty one (sequence 0) if there is none or it is unreadable."""
+    try:
+        with open(path, "rb") as f:
+            feed = json_load(f)
+    except (OSError, JSONDecodeError, ValueError):
+        feed = None
+    if not isinstance(feed, dict) or feed.get("version") != CHANGES_VERSION:
+        return {"version": CHANGES_VERSION, "sequence": 0, "deltas": []}
+    return feed
+
+
+def append_delta(feed, delta, published, history=CHANGES_HISTORY):
+    """The feed with ``delta`` appended as the next sequence number (unchanged if it's empty)."""
+    if is_empty(delta):
+        return feed
+    sequence = feed["sequence"] + 1
+    deltas = [*feed["deltas"], {"sequence": sequence, "published": published, **delta}][-history:]
+    return {"version": CHANGES_VERSION, "sequence": sequence, "deltas": deltas}
+
+
+def catch_up(feed, since):
+    """The deltas a client at sequence ``since`` has to apply, or None if it's too far behind."""
+    if since >= feed["sequence"]:
+        return []
+    if not feed["deltas"] or feed["deltas"][0]["sequence"] > since + 1:
+        return None
+    return [delta for delta in feed["deltas"] if delta["sequence"] > since]
+
+
+def publish(path, delta, published, history=CHANGES_HISTORY):
+    """Append ``delta`` to the feed at ``path``; returns the feed's sequence."""
+    feed = append_delta(load_feed(path), delta, published, history)
+    write_if_changed(path, json_dumps(feed))
+    return feed["sequence"]
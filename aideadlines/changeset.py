@@ -0,0 +1,110 @@
+"""Which conference files a run has to look at.
+
+Most commits touch one or two files in ``conferences/``, so ``validate`` and ``data_to_json``
+can take a change set instead of processing the whole corpus: either explicit paths
+(``--changed conferences/cvpr.yaml``) or everything git reports as changed since a revision
+(``--since REV``; a bare ``--since`` means the commit of the last publish, recorded in
+``data/.publish_state.json``).
+
+A change set is a set of conference file names (``{"cvpr.yaml"}``); ``None`` means "all of
+them". Changes to the pipeline's own code can change every output, so they, a missing
+publish record, or a git failure all fall back to ``None``.
+"""
+
+import os
+import subprocess
+
+from .codec import json_dumps, json_loads, write_if_changed
+from .log_config import logger
+
+THIS_FOLDER = os.path.dirname(__file__)
+REPO_FOLDER = os.path.abspath(os.path.join(THIS_FOLDER, os.pardir))
+PUBLISH_STATE_FILE = os.path.join(THIS_FOLDER, "data", ".publish_state.json")
+LAST_PUBLISHED = "last-published"
+
+
+def add_changeset_args(parser):
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--changed", nargs="+", metavar="PATH", help="Only process these conference files")
+    group.add_argument(
+        "--since",
+        nargs="?",
+        const=LAST_PUBLISHED,
+        metavar="REV",
+        help="Only process conference files changed since REV (default: the last published commit)",
+    )
+
+
+def conference_files(paths):
+    """The conference file names among ``paths`` ('conferences/cvpr.yaml' or just 'cvpr.yaml')."""
+    names = set()
+    for path in paths:
+        folder, name = os.path.split(os.path.normpath(path))
+        if name.endswith((".yaml", ".yml")) and (not folder or os.path.basename(folder) == "conferences"):
+            names.add(name)
+    return names
+
+
+def _git(*args):
+    return subprocess.run(["git", *args], cwd=REPO_FOLDER, capture_output=True, text=True, check=True).stdout
+
+
+def git_changed_files(since):
+    """Conference files changed (committed or not, or untracked) since ``since``; None for all."""
+    try:
+        changed = _git("diff", "--name-only", "-z", since, "--").split("\0")
+        changed += _git("ls-files", "-z", "--others", "--exclude-standard", "--", "conferences").split("\0")
+    except (OSError, subprocess.CalledProcessError) as e:
+        logger.warning(f"could not diff against {since}, processing everything: {e}")
+        return None
+    code = [path for path in changed if path.startswith("aideadlines/") and path.endswith(".py")]
+    if code:
+        logger.info(f"pipeline code changed since {since} ({code[0]}, ...), processing everything")
+        return None
+    return conference_files(changed)
+
+
+def _publish_state():
+    try:
+        with open(PUBLISH_STATE_FILE, "rb") as f:
+            return json_loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+
+def last_published_commit():
+    return _publish_state().get("commit")
+
+
+def published_record_hashes():
+    """``{record id: [sha256, file, revised, sequence]}`` of the last publish, or None if it
+    wasn't recorded (see ``data_to_json.Exporter``)."""
+    return _publish_state().get("records")
+
+
+def record_published_commit(records=None):
+    """Remember HEAD as the commit the published data was built from, and ``records``
+    (``{record id: [sha256, file, revised, sequence]}``) as what was published."""
+    try:
+        commit = _git("rev-parse", "HEAD").strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    write_if_changed(PUBLISH_STATE_FILE, json_dumps({"commit": commit, "records": records}))
+
+
+def resolve_changeset(args):
+    """The change set the command line asks for: a set of file names, or None for everything."""
+    if args.changed:
+        return conference_files(args.changed)
+    if args.since is None:
+        return None
+    since = args.since
+    if since == LAST_PUBLISHED:
+        since = last_published_commit()
+        if since is None:
+            logger.info("nothing published yet, processing everything")
+            return None
+    files = git_changed_files(since)
+    if files is not None:
+        logger.info(f"{len(files)} conference file(s) changed since {since[:12]}: {sorted(files)}")
+    return files
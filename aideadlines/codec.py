@@ -0,0 +1,117 @@
+"""The one place YAML and JSON are read and written.
+
+Every module used to call ``yaml.safe_load`` / ``yaml.safe_dump`` (PyYAML's pure-Python
+scanner and emitter) and the stdlib ``json`` module directly. This picks the fastest backend
+available once, at import time:
+
+- YAML: libyaml's ``CSafeLoader`` / ``CSafeDumper`` when PyYAML was built with it, else the
+  pure-Python ``SafeLoader`` / ``SafeDumper``. Both load identical data; both dump with
+  sorted keys, block style and the same ``&id001`` anchor numbering. The only difference is
+  the emitter: libyaml wraps long double-quoted strings without the ``\\`` continuation.
+- JSON: ``orjson`` when it is installed, else ``json``. Either way the output is compact,
+  key-sorted UTF-8, and the two backends write the same bytes.
+
+``write_if_changed`` writes a file atomically, and only when its content hash changed.
+
+``python -m aideadlines.codec`` benchmarks both backends on ``conferences/*.yaml``.
+"""
+
+import hashlib
+import json
+import os
+
+import yaml
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib
+    orjson = None
+
+YAMLError = yaml.YAMLError
+JSONDecodeError = json.JSONDecodeError
+
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def yaml_load(stream):
+    """Parse YAML from a string, bytes or file object."""
+    return yaml.load(stream, Loader=YAML_LOADER)
+
+
+def yaml_dump(data, stream=None, dumper=None):
+    """Serialize ``data`` as canonical block-style YAML; returns a str when ``stream`` is None."""
+    return yaml.dump(data, stream, Dumper=dumper or YAML_DUMPER, sort_keys=True, default_flow_style=False)
+
+
+def json_loads(data):
+    """Parse JSON from a str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(data):
+    """Serialize ``data`` as compact, key-sorted UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def json_dump(data, f):
+    """Write ``json_dumps(data)`` to the binary file ``f``."""
+    f.write(json_dumps(data))
+
+
+def json_load(f):
+    return json_loads(f.read())
+
+
+def sha256_of_file(path):
+    """The sha256 hex digest of the file at ``path``, or None if there is none."""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def write_if_changed(path, content):
+    """Write ``content`` (bytes) to ``path`` via a temp file and rename, unless the file
+    already has the same sha256. Returns whether the file was written."""
+    if sha256_of_file(path) == hashlib.sha256(content).hexdigest():
+        return False
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+    return True
+
+
+if __name__ == "__main__":
+    import glob
+    import os
+    import timeit
+
+    from .log_config import logger
+
+    folder = os.path.join(os.path.dirname(__file__), os.pardir, "conferences")
+    texts = [open(path).read() for path in sorted(glob.glob(os.path.join(folder, "*.yaml")))]
+    datas = [yaml.load(text, Loader=yaml.SafeLoader) for text in texts]
+
+    def per_file(fn):
+        return min(timeit.repeat(fn, number=1, repeat=5)) / len(texts) * 1e3
+
+    cases = [
+        ("yaml load", yaml.SafeLoader, YAML_LOADER, lambda loader: [yaml.load(t, Loader=loader) for t in texts]),
+        ("yaml dump", yaml.SafeDumper, YAML_DUMPER, lambda dumper: [yaml_dump(d, dumper=dumper) for d in datas]),
+    ]
+    for label, slow, fast, run in cases:
+        before, after = per_file(lambda: run(slow)), per_file(lambda: run(fast))
+        logger.info(f"{label}: {before:.2f} ms/file ({slow.__name__}) -> {after:.2f} ms/file ({fast.__name__}), "
+                    f"{before / after:.1f}x")
+    records = [json.loads(json.dumps(d, default=str)) for d in datas]
+    before = per_file(lambda: [json.dumps(r, sort_keys=True, separators=(",", ":"), ensure_ascii=False) for r in records])
+    after = per_file(lambda: [json_dumps(r) for r in records])
+    logger.info(f"json dump: {before:.3f} ms/file (json) -> {after:.3f} ms/file ({'orjson' if orjson else 'json'}), "
+                f"{before / after:.1f}x")
@@ -0,0 +1,183 @@
+"""A compact, normalized encoding of the deadline records.
+
+``data_to_json`` explodes every conference into one record per deadline, so each record
+repeats its conference's title, website, tags, timezone, rating and h5Index, and the same tag
+lists and timezones recur thousands of times across the archive. The compact form is two
+column-oriented tables: conferences, each stored once, and deadlines referencing them.
+
+    {
+      "version": 1,
+      "conferences": {"count": 2, "columns": {
+        "id": ["cvpr2025", "iccv2025"],
+        "tags": {"dict": [["CV"], ["CV", "ML"]], "index": [0, 1]},
+        "h5Index": [null, 228],
+        ...}},
+      "deadlines": {"count": 3, "columns": {
+        "conference": [0, 0, 1],
+        "number": [1, 2, 1],
+        "deadline": [1731542399, 1742860799, 1741046399],
+        ...}}
+    }
+
+- A column is either a plain list, with null where a row doesn't have the field, or, when
+  its values repeat enough to pay off, dictionary-encoded: each distinct value stored once
+  in ``dict``, and ``index`` pointing into it (null where the field is absent).
+- In the conference table ``id`` is the conference id ('cvpr2025'). In the deadline table
+  ``conference`` is a row of the conference table, and the record's id is
+  ``<conference id>-<number>``; ``deadline`` and ``abstractDeadline`` are epoch seconds when
+  they were 'YYYY-MM-DDTHH:MM:SSZ' (verbatim strings otherwise).
+- A record whose conference fields differ from its conference's previous row gets a row of
+  its own. ``data_to_json`` never builds such records, but the encoding stays lossless.
+
+``decode`` (and ``decodeCompact`` in scripts.js) turn the document back into exactly the
+records it was built from. ``python -m aideadlines.compact`` compares size and parse time
+against the record format on the current data, for the upcoming and the past deadlines
+separately. The gzipped saving only outweighs the decoding for the archive (about 16%
+there, under 10% for the much smaller upcoming file), so the frontend reads the compact
+encoding for the archive only.
+"""
+
+from datetime import datetime, timezone
+
+from .codec import json_dumps
+
+COMPACT_VERSION = 1
+DEADLINE_FIELDS = ("deadline", "abstractDeadline", "note", "deadlineMs", "abstractDeadlineMs")
+TIME_FIELDS = frozenset(("deadline", "abstractDeadline"))
+_ISO_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+_ABSENT = object()  # a row without the field, as opposed to one whose value is None
+
+
+def _to_epoch(value):
+    """Epoch seconds for a 'YYYY-MM-DDTHH:MM:SSZ' string that round-trips exactly; else the value."""
+    if isinstance(value, str) and len(value) == 20:
+        try:
+            epoch = int(datetime.strptime(value, _ISO_FORMAT).replace(tzinfo=timezone.utc).timestamp())
+        except ValueError:
+            return value
+        if _from_epoch(epoch) == value:
+            return epoch
+    return value
+
+
+def _from_epoch(value):
+    if isinstance(value, int) and not isinstance(value, bool):
+        return datetime.fromtimestamp(value, timezone.utc).strftime(_ISO_FORMAT)
+    return value
+
+
+def _column(values):
+    """Encode one column (``_ABSENT`` marks rows without the field); see the module docstring."""
+    present = [value for value in values if value is not _ABSENT]
+    distinct = {json_dumps(value): value for value in present}
+    if len(distinct) * 2 > len(present) and None not in present:
+        return [None if value is _ABSENT else value for value in values]
+    index = {key: i for i, key in enumerate(distinct)}
+    return {
+        "dict": list(distinct.values()),
+        "index": [None if value is _ABSENT else index[json_dumps(value)] for value in values],
+    }
+
+
+def _decode_column(column):
+    if isinstance(column, list):
+        return [_ABSENT if value is None else value for value in column]
+    return [_ABSENT if i is None else column["dict"][i] for i in column["index"]]
+
+
+def _table(rows, fields):
+    return {"count": len(rows), "columns": {field: _column([row.get(field, _ABSENT) for row in rows]) for field in fields}}
+
+
+def _rows(table):
+    columns = {field: _decode_column(column) for field, column in table["columns"].items()}
+    rows = [{} for _ in range(table["count"])]
+    for field, column in columns.items():
+        for row, value in zip(rows, column):
+            if value is not _ABSENT:
+                row[field] = value
+    return rows
+
+
+class CompactEncoder:
+    """Collects records (in order) and encodes them as one compact document."""
+
+    def __init__(self):
+        self.conferences = []  # the record fields shared by a conference's deadlines
+        self._conference_index = {}  # conference id -> index of its latest row
+        self.deadlines = []
+
+    def add(self, record):
+        conf_id, number = record["id"].rsplit("-", 1)
+        shared = {key: value for key, value in record.items() if key not in DEADLINE_FIELDS}
+        shared["id"] = conf_id
+        index = self._conference_index.get(conf_id)
+        if index is None or self.conferences[index] != shared:
+            index = self._conference_index[conf_id] = len(self.conferences)
+            self.conferences.append(shared)
+        deadline = {"conference": index, "number": int(number)}
+        for field in DEADLINE_FIELDS:
+            if field in record:
+                deadline[field] = _to_epoch(record[field]) if field in TIME_FIELDS else record[field]
+        self.deadlines.append(deadline)
+
+    def encode(self):
+        fields = sorted({key for conference in self.conferences for key in conference})
+        return {
+            "version": COMPACT_VERSION,
+            "conferences": _table(self.conferences, fields),
+            "deadlines": _table(self.deadlines, ("conference", "number", *DEADLINE_FIELDS)),
+        }
+
+
+def encode(records):
+    """The compact document for an iterable of records."""
+    encoder = CompactEncoder()
+    for record in records:
+        encoder.add(record)
+    return encoder.encode()
+
+
+def decode(document):
+    """The records a compact document was built from."""
+    if document.get("version") != COMPACT_VERSION:
+        raise ValueError(f"unsupported compact format version {document.get('version')!r}")
+    conferences = _rows(document["conferences"])
+    records = []
+    for deadline in _rows(document["deadlines"]):
+        conference = conferences[deadline.pop("conference")]
+        number = deadline.pop("number")
+        record = {**conference, **{field: _from_epoch(value) if field in TIME_FIELDS else value
+                                   for field, value in deadline.items()}}
+        record["id"] = f"{conference['id']}-{number}"
+        records.append(record)
+    return records
+
+
+if __name__ == "__main__":
+    import gzip
+    import timeit
+
+    from .codec import json_loads
+    from .data_to_json import iter_records
+    from .log_config import logger
+    from .store import load_store
+
+    now = datetime.now(timezone.utc).timestamp()
+    pairs = list(iter_records(load_store().conferences))
+
+    def parse_ms(fn):
+        return min(timeit.repeat(fn, number=10, repeat=5)) / 10 * 1e3
+
+    for name, records in (("upcoming", [record for epoch, record in pairs if epoch > now]),
+                          ("archive", [record for epoch, record in pairs if epoch <= now])):
+        plain = json_dumps(records)
+        compact = json_dumps(encode(records))
+        assert json_dumps(decode(json_loads(compact))) == plain
+        plain_gz, compact_gz = len(gzip.compress(plain, 9)), len(gzip.compress(compact, 9))
+        logger.info(f"{name}, {len(records)} records: {len(plain)} -> {len(compact)} bytes "
+                    f"({len(compact) / len(plain):.0%}), gzipped {plain_gz} -> {compact_gz} bytes "
+                    f"({compact_gz / plain_gz:.0%})")
+        logger.info(f"{name}, json parse: {parse_ms(lambda: json_loads(plain)):.2f} ms (records) -> "
+                    f"{parse_ms(lambda: json_loads(compact)):.2f} ms (compact), "
+                    f"{parse_ms(lambda: decode(json_loads(compact))):.2f} ms including the Python decode")
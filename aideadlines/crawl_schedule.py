@@ -0,0 +1,139 @@
+"""Which official-website instances an online run fetches, most valuable first.
+
+Every online run used to fetch every year of every official website, from last year to
+two years ahead. Most of those pages haven't changed in months, and a past conference whose
+deadlines are settled won't change again. ``plan`` scores each instance (``cvpr2026``) of the
+website-scraped groups instead:
+
+- deadline proximity: a deadline coming up within weeks scores high, one months away low;
+- ``isApproximateDeadline``: an estimated instance, or one we haven't seen yet, is waiting
+  for real data;
+- source volatility: how often that website's pages changed when we fetched them again;
+- time since last change: a page that changed recently tends to change again (dates get
+  refined, rounds get added).
+
+An instance is due once its last fetch is older than an interval that shrinks as its score
+grows (``BASE_INTERVAL / score``, at most ``MAX_INTERVAL``). A settled past instance (not
+approximate, with every deadline and the conference itself over) is due only every
+``SETTLED_INTERVAL``. Due instances are fetched in order of score times overdueness, up to
+the run's fetch budget; the rest wait for a later run. What each fetch found is recorded in
+``data/.crawl_state.json``.
+
+A failed fetch is recorded too: it counts as a poll, and every failure in a row doubles the
+instance's interval (up to ``SETTLED_INTERVAL``), so a broken page doesn't keep taking budget
+from working ones. The next successful fetch resets the count.
+"""
+
+import hashlib
+import math
+import os
+import time
+from datetime import datetime, timezone
+
+from .codec import json_dumps, json_loads, write_if_changed, yaml_dump
+from .log_config import logger
+from .utils import deadline_epoch
+
+THIS_FOLDER = os.path.dirname(__file__)
+CRAWL_STATE_FILE = os.path.join(THIS_FOLDER, "data", ".crawl_state.json")
+CRAWL_STATE_VERSION = 1
+
+DAY = 86400
+BASE_INTERVAL = DAY  # between fetches of an instance with a score of 1
+MAX_INTERVAL = 7 * DAY
+SETTLED_INTERVAL = 30 * DAY
+PROXIMITY_DAYS = 30  # a deadline this far away scores half of one that is due now
+CHANGE_DAYS = 14  # a page that changed this long ago scores half of one that just changed
+MAX_OVERDUE = 10  # an instance never fetched counts as this many intervals overdue
+DEFAULT_BUDGET = 12  # fetches per run
+
+
+def load_state():
+    """``{"instances": {id: {...}}, "sites": {group: {...}}}`` as of the last run; empty if unusable."""
+    try:
+        with open(CRAWL_STATE_FILE, "rb") as f:
+            stored = json_loads(f.read())
+    except (OSError, ValueError):
+        stored = {}
+    if stored.get("version") != CRAWL_STATE_VERSION:
+        return {"instances": {}, "sites": {}}
+    return {"instances": stored["instances"], "sites": stored["sites"]}
+
+
+def save_state(state):
+    write_if_changed(CRAWL_STATE_FILE, json_dumps({"version": CRAWL_STATE_VERSION, **state}))
+
+
+def settled(conf, now):
+    """Whether ``conf`` is a real (not estimated) instance whose deadlines and dates are all past."""
+    if conf is None or conf.get("isApproximateDeadline", True):
+        return False
+    deadlines = [deadline_epoch(entry.get("deadline")) for entry in conf.get("timeline", [])]
+    if not deadlines or any(epoch is None or epoch >= now for epoch in deadlines):
+        return False
+    last_day = conf.get("conferenceEndDate") or conf.get("conferenceStartDate")
+    today = datetime.fromtimestamp(now, timezone.utc).strftime("%Y-%m-%d")
+    return last_day is None or str(last_day) < today
+
+
+def score(conf, entry, site, now):
+    """How much fetching an instance now is worth: four terms, each between 0 and 1.
+
+    ``conf`` is the instance's record (None if we don't have one), ``entry`` its crawl state
+    and ``site`` its website's.
+    """
+    if conf is None:
+        proximity = 0.5  # not announced yet, as far as we know
+    else:
+        deadlines = (deadline_epoch(item.get("deadline")) for item in conf.get("timeline", []))
+        upcoming = [epoch for epoch in deadlines if epoch is not None and epoch >= now]
+        proximity = 1 / (1 + (min(upcoming) - now) / DAY / PROXIMITY_DAYS) if upcoming else 0.0
+    approximate = 1.0 if conf is None or conf.get("isApproximateDeadline", False) else 0.0
+    volatility = (site.get("changes", 0) + 1) / (site.get("refetches", 0) + 2)
+    changed = entry.get("changed") if entry else None
+    recency = 1.0 if changed is None else 1 / (1 + (now - changed) / DAY / CHANGE_DAYS)
+    return proximity + approximate + volatility + recency
+
+
+def plan(candidates, conferences, state, now=None, budget=DEFAULT_BUDGET):
+    """The due ``(group, instance id)`` pairs among ``candidates``, highest priority first, at
+    most ``budget`` of them (``None``: no limit)."""
+    now = time.time() if now is None else now
+    due = []
+    for group, instance in candidates:
+        conf, entry = conferences.get(instance), state["instances"].get(instance)
+        value = score(conf, entry, state["sites"].get(group, {}), now)
+        interval = SETTLED_INTERVAL if settled(conf, now) else min(MAX_INTERVAL, BASE_INTERVAL / value)
+        if entry is not None and entry.get("failures"):
+            interval = min(SETTLED_INTERVAL, interval * 2 ** entry["failures"])
+        elapsed = math.inf if entry is None else now - entry["polled"]
+        if elapsed >= interval:
+            due.append((value * min(elapsed / interval, MAX_OVERDUE), group, instance))
+    due.sort(key=lambda item: -item[0])
+    chosen = due if budget is None else due[:budget]
+    logger.info(f"crawl plan: fetching {len(chosen)} of {len(due)} due instances ({len(candidates)} tracked)"
+                + "".join(f", {instance} ({priority:.2f})" for priority, _, instance in chosen))
+    return [(group, instance) for _, group, instance in chosen]
+
+
+def record(state, group, instance, data, now=None):
+    """Note a fetch of ``instance`` that found ``data`` (``{}``: nothing, None: the fetch failed)."""
+    now = time.time() if now is None else now
+    entry = state["instances"].get(instance)
+    if data is None:
+        if entry is None:
+            state["instances"][instance] = {"polled": now, "changed": None, "sha256": None, "failures": 1}
+        else:
+            entry.update(polled=now, failures=entry.get("failures", 0) + 1)
+        return
+    sha256 = hashlib.sha256(yaml_dump(data).encode()).hexdigest()
+    site = state["sites"].setdefault(group, {"refetches": 0, "changes": 0})
+    if entry is None or entry["sha256"] is None:
+        state["instances"][instance] = {"polled": now, "changed": now, "sha256": sha256}
+        return
+    entry.pop("failures", None)
+    site["refetches"] += 1
+    if entry["sha256"] != sha256:
+        site["changes"] += 1
+        entry.update(changed=now, sha256=sha256)
+    entry["polled"] = now
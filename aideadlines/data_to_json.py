@@ -1,64 +1,490 @@
-import json
+"""Publish the conference data as the JSON files the website reads.
+
+A full build explodes every conference's timeline into one record per deadline and splits
+them into ``conferences.json`` (upcoming) and ``conferences_archive.json`` (past). Records are
+streamed: each is a shallow merge of the conference and one timeline entry, its deadline is
+parsed once (stored ISO deadlines directly, without the date parser), and it is written to
+its file as soon as it is built, so neither output is ever held in memory as a whole.
+
+With a change set (``--changed`` / ``--since``, see ``changeset``), only the records of
+conferences from changed files are rebuilt and patched into the published files. Everything
+else is kept as published, except that upcoming deadlines that have passed since move to the
+archive, so the result is the same as a full build. ``--self-check`` builds both ways and
+fails if they differ.
+
+Besides the two monolithic files, the archive is sharded by year, with a ``manifest.json``
+describing every file (see ``Exporter``). Each monolithic
+file gets a prebuilt search index (see ``search_index``), and ``--compact`` adds both in the
+compact encoding of ``compact``. Every publish that changes records also appends a delta to
+``changes.json`` (see ``changes``). The publish state keeps each record's content hash, so the
+delta only compares the records whose hash changed. ``series/`` holds a static per-series API (see
+``series_api``) and ``ics/`` iCalendar feeds (see ``ics``).
+
+Records carry precomputed render fields (epoch milliseconds, rating ordinal, importance; see
+``precompute``) so the client only compares numbers. ``RECORD_SCHEMA`` versions them.
+"""
+
+import argparse
+import hashlib
+import io
 import os
-from copy import deepcopy
+import re
+import sys
 from datetime import datetime
+from itertools import chain
 
-import dateparser
 import pytz
-import yaml
 
+from . import changes, parse_cache
+from .changeset import add_changeset_args, published_record_hashes, record_published_commit, resolve_changeset
+from .codec import json_dumps, json_load, write_if_changed
+from .compact import CompactEncoder
+from .ics import ICS_FOLDER, CalendarFeeds
+from .search_index import SearchIndex
+from .series_api import SERIES_FOLDER, SERIES_INDEX, SeriesTree
+from .dates import log_stats
 from .log_config import logger
-from .utils import normalize_timezone_for_js
+from .store import load_store
+from .timezones import iana_name
+from .utils import deadline_epoch
 
 THIS_FOLDER = os.path.dirname(__file__)
-CONFERENCE_FOLDER = os.path.join(THIS_FOLDER, os.pardir, "conferences")
 DATA_FOLDER = os.path.join(THIS_FOLDER, "data")
+FUTURE_FILE = "conferences.json"
+ARCHIVE_FILE = "conferences_archive.json"
+MANIFEST_FILE = "manifest.json"
+CHANGES_FILE = "changes.json"
+MANIFEST_VERSION = 2
+ARCHIVE_SHARDS = "archive"
+UPCOMING_SHARDS = "upcoming"  # per-tag shards, no longer produced; removed on commit
+COMPACT_FILES = {FUTURE_FILE: "conferences.compact.json", ARCHIVE_FILE: "conferences_archive.compact.json"}
+INDEX_FILES = {FUTURE_FILE: "conferences.index.json", ARCHIVE_FILE: "conferences_archive.index.json"}
 
+_ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
-def load_conferences():
-    conferences = {}
-    for conf_file in os.listdir(CONFERENCE_FOLDER):
-        with open(os.path.join(CONFERENCE_FOLDER, conf_file), "r") as f:
-            file_confs = yaml.safe_load(f)
-        conferences = {**file_confs, **conferences}
-    return conferences
+# Version of the record fields; 2 added the precomputed fields of ``precompute``.
+RECORD_SCHEMA = 2
+RATING_ORDINALS = {"A*": 5, "A": 4, "B": 3, "C": 2, "D": 1}  # ratingOrder in scripts.js
+RATING_WEIGHTS = {"A*": 8, "A": 5, "B": 3, "C": 1, "D": 0.5}  # RATING_WEIGHT in scripts.js
 
 
-def split_future_past(conferences):
-    """Explode each conference's timeline into one record per deadline, partitioned by now."""
-    future_conf, past_conf = {}, {}
-    now = datetime.now().astimezone(pytz.UTC)
+def _day_end_epoch(date):
+    """Epoch seconds of the end (23:59:59 UTC) of a 'YYYY-MM-DD' date, as scripts.js reads it."""
+    date = str(date)
+    if _ISO_DATE_RE.match(date):
+        try:
+            return datetime.fromisoformat(date + "T23:59:59+00:00").timestamp()
+        except ValueError:
+            return None
+    return deadline_epoch(date) if "T" in date else None
+
+
+def precompute(record, epoch):
+    """The render-ready fields of a record whose deadline is at ``epoch``.
+
+    Epoch milliseconds of the deadline, abstract deadline and conference end (when they
+    parse), the rating as an ordinal (0 if unrated) and the static part of the importance
+    score scripts.js weighs deadlines by. Clients that predate them ignore the extra fields.
+    """
+    fields = {"deadlineMs": round(epoch * 1000), "ratingOrdinal": RATING_ORDINALS.get(record.get("rating"), 0)}
+    for key, field, parse in (("abstractDeadline", "abstractDeadlineMs", deadline_epoch),
+                              ("conferenceEndDate", "conferenceEndMs", _day_end_epoch)):
+        if record.get(key):
+            value = parse(record[key])
+            if value is not None:
+                fields[field] = round(value * 1000)
+    importance = RATING_WEIGHTS.get(record.get("rating"), 1)
+    h5 = record.get("h5Index")
+    if isinstance(h5, (int, float)) and not isinstance(h5, bool):
+        importance += h5 / 120
+    fields["importance"] = importance
+    return fields
+
+
+def _record_epoch(record):
+    """The record's deadline in epoch seconds; None (and an error) if it doesn't parse."""
+    epoch = deadline_epoch(record["deadline"])
+    if epoch is None:
+        logger.error(f"unparseable deadline for conference {record}")
+    return epoch
+
+
+def _now_epoch(now):
+    return (now or datetime.now().astimezone(pytz.UTC)).timestamp()
+
+
+def iter_records(conferences):
+    """Yield ``(deadline epoch, record)`` for every parseable deadline, one per timeline entry."""
     for conf_id, conf in conferences.items():
-        conf["timezone"] = normalize_timezone_for_js(conf.get("timezone", "AoE"))
+        base = {key: value for key, value in conf.items() if key != "timeline"}
+        base["timezone"] = iana_name(conf.get("timezone", "AoE"))
         for i, dates in enumerate(conf["timeline"]):
-            conf_cpy = deepcopy(conf)
-            conf_cpy.pop("timeline")
-            conf_cpy = {**conf_cpy, **dates}
-            record_id = f"{conf_id}-{i + 1}"
-            conf_cpy["id"] = record_id
-            try:
-                if dateparser.parse(conf_cpy["deadline"]) > now:
-                    future_conf[record_id] = conf_cpy
-                else:
-                    past_conf[record_id] = conf_cpy
-            except TypeError as e:
-                logger.error(f"Type Error for conference {conf_cpy}: {e}")
+            record = {**base, **dates, "id": f"{conf_id}-{i + 1}"}
+            epoch = _record_epoch(record)
+            if epoch is not None:
+                record.update(precompute(record, epoch))
+                yield epoch, record
+
+
+def split_future_past(conferences, now=None):
+    """Explode each conference's timeline into one record per deadline, partitioned by now."""
+    future_conf, past_conf = {}, {}
+    now = _now_epoch(now)
+    for epoch, record in iter_records(conferences):
+        (future_conf if epoch > now else past_conf)[record["id"]] = record
     return future_conf, past_conf
 
 
+def _record_position(record, order):
+    conf_id, number = record["id"].rsplit("-", 1)
+    return order[conf_id], int(number)
+
+
+def patch_future_past(store, changed_files, future, past, now=None):
+    """Patch published ``future`` / ``past`` record lists for a change set of files.
+
+    Records of conferences defined in ``changed_files`` (or involved in a duplicate with
+    one), or no longer defined at all, are rebuilt from ``store``; the rest are kept.
+    Returns the new ``(future, past)`` lists, ordered as ``split_future_past`` orders them.
+    """
+    affected = {conf_id for conf_id, file in store.sources.items() if file in changed_files}
+    affected |= {conf_id for conf_id, kept, ignored in store.duplicates if {kept, ignored} & changed_files}
+
+    def keep(record):
+        conf_id = record["id"].rsplit("-", 1)[0]
+        return conf_id in store and conf_id not in affected
+
+    new_future, new_past = split_future_past({conf_id: store[conf_id] for conf_id in store if conf_id in affected}, now)
+    new_future, new_past = list(new_future.values()), list(new_past.values())
+    now = _now_epoch(now)
+    for record in filter(keep, future):
+        (new_future if _record_epoch(record) > now else new_past).append(record)
+    new_past.extend(filter(keep, past))
+
+    order = {conf_id: i for i, conf_id in enumerate(store)}
+    new_future.sort(key=lambda record: _record_position(record, order))
+    new_past.sort(key=lambda record: _record_position(record, order))
+    logger.info(f"rebuilt the records of {len(affected)} conference(s) from {len(changed_files)} changed file(s)")
+    return new_future, new_past
+
+
+def _load_published():
+    """The published ``(future, past)`` record lists, or None if there are none."""
+    try:
+        with open(os.path.join(DATA_FOLDER, FUTURE_FILE), "rb") as f:
+            future = json_load(f)
+        with open(os.path.join(DATA_FOLDER, ARCHIVE_FILE), "rb") as f:
+            past = json_load(f)
+    except (OSError, ValueError):
+        return None
+    return future, past
+
+
+class JsonArrayWriter:
+    """Writes a JSON array element by element to ``path + '.tmp'``; ``commit`` renames it.
+
+    With ``path=None`` the array is kept in memory. ``size`` and ``sha256`` describe the
+    finished array.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.tmp_path = None if path is None else path + ".tmp"
+        self.count = self.size = 0
+        self._hash = hashlib.sha256()
+        self._f = io.BytesIO() if path is None else open(self.tmp_path, "wb")
+        self._pending = path is not None
+        self._write(b"[")
+
+    def _write(self, data):
+        self._f.write(data)
+        self._hash.update(data)
+        self.size += len(data)
+
+    def append(self, item):
+        """Write ``item``; returns its encoding."""
+        if self.count:
+            self._write(b",")
+        data = json_dumps(item)
+        self._write(data)
+        self.count += 1
+        return data
+
+    def close(self):
+        self._write(b"]")
+        if self.path is not None:
+            self._f.close()
+
+    @property
+    def sha256(self):
+        return self._hash.hexdigest()
+
+    def content(self):
+        if self.path is None:
+            return self._f.getvalue()
+        with open(self.tmp_path if self._pending else self.path, "rb") as f:
+            return f.read()
+
+    def commit(self):
+        if self.path is not None:
+            os.replace(self.tmp_path, self.path)
+            self._pending = False
+
+    def discard(self):
+        if self.path is not None:
+            os.remove(self.tmp_path)
+
+
+class Exporter:
+    """Routes records into the published JSON files and writes the manifest describing them.
+
+    Every record goes to ``conferences.json`` or ``conferences_archive.json`` as before; past
+    deadlines also go to the shard ``archive/<year>.json`` (the UTC year of the deadline). The
+    manifest lists every file with its record count, byte size and sha256, so the frontend
+    can cache each shard by its hash and fetch only the years that changed.
+
+    ``record_hashes`` maps every record id to its content hash, the file that holds it
+    (``conferences.json`` or its archive shard), and its revision: the epoch of the publish
+    that last changed it and how many times it changed. Given the ``previous`` publish's
+    hashes, the records whose hash differs are kept in ``changed`` for ``delta``, and get a
+    new revision (the calendar feeds' DTSTAMP and SEQUENCE).
+    """
+
+    def __init__(self, folder=DATA_FOLDER, in_memory=False, compact=False, previous=None):
+        self.folder = folder
+        self.in_memory = in_memory
+        self.previous = previous
+        self.record_hashes = {}
+        self.changed = {}
+        self.writers = {}
+        self.encoders = {FUTURE_FILE: CompactEncoder(), ARCHIVE_FILE: CompactEncoder()} if compact else {}
+        self.indexes = {FUTURE_FILE: SearchIndex(), ARCHIVE_FILE: SearchIndex()}
+        self.series = SeriesTree()
+        self.calendars = CalendarFeeds()
+        self.blobs = {}  # path -> content of the outputs built in memory (all but the JSON arrays)
+        self.shards = {ARCHIVE_SHARDS: {}}
+        self._writer(FUTURE_FILE)
+        self._writer(ARCHIVE_FILE)
+
+    def _writer(self, path):
+        if path not in self.writers:
+            if self.in_memory:
+                self.writers[path] = JsonArrayWriter()
+            else:
+                os.makedirs(os.path.dirname(os.path.join(self.folder, path)), exist_ok=True)
+                self.writers[path] = JsonArrayWriter(os.path.join(self.folder, path))
+        return self.writers[path]
+
+    def _shard(self, kind, key, name):
+        path = f"{kind}/{name}.json"
+        self.shards[kind].setdefault(key, path)
+        return self._writer(path)
+
+    def add(self, epoch, record, now):
+        target = FUTURE_FILE if epoch > now else ARCHIVE_FILE
+        encoded = self.writers[target].append(record)
+        self.indexes[target].add(epoch, record)
+        self.series.add(record)
+        if self.encoders:
+            self.encoders[target].add(record)
+        if epoch > now:
+            location = FUTURE_FILE
+        else:
+            year = datetime.fromtimestamp(epoch, pytz.UTC).year
+            self._shard(ARCHIVE_SHARDS, year, year).append(record)
+            location = self.shards[ARCHIVE_SHARDS][year]
+        sha256 = hashlib.sha256(encoded).hexdigest()
+        revised, sequence = self._revision(record["id"], sha256, now)
+        self.calendars.add(record, epoch > now, revised, sequence)
+        self.record_hashes[record["id"]] = [sha256, location, revised, sequence]
+        if self.previous is not None and self.previous.get(record["id"], (None,))[0] != sha256:
+            self.changed[record["id"]] = record
+
+    def _revision(self, record_id, sha256, now):
+        """``(epoch, sequence)`` of a record's revision: the previous publish's while its hash is
+        unchanged, a new one (``now``, the next sequence) once it changed."""
+        previous = (self.previous or {}).get(record_id)
+        if previous is None or len(previous) < 4:  # new, or published before revisions were kept
+            return int(now), 0
+        if previous[0] == sha256:
+            return previous[2], previous[3]
+        return int(now), previous[3] + 1
+
+    def close(self):
+        for writer in self.writers.values():
+            writer.close()
+        for path, encoder in self.encoders.items():
+            self.blobs[COMPACT_FILES[path]] = json_dumps(encoder.encode())
+        for path, index in self.indexes.items():
+            self.blobs[INDEX_FILES[path]] = json_dumps(index.build())
+        self.blobs.update(self.series.build())
+        self.blobs.update(self.calendars.build())
+
+    def _entry(self, path):
+        writer = self.writers[path]
+        return {"path": path, "count": writer.count, "bytes": writer.size, "sha256": writer.sha256}
+
+    def _blob_entry(self, path, count):
+        content = self.blobs[path]
+        return {"path": path, "count": count, "bytes": len(content), "sha256": hashlib.sha256(content).hexdigest()}
+
+    def manifest(self):
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "recordSchema": RECORD_SCHEMA,
+            "upcoming": self._entry(FUTURE_FILE),
+            "archive": self._entry(ARCHIVE_FILE),
+            "archiveByYear": [{"year": year, **self._entry(path)} for year, path in sorted(self.shards[ARCHIVE_SHARDS].items())],
+        }
+        manifest["index"] = {
+            "upcoming": self._blob_entry(INDEX_FILES[FUTURE_FILE], self.writers[FUTURE_FILE].count),
+            "archive": self._blob_entry(INDEX_FILES[ARCHIVE_FILE], self.writers[ARCHIVE_FILE].count),
+        }
+        manifest["series"] = self._blob_entry(SERIES_INDEX, len(self.series.instances))
+        manifest["calendars"] = [self._blob_entry(path, count) for path, count in self.calendars.counts.items()]
+        if self.encoders:
+            manifest["compact"] = {
+                "upcoming": self._blob_entry(COMPACT_FILES[FUTURE_FILE], self.writers[FUTURE_FILE].count),
+                "archive": self._blob_entry(COMPACT_FILES[ARCHIVE_FILE], self.writers[ARCHIVE_FILE].count),
+            }
+        return manifest
+
+    def contents(self):
+        """``{path: bytes}`` of every output, the manifest included."""
+        contents = {path: writer.content() for path, writer in self.writers.items()}
+        contents.update(self.blobs)
+        contents[MANIFEST_FILE] = json_dumps(self.manifest())
+        return contents
+
+    def commit(self):
+        """Move every output into place and drop outputs no longer produced.
+
+        The JSON arrays are renamed into place; everything else is only written if its content
+        changed, so unchanged files keep their mtime (and HTTP caches stay valid).
+        """
+        for writer in self.writers.values():
+            writer.commit()
+        written = 0
+        for path, content in self.blobs.items():
+            os.makedirs(os.path.dirname(os.path.join(self.folder, path)), exist_ok=True)
+            written += write_if_changed(os.path.join(self.folder, path), content)
+        for path in (*COMPACT_FILES.values(), *INDEX_FILES.values()):
+            if path not in self.blobs and os.path.exists(os.path.join(self.folder, path)):
+                os.remove(os.path.join(self.folder, path))
+        for kind in (*self.shards, UPCOMING_SHARDS, SERIES_FOLDER, ICS_FOLDER):
+            self._remove_stale(kind)
+        write_if_changed(os.path.join(self.folder, MANIFEST_FILE), json_dumps(self.manifest()))
+        logger.info(f"rewrote {written} of {len(self.blobs)} derived files")
+
+    def _remove_stale(self, kind):
+        """Remove the ``*.json`` / ``*.ics`` files under ``kind/`` that this export didn't produce."""
+        for root, _, names in os.walk(os.path.join(self.folder, kind), topdown=False):
+            for name in names:
+                path = os.path.relpath(os.path.join(root, name), self.folder).replace(os.sep, "/")
+                if name.endswith((".json", ".ics")) and path not in self.writers and path not in self.blobs:
+                    os.remove(os.path.join(root, name))
+            if root != os.path.join(self.folder, kind) and not os.listdir(root):
+                os.rmdir(root)
+
+    def discard(self):
+        for writer in self.writers.values():
+            writer.discard()
+
+    def delta(self):
+        """The change-feed delta from the ``previous`` publish. Call it before ``commit``: the
+        old versions of the changed records are read from the files still published."""
+        wanted = {}
+        for record_id in self.changed.keys() & self.previous.keys():
+            wanted.setdefault(self.previous[record_id][1], set()).add(record_id)
+        old = {}
+        for path, ids in wanted.items():
+            try:
+                with open(os.path.join(self.folder, path), "rb") as f:
+                    old.update((record["id"], record) for record in json_load(f) if record["id"] in ids)
+            except (OSError, ValueError) as e:
+                logger.warning(f"cannot read the published {path}, its changed records count as added: {e}")
+        removed = [record_id for record_id in self.previous if record_id not in self.record_hashes]
+        return {**changes.diff_records(old, self.changed), "removed": removed}
+
+
+def records(changed_files=None, published=None, store=None):
+    """``(deadline epoch, record)`` pairs: ``published`` patched for ``changed_files``, else built
+    in full (lazily). ``store`` defaults to loading ``conferences/``."""
+    store = store if store is not None else load_store()
+    logger.info(f"managing {len(store)} conference instances")
+    if changed_files is None or published is None:
+        return iter_records(store.conferences)
+    future, past = patch_future_past(store, changed_files, *published)
+    return ((deadline_epoch(record["deadline"]), record) for record in chain(future, past))
+
+
+def export(pairs, now, folder=DATA_FOLDER, in_memory=False, compact=False, previous=None):
+    """Feed ``(epoch, record)`` pairs into a new ``Exporter`` and close it."""
+    exporter = Exporter(folder, in_memory, compact, previous)
+    now = _now_epoch(now)
+    for epoch, record in pairs:
+        exporter.add(epoch, record, now)
+    exporter.close()
+    return exporter
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    add_changeset_args(parser)
+    parser.add_argument(
+        "--self-check",
+        default=False,
+        action=argparse.BooleanOptionalAction,
+        help="Also build everything from scratch and fail unless both results are identical",
+    )
+    parser.add_argument(
+        "--compact",
+        default=False,
+        action=argparse.BooleanOptionalAction,
+        help="Also write the upcoming and past deadlines in the compact encoding (see compact.py)",
+    )
+    return parser.parse_args()
+
+
+def publish(changed_files=None, compact=False, self_check=False, store=None):
+    """Export the store (patching the published files for ``changed_files``), then record the
+    publish. Returns False, and publishes nothing, if the self-check fails."""
+    now = datetime.now().astimezone(pytz.UTC)
+    store = store if store is not None else load_store()
+    published = _load_published() if changed_files is not None else None
+    previous = published_record_hashes()
+    exporter = export(records(changed_files, published, store), now, compact=compact, previous=previous)
+    logger.info(
+        f"wrote {exporter.writers[FUTURE_FILE].count} upcoming and {exporter.writers[ARCHIVE_FILE].count} past "
+        f"deadlines in {len(exporter.writers)} files"
+    )
+
+    if self_check:
+        full = export(iter_records(store.conferences), now, in_memory=True, compact=compact, previous=previous)
+        if exporter.contents() != full.contents():
+            exporter.discard()
+            logger.error("self-check failed: the incremental build differs from a full build")
+            return False
+        logger.info("self-check passed: the incremental build is identical to a full build")
+    log_stats()
+    parse_cache.save()
+
+    delta = None if previous is None else exporter.delta()
+    exporter.commit()
+    record_published_commit(exporter.record_hashes)
+    if delta is None:
+        logger.info("no record hashes from a previous publish, not recording a delta in the change feed")
+    else:
+        sequence = changes.publish(os.path.join(DATA_FOLDER, CHANGES_FILE), delta, now.strftime("%Y-%m-%dT%H:%M:%SZ"))
+        logger.info(f"change feed at sequence {sequence}: {len(delta['added'])} added, "
+                    f"{len(delta['removed'])} removed, {len(delta['modified'])} modified")
+    return True
+
+
 def main():
-    conferences = load_conferences()
-    logger.info(f"managing {len(conferences)} conference instances")
-    logger.info(sorted(list(conferences.keys())))
-
-    future_conf, past_conf = split_future_past(conferences)
-    logger.info(f"past: {sorted(list(past_conf.keys()))}")
-    logger.info(f"future: {sorted(list(future_conf.keys()))}")
-
-    with open(os.path.join(DATA_FOLDER, "conferences.json"), "w") as f:
-        json.dump(list(future_conf.values()), f)
-    with open(os.path.join(DATA_FOLDER, "conferences_archive.json"), "w") as f:
-        json.dump(list(past_conf.values()), f)
+    args = parse_args()
+    if not publish(resolve_changeset(args), compact=args.compact, self_check=args.self_check):
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,227 @@
+"""Strict, compiled fast path in front of dateparser.
+
+``dateparser.parse`` is flexible but slow: it runs language detection and a long chain of
+fuzzy parsers for every call, and the pipeline calls it for every deadline, several times
+over. Almost every string we see is in one of a handful of fixed shapes — the ISO-8601
+timestamps we store ourselves, ``YYYY-MM-DD`` dates, ``Mon DD, YYYY HH:MM TZ`` from the
+official websites, and the ``YYYY-MM-DD HH:MM:SS`` / ``D Month YYYY`` shapes of the ccf and
+hf feeds. ``parse_datetime`` matches those with one compiled regex and only hands the
+strings it rejects to dateparser (restricted to English, which skips language detection).
+
+The fast path is deliberately strict: it returns exactly what dateparser would for the
+shapes it accepts, and ``None`` (i.e. "ask dateparser") for anything else, so it can never
+change a result — only skip work. ``STATS`` counts which path each string took.
+
+``parse_date_range`` is the one grammar for conference date ranges ("Jun 19-24, 2025",
+"19 - 24 June 2025", ...) that the parsers used to split by hand and then hand to dateparser;
+it returns normalized dates directly.
+"""
+
+import datetime
+import re
+import threading
+from collections import Counter
+from functools import lru_cache
+
+import dateparser
+
+from .log_config import logger
+
+STATS = Counter()
+# dateparser keeps shared, lazily built state; the update stages parse on several threads.
+_dateparser_lock = threading.Lock()
+# ``STATS += 1`` is a read-modify-write; its own lock keeps fast parses from waiting on dateparser.
+_stats_lock = threading.Lock()
+
+_MONTHS = {}
+for _i, _name in enumerate(
+    ["january", "february", "march", "april", "may", "june", "july", "august", "september", "october", "november",
+     "december"],
+    start=1,
+):
+    _MONTHS[_name] = _MONTHS[_name[:3]] = _i
+_MONTHS["sept"] = 9
+
+# Fixed-offset abbreviations, with the offsets dateparser assigns them.
+_ABBREVIATIONS = {
+    "UTC": 0, "GMT": 0,
+    "PST": -8, "PDT": -7, "MST": -7, "MDT": -6, "CDT": -5, "EST": -5, "EDT": -4,
+}
+
+# dateparser only knows offsets that some real zone uses: whole hours from -12 to +14 and these.
+_FRACTIONAL_OFFSETS = {(-9, 30), (-4, 30), (-3, 30), (-2, 30), (3, 30), (4, 30), (5, 30), (5, 45), (6, 30), (8, 45),
+                       (9, 30), (10, 30), (11, 30), (12, 45)}
+
+_DATE = (
+    r"(?:(?P<iso_y>\d{4})-(?P<iso_m>\d{2})-(?P<iso_d>\d{2})"
+    r"|(?P<md_mon>[A-Za-z]{3,9})\.?\s+(?P<md_d>\d{1,2})(?:st|nd|rd|th)?,?\s+(?P<md_y>\d{4})"
+    r"|(?P<dm_d>\d{1,2})(?:st|nd|rd|th)?,?\s+(?P<dm_mon>[A-Za-z]{3,9})\.?,?\s+(?P<dm_y>\d{4}))"
+)
+_TIME = (
+    r"(?:(?:T|,?\s+)(?P<hour>\d{1,2}):(?P<minute>\d{2})(?::(?P<second>\d{2})(?:\.(?P<fraction>\d{1,6}))?)?"
+    r"(?:\s*(?P<ampm>[AaPp])\.?[Mm]\.?)?)?"
+)
+_TZ = (
+    r"(?:(?P<offset>Z|[+-]\d{2}:\d{2})"
+    r"|\s+(?:UTC|GMT)(?P<utc_offset>[+-]\d{1,2}(?::?\d{2})?)"
+    r"|\s+(?P<abbr>UTC|GMT|[PMCE][SD]T))?"
+)
+_FAST_RE = re.compile(rf"^\s*{_DATE}{_TIME}{_TZ}\s*$")
+
+
+def _offset(text):
+    """'+02:00' / '-12' / '+0530' -> fixed-offset tzinfo, or None for an offset no zone uses."""
+    sign = -1 if text[0] == "-" else 1
+    digits = text[1:].replace(":", "")
+    if len(digits) <= 2:
+        hours, minutes = int(digits), 0
+    else:
+        hours, minutes = int(digits[:-2]), int(digits[-2:])
+    if minutes:
+        if (sign * hours, minutes) not in _FRACTIONAL_OFFSETS:
+            return None
+    elif not -12 <= sign * hours <= 14:
+        return None
+    return datetime.timezone(sign * datetime.timedelta(hours=hours, minutes=minutes))
+
+
+def _tzinfo(match):
+    if match["offset"] == "Z":
+        return datetime.timezone.utc
+    if match["offset"]:
+        return _offset(match["offset"])
+    if match["utc_offset"]:
+        return _offset(match["utc_offset"])
+    abbr = match["abbr"]
+    if abbr is None:
+        return False  # no timezone in the string: naive result
+    if abbr not in _ABBREVIATIONS:
+        return None
+    return datetime.timezone(datetime.timedelta(hours=_ABBREVIATIONS[abbr]))
+
+
+def fast_parse(timestr):
+    """Parse ``timestr`` if it has one of the strict shapes above, else return None."""
+    match = _FAST_RE.match(timestr)
+    if match is None:
+        return None
+    if match["iso_y"]:
+        year, month, day = int(match["iso_y"]), int(match["iso_m"]), int(match["iso_d"])
+    else:
+        prefix = "md_" if match["md_y"] else "dm_"
+        month = _MONTHS.get(match[prefix + "mon"].lower())
+        if month is None:
+            return None
+        year, day = int(match[prefix + "y"]), int(match[prefix + "d"])
+
+    if match["offset"] and (match["hour"] is None or match["ampm"]):
+        return None  # 'Z' / '+02:00' glued to a date or an am/pm time is not ISO-8601
+
+    hour = minute = second = microsecond = 0
+    if match["hour"]:
+        hour, minute = int(match["hour"]), int(match["minute"])
+        second = int(match["second"] or 0)
+        microsecond = int((match["fraction"] or "0").ljust(6, "0"))
+        if match["ampm"]:
+            if not 1 <= hour <= 12:
+                return None
+            hour = hour % 12 + (12 if match["ampm"] in "Pp" else 0)
+
+    tzinfo = _tzinfo(match)
+    if tzinfo is None:
+        return None
+    try:
+        return datetime.datetime(year, month, day, hour, minute, second, microsecond, tzinfo=tzinfo or None)
+    except ValueError:
+        return None  # e.g. month 13: leave the (lenient) interpretation to dateparser
+
+
+def parse_datetime(timestr):
+    """Parse a date string via the fast path, falling back to English-only dateparser."""
+    parsed = fast_parse(timestr)
+    with _stats_lock:
+        STATS["fast" if parsed is not None else "dateparser"] += 1
+    if parsed is not None:
+        return parsed
+    with _dateparser_lock:
+        return dateparser.parse(timestr, languages=["en"])
+
+
+def hit_rate():
+    """Fraction of strings parsed so far that never reached dateparser (1.0 if none were)."""
+    total = STATS["fast"] + STATS["dateparser"]
+    return STATS["fast"] / total if total else 1.0
+
+
+def log_stats():
+    total = STATS["fast"] + STATS["dateparser"]
+    logger.info(f"date parsing: {STATS['fast']}/{total} strings on the fast path ({hit_rate():.1%})")
+
+
+# --------------------------------------------------------------------------- #
+# Conference date ranges
+# --------------------------------------------------------------------------- #
+# "Jun 19-24, 2025", "Feb 28 - Mar 3", "Jan 6th - 8th", "19 - 24 June 2025", "June 11, 12",
+# and single days. Weekday prefixes ("Mon, Feb 28") are ignored.
+_WEEKDAY = r"(?:(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun)[a-z]*\.?,?\s+)?"
+_MON = r"[A-Za-z]{3,9}\.?"
+_DAY = r"\d{1,2}(?:st|nd|rd|th)?"
+_YEAR = r"(?:,?\s*(?P<{}>\d{{4}}))?"
+_SEP = r"\s*(?:-|–|—|to|through|until)\s*"
+_RANGE_RES = [
+    # month first: "Jun 19-24, 2025", "Feb 28 - Mar 3", "June 30, 2025 - July 4, 2025"
+    re.compile(
+        rf"^{_WEEKDAY}(?P<m1>{_MON})\s*(?P<d1>{_DAY}){_YEAR.format('y1')}{_SEP}"
+        rf"{_WEEKDAY}(?:(?P<m2>{_MON})\s*)?(?P<d2>{_DAY}){_YEAR.format('y2')}$"
+    ),
+    # day first: "19 - 24 June 2025", "30 June - 4 July 2025"
+    re.compile(
+        rf"^{_WEEKDAY}(?P<d1>{_DAY})(?:\s+(?P<m1>{_MON}))?{_YEAR.format('y1')}{_SEP}"
+        rf"{_WEEKDAY}(?P<d2>{_DAY})\s+(?P<m2>{_MON}){_YEAR.format('y2')}$"
+    ),
+    # single day: "June 5, 2025", "5 June 2025"
+    re.compile(rf"^{_WEEKDAY}(?P<m1>{_MON})\s*(?P<d1>{_DAY}){_YEAR.format('y2')}$"),
+    re.compile(rf"^{_WEEKDAY}(?P<d1>{_DAY})\s+(?P<m1>{_MON}){_YEAR.format('y2')}$"),
+    # day list: "June 11, 12" (first to last)
+    re.compile(rf"^{_WEEKDAY}(?P<m1>{_MON})\s*(?P<d1>{_DAY})(?:\s*,\s*(?P<d2>{_DAY}))+{_YEAR.format('y2')}$"),
+]
+_ordinal_re = re.compile(r"(?<=\d)(?:st|nd|rd|th)$")
+
+
+def _month(name):
+    return _MONTHS.get(name.rstrip(".").lower()) if name else None
+
+
+@lru_cache(maxsize=4096)
+def parse_date_range(text, year=None):
+    """Parse a conference date range into normalized ``('YYYY-MM-DD', 'YYYY-MM-DD')``.
+
+    ``year`` fills in when the text has none (it is the year of the end date; a range that
+    wraps around New Year starts the year before). Returns None for anything else.
+    """
+    text = " ".join(str(text).replace("\xa0", " ").split())
+    for range_re in _RANGE_RES:
+        match = range_re.match(text)
+        if match is not None:
+            break
+    else:
+        return None
+    groups = match.groupdict()
+    month1, month2 = _month(groups["m1"]), _month(groups.get("m2"))
+    if (groups["m1"] and month1 is None) or (groups.get("m2") and month2 is None):
+        return None  # a word in a month's place that isn't one: "Jun 19 - Foo 24"
+    month1, month2 = month1 or month2, month2 or month1
+    day1 = int(_ordinal_re.sub("", groups["d1"]))
+    day2 = int(_ordinal_re.sub("", groups.get("d2") or groups["d1"]))
+    year2 = groups["y2"] or groups.get("y1") or year
+    if month1 is None or year2 is None:
+        return None
+    year2 = int(year2)
+    year1 = int(groups.get("y1") or (year2 - 1 if (month1, day1) > (month2, day2) else year2))
+    try:
+        start, end = datetime.date(year1, month1, day1), datetime.date(year2, month2, day2)
+    except ValueError:
+        return None
+    if end < start:
+        return None
+    return start.isoformat(), end.isoformat()
@@ -0,0 +1,147 @@
+"""Static iCalendar feeds of the deadlines under ``data/ics/``.
+
+Subscribing to deadlines used to go through a converter service that pulled
+``conferences.json`` and rendered ICS on every request. ``data_to_json`` now writes the
+feeds itself, from the records it exports:
+
+- ``ics/upcoming.ics``: every upcoming deadline;
+- ``ics/tags/<tag>.ics``: the upcoming deadlines of one tag;
+- ``ics/series/<series>.ics``: every deadline, past ones included, of one series.
+
+Each record becomes a zero-length event at its deadline, plus one at its abstract deadline
+when it has one. UIDs are derived from the record id (``cvpr2025-1@…``, ``cvpr2025-1-abstract@…``),
+so calendar clients recognize the same event across refreshes. DTSTAMP and SEQUENCE come from
+the record's revision, which ``data_to_json.Exporter`` keeps in the publish state: both stay
+put while the record's content hash does, and move forward when it changes (a new note, a
+moved deadline), so clients pick up the revision. A feed's bytes therefore only change when
+its records do, and ``Exporter.commit`` rewrites only the feeds that changed.
+"""
+
+import re
+from datetime import datetime, timezone
+
+from .store import group_of, unique_slugs
+
+ICS_FOLDER = "ics"
+UPCOMING_CALENDAR = f"{ICS_FOLDER}/upcoming.ics"
+UID_DOMAIN = "aideadlines.nauen-it.de"
+REFRESH_INTERVAL = "PT6H"
+
+
+def escape_text(value):
+    """Escape a TEXT value (RFC 5545, 3.3.11)."""
+    return (str(value).replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+            .replace("\r\n", "\\n").replace("\n", "\\n"))
+
+
+def fold(line):
+    """Fold a content line into chunks of at most 75 octets (RFC 5545, 3.1), never inside a character."""
+    chunks, chunk, size = [], "", 0
+    for char in line:
+        width = len(char.encode())
+        if size + width > (75 if not chunks else 74):
+            chunks.append(chunk)
+            chunk, size = "", 0
+        chunk += char
+        size += width
+    chunks.append(chunk)
+    return "\r\n ".join(chunks)
+
+
+def _timestamp(ms):
+    return datetime.fromtimestamp(ms / 1000, timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _name(record):
+    return record.get("shortname") or record.get("title") or record["id"].rsplit("-", 1)[0]
+
+
+def events(record, revised, sequence=0):
+    """The VEVENT content lines (unfolded) of one record, last changed at epoch ``revised``
+    (its ``sequence``-th revision)."""
+    starts = [("deadline", "", record.get("deadlineMs"))]
+    if record.get("abstractDeadlineMs") is not None:
+        starts.append(("abstract deadline", "-abstract", record["abstractDeadlineMs"]))
+    description = [record["title"]] if record.get("title") else []
+    if record.get("note"):
+        description.append(record["note"])
+    if record.get("location"):
+        description.append(f"Location: {record['location']}")
+    if record.get("isApproximateDeadline"):
+        description.append("Estimated from previous years; not announced yet.")
+    lines = []
+    for label, suffix, ms in starts:
+        if ms is None:
+            continue
+        estimated = " (estimated)" if record.get("isApproximateDeadline") else ""
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:{record['id']}{suffix}@{UID_DOMAIN}",
+            f"DTSTAMP:{_timestamp(revised * 1000)}",
+            f"SEQUENCE:{sequence}",
+            f"DTSTART:{_timestamp(ms)}",
+            f"SUMMARY:{escape_text(f'{_name(record)} {label}{estimated}')}",
+            f"STATUS:{'TENTATIVE' if record.get('isApproximateDeadline') else 'CONFIRMED'}",
+            "TRANSP:TRANSPARENT",
+        ]
+        if record.get("tags"):
+            lines.append(f"CATEGORIES:{','.join(escape_text(tag) for tag in record['tags'])}")
+        if record.get("website"):
+            lines.append(f"URL:{record['website']}")
+        if description:
+            lines.append(f"DESCRIPTION:{escape_text(chr(10).join(description))}")
+        lines.append("END:VEVENT")
+    return lines
+
+
+def calendar(name, records, revisions):
+    """The bytes of a VCALENDAR named ``name`` holding the events of ``records``; ``revisions``
+    maps each record id to its ``(revised, sequence)``."""
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//ai-deadlines//deadlines//EN",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{escape_text(name)}",
+        f"REFRESH-INTERVAL;VALUE=DURATION:{REFRESH_INTERVAL}",
+        f"X-PUBLISHED-TTL:{REFRESH_INTERVAL}",
+    ]
+    for record in records:
+        lines += events(record, *revisions[record["id"]])
+    lines.append("END:VCALENDAR")
+    return ("\r\n".join(fold(line) for line in lines) + "\r\n").encode()
+
+
+class CalendarFeeds:
+    """Collects records and builds the ``{path: content}`` of every feed."""
+
+    def __init__(self):
+        self.upcoming = []
+        self.by_tag = {}
+        self.by_series = {}
+        self.revisions = {}  # record id -> (revised, sequence)
+        self.counts = {}  # path -> number of records, filled by ``build``
+
+    def add(self, record, upcoming, revised, sequence=0):
+        self.revisions[record["id"]] = (revised, sequence)
+        self.by_series.setdefault(group_of(record["id"].rsplit("-", 1)[0]), []).append(record)
+        if upcoming:
+            self.upcoming.append(record)
+            for tag in dict.fromkeys(record.get("tags") or ()):
+                self.by_tag.setdefault(tag, []).append(record)
+
+    def build(self):
+        def ordered(records):
+            return sorted(records, key=lambda record: (record.get("deadlineMs") or 0, record["id"]))
+
+        feeds = [(UPCOMING_CALENDAR, "AI deadlines", self.upcoming)]
+        tag_slugs, series_slugs = unique_slugs(self.by_tag), unique_slugs(self.by_series)
+        feeds += [(f"{ICS_FOLDER}/tags/{tag_slugs[tag]}.ics", f"AI deadlines: {tag}", records)
+                  for tag, records in sorted(self.by_tag.items())]
+        for series, records in sorted(self.by_series.items()):
+            records = ordered(records)
+            name = re.sub(r"\s*\d{4}$", "", _name(records[-1]))  # 'CVPR 2025' -> 'CVPR'
+            feeds.append((f"{ICS_FOLDER}/series/{series_slugs[series]}.ics", f"AI deadlines: {name}", records))
+        self.counts = {path: len(records) for path, _, records in feeds}
+        return {path: calendar(name, ordered(records), self.revisions) for path, name, records in feeds}
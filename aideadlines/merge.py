@@ -5,8 +5,8 @@ This consolidates logic that was previously copy-pasted four times (once per sou
 what makes it testable (see ``tests/test_merge_priority.py``).
 """
 
-import dateparser
 
+from .dates import parse_datetime
 from .log_config import logger
 from .utils import join_conferences
 
@@ -16,13 +16,19 @@ from .utils import join_conferences
 SOURCES = ["estimate", "ninoduarte-git", "ccf-deadlines", "hf-repo", "off-website", "manual"]
 
 
+def merge_order(sources):
+    """``sources`` from highest to lowest priority: the order fetched sources are merged in,
+    whichever fetch finished first."""
+    return sorted(sources, key=SOURCES.index, reverse=True)
+
+
 def tag_wacv_round(conf, conf_id):
     """WACV feeds often carry a single undated round; label it Round 1/2 by deadline month.
 
     Mutates ``conf`` in place. No-op for non-WACV ids or multi-deadline timelines.
     """
     if conf_id.startswith("wacv") and len(conf["timeline"]) == 1:
-        deadline = dateparser.parse(conf["timeline"][0]["deadline"])
+        deadline = parse_datetime(conf["timeline"][0]["deadline"])
         if deadline is None:
             logger.warning(f"Failed to parse deadline for WACV conference {conf_id}")
             rnd = 2
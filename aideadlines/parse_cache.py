@@ -0,0 +1,129 @@
+"""Persistent, cross-run memo for ``utils._parse_timestr``.
+
+Every run re-parses the same few thousand deadline strings from ``conferences/*.yaml`` and
+the online feeds, and almost none of them change between runs. This maps
+``(raw string, conf_tz, with_time)`` to the parsed result and keeps it in a small JSON file
+under ``data/``, loaded lazily once per process and shared by every entry point in it.
+
+The file carries a fingerprint of everything that can change a result (the parser version
+and the timezone table); a mismatch discards it wholesale. On save, entries unused for
+``MAX_AGE_DAYS`` are dropped and only the ``MAX_ENTRIES`` most recently used are kept, so
+the file can't grow without bound. Lookups are locked: the update stages parse on several
+threads at once (see ``stages``).
+"""
+
+import os
+import threading
+import time
+
+from .codec import json_dump, json_load
+from .log_config import logger
+
+THIS_FOLDER = os.path.dirname(__file__)
+CACHE_FILE = os.path.join(THIS_FOLDER, "data", ".parse_cache.json")
+MAX_ENTRIES = 50_000
+MAX_AGE_DAYS = 180
+
+MISSING = object()
+
+
+def _today():
+    return int(time.time() // 86400)
+
+
+class ParseCache:
+    """String -> parse result memo with LRU/age eviction. ``path=None`` keeps it in memory only."""
+
+    def __init__(self, path, fingerprint, max_entries=MAX_ENTRIES, max_age_days=MAX_AGE_DAYS):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+        self.hits = self.misses = 0
+        # key -> [result, last-used day]; dict order is least- to most-recently used.
+        self._entries = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load()
+
+    @staticmethod
+    def key(timestr, conf_tz, with_time):
+        return f"{int(bool(with_time))}|{conf_tz}|{timestr}"
+
+    def _load(self):
+        if self.path is None or not os.path.isfile(self.path):
+            return
+        try:
+            with open(self.path, "rb") as f:
+                stored = json_load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"ignoring unreadable parse cache {self.path}: {e}")
+            return
+        if stored.get("fingerprint") != self.fingerprint:
+            logger.info("parse cache is stale (parser or timezone table changed); starting fresh")
+            self._dirty = True
+            return
+        entries = sorted(stored.get("entries", {}).items(), key=lambda item: item[1][1])
+        self._entries = dict(entries)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                self.misses += 1
+                return MISSING
+            self.hits += 1
+            today = _today()
+            if entry[1] != today:
+                entry[1] = today
+                self._dirty = True
+            self._entries[key] = entry  # re-insert as most recently used
+            return entry[0]
+
+    def put(self, key, result):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = [result, _today()]
+            self._dirty = True
+
+    def __len__(self):
+        return len(self._entries)
+
+    def evict(self):
+        """Drop entries older than ``max_age_days``, then all but the ``max_entries`` newest."""
+        oldest_kept = _today() - self.max_age_days
+        entries = [(key, entry) for key, entry in self._entries.items() if entry[1] >= oldest_kept]
+        entries = entries[-self.max_entries:] if self.max_entries else []
+        if len(entries) != len(self._entries):
+            self._entries = dict(entries)
+            self._dirty = True
+
+    def save(self):
+        self.evict()
+        logger.info(f"parse cache: {self.hits} hits, {self.misses} misses, {len(self)} entries")
+        if self.path is None or not self._dirty:
+            return
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            json_dump({"fingerprint": self.fingerprint, "entries": self._entries}, f)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache(fingerprint):
+    """The process-wide cache, loaded from ``CACHE_FILE`` on first use."""
+    global _cache
+    with _cache_lock:
+        if _cache is None or _cache.fingerprint != fingerprint:
+            _cache = ParseCache(CACHE_FILE, fingerprint)
+        return _cache
+
+
+def save():
+    """Persist the process-wide cache, if it was used."""
+    if _cache is not None:
+        _cache.save()
@@ -1,5 +1,6 @@
 import os
 
+from ..dates import parse_date_range
 from ..log_config import logger
 from .http import fetch_json, fetch_yaml
 
@@ -10,33 +11,16 @@ _CCF_RAW = "https://raw.githubusercontent.com/ccfddl/ccf-deadlines/refs/heads/ma
 
 
 def parse_ccf_date_range(date_str, fallback_year):
-    """Parse a ccf-deadlines 'date' string into (start, end) 'D Mon YYYY' strings.
+    """Parse a ccf-deadlines 'date' string into normalized (start, end) 'YYYY-MM-DD' dates.
 
-    Returns None for 'TBD'. Raises ValueError/AssertionError for shapes it can't handle.
+    Returns None for 'TBD'. Raises ValueError for shapes it can't handle.
     """
     if date_str == "TBD":
         return None
-    parts = date_str.replace("-", " - ").replace("  ", " ").split(" ")
-    if len(parts) == 3:
-        month, days, year = parts
-        start_month = end_month = month
-        days = days.split("-")
-        start_day, end_day = days if len(days) == 2 else (days[0], days[0])
-    elif len(parts) == 5:
-        if int(parts[-1]) >= 1900:
-            month, start_day, dash, end_day, year = parts
-            assert dash == "-", f"No '-', but '{dash}'"
-            start_month = end_month = month
-        else:
-            start_month, start_day, dash, end_month, end_day = parts
-            assert len(end_month) >= 3, f"Thought {end_month} was a month"
-            year = str(fallback_year)
-    elif len(parts) == 6:
-        start_month, start_day, dash, end_month, end_day, year = parts
-        assert dash == "-", f"No '-', but '{dash}'"
-    else:
+    date_range = parse_date_range(date_str, int(fallback_year))
+    if date_range is None:
         raise ValueError(f"Can't parse dates str '{date_str}' yet")
-    return f"{start_day} {start_month} {year}", f"{end_day} {end_month} {year}"
+    return date_range
 
 
 def conference_from_ccf(ccf_info, conf):
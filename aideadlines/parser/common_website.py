@@ -1,5 +1,6 @@
 import re
 
+from ..dates import parse_date_range
 from .http import fetch_soup
 
 
@@ -21,6 +22,7 @@ def extract_dates_from_soup(data, website):
     """Pull deadlines and conference dates out of an already-fetched 'Dates' page soup."""
     if "timeline" not in data:
         data["timeline"] = [{}]
+    year = int(data["id"][-4:]) if "id" in data else None
 
     for table in website.find_all("table"):
         main_conference_data = True
@@ -56,14 +58,9 @@ def extract_dates_from_soup(data, website):
                     date = _cell_after(tds, i)
                     if date is None:
                         continue
-                    month = date.split(" ")[0]
-                    if month.endswith(","):
-                        month = month[:-1]
-                    days = date[len(month) + 1:]
-                    days = days.split(",") if "," in days else days.split("-")
-                    if len(days) >= 2:
-                        data["conferenceStartDate"] = f"{month} {days[0].strip()}"
-                        data["conferenceEndDate"] = f"{month} {days[1].strip()}"
+                    date_range = parse_date_range(date, year)
+                    if date_range is not None:
+                        data["conferenceStartDate"], data["conferenceEndDate"] = date_range
 
             header = row.find_next("th")
             if header and ("conference sessions" in header.get_text().lower()):
@@ -132,6 +129,7 @@ def _make_parser(config):
         return data
 
     parse.__name__ = f"parse_{config['id']}"
+    parse.year_filter = config["year_filter"]  # lets the crawl plan skip years without an instance
     return parse
 
 
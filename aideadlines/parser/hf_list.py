@@ -1,5 +1,6 @@
 import re
 
+from ..dates import parse_date_range
 from ..log_config import logger
 from .http import fetch_json, fetch_yaml
 
@@ -14,7 +15,6 @@ _tag_dict = {
 }
 
 _trailing_year_re = re.compile(r"\d{4}$")
-hf_date_re = re.compile(r"([A-Z][a-z]+)[ ,]*(\d+) *[-|–] *([A-Z,a-z]*) *(\d+), *(\d+)$")
 
 _HF_TREE = "https://api.github.com/repos/huggingface/ai-deadlines/git/trees/main?recursive=1"
 _HF_RAW = "https://raw.githubusercontent.com/huggingface/ai-deadlines/refs/heads/main/"
@@ -61,11 +61,15 @@ def _build_timeline(conference):
 def conference_from_hf(conference):
     """Convert one HF conference entry to our schema, or None to skip it."""
     shortname = re.sub(r"[^a-zA-Z0-9]", "", conference["title"])
+    year = conference.get("year")
     if _trailing_year_re.search(shortname):
         conf_id = shortname.lower()
+    elif year is None:
+        logger.info(f"INFO skipping hf entry {conference['title']} without a year")
+        return None
     else:
-        conf_id = shortname.lower() + str(conference["year"])
-        shortname = shortname + " " + str(conference["year"])
+        conf_id = shortname.lower() + str(year)
+        shortname = shortname + " " + str(year)
     conf_id = conf_id.replace("3dv", "threedv")  # match ccf_deadlines id so instances merge
     out_conf = {
         "id": conf_id,
@@ -100,15 +104,11 @@ def conference_from_hf(conference):
         out_conf["conferenceEndDate"] = conference.get("end")
     else:
         date_str = (conference.get("date") or "").strip()
-        match = hf_date_re.match(date_str)
-        if not match:
+        date_range = parse_date_range(date_str, year)
+        if date_range is None:
             logger.info(f"INFO skipping hf entry {conf_id} with date '{date_str}'")
             return None
-        month1, day1, month2, day2, year = match.groups()
-        if month2 is None or len(month2) == 0:
-            month2 = month1
-        out_conf["conferenceStartDate"] = f"{month1} {day1}, {year}"
-        out_conf["conferenceEndDate"] = f"{month2} {day2}, {year}"
+        out_conf["conferenceStartDate"], out_conf["conferenceEndDate"] = date_range
 
     if conference.get("abstract_deadline") is not None:
         out_conf["timeline"][0]["abstractDeadline"] = conference["abstract_deadline"]
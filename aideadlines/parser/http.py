@@ -10,9 +10,9 @@ persistent failure so callers can skip a source or record instead of crashing.
 import time
 
 import requests
-import yaml
 from bs4 import BeautifulSoup
 
+from ..codec import YAMLError, yaml_load
 from ..log_config import logger
 
 DEFAULT_TIMEOUT = 20
@@ -67,8 +67,8 @@ def fetch_yaml(url, **kwargs):
     if text is None:
         return None
     try:
-        return yaml.safe_load(text)
-    except yaml.YAMLError as e:
+        return yaml_load(text)
+    except YAMLError as e:
         logger.warning(f"GET {url}: invalid YAML: {e}")
         return None
 
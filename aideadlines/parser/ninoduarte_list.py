@@ -1,7 +1,5 @@
-import json
-
-import dateparser
-
+from ..codec import JSONDecodeError, json_loads
+from ..dates import parse_datetime
 from ..log_config import logger
 from .http import fetch_json, fetch_text
 
@@ -23,15 +21,15 @@ def parse_past_conferences(raw):
     if not raw.startswith("["):
         raw = "[" + raw + "]"
     try:
-        return json.loads(raw)
-    except json.JSONDecodeError as e:
+        return json_loads(raw)
+    except JSONDecodeError as e:
         logger.warning(f"could not parse ninoduarte past_conferences: {e}")
         return []
 
 
 def conference_from_nino(conf):
     """Convert one ninoduarte record to our schema, or None if its start date won't parse."""
-    start = dateparser.parse(conf["date_start"])
+    start = parse_datetime(conf["date_start"])
     if start is None:
         logger.warning(f"skipping ninoduarte conf with unparseable date_start: {conf.get('id')}")
         return None
@@ -1,9 +1,9 @@
 from datetime import datetime, timedelta
+from ..codec import yaml_load
+from ..dates import parse_datetime
 from ..log_config import logger
 
 import os
-import dateparser
-import yaml
 from dateutil.relativedelta import relativedelta
 
 
@@ -15,7 +15,7 @@ def estimate_future_conferences(conferences, end_in_years=2, max_approximations=
         logger.info(f"too few past deadlines for future estimation of {list(conferences.keys())}")
         return {}
 
-    deadlines = [dateparser.parse(dl) if isinstance(dl, str) else dl for dl in deadlines]
+    deadlines = [parse_datetime(dl) if isinstance(dl, str) else dl for dl in deadlines]
     deadlines = [dl for dl in deadlines if dl is not None]
     deadlines = sorted(deadlines, key=lambda x: x.year)
     deltas = []
@@ -25,7 +25,7 @@ def estimate_future_conferences(conferences, end_in_years=2, max_approximations=
         deltas.append(years)
     yearly_rythm = max([round(sum(deltas) / len(deltas)), 1])
     last_conf = max(list(real_conferences.values()), key=lambda x: x["conferenceStartDate"])
-    last_start = dateparser.parse(last_conf["conferenceStartDate"])
+    last_start = parse_datetime(last_conf["conferenceStartDate"])
     next_year = last_start.year + yearly_rythm
 
     future_conferences = {}
@@ -53,7 +53,7 @@ def estimate_future_conferences(conferences, end_in_years=2, max_approximations=
                 if "deadline" in key.lower():
                     old_date = dates[key]
                     if isinstance(old_date, str):
-                        old_date = dateparser.parse(old_date)
+                        old_date = parse_datetime(old_date)
                     next_timeline[key] = old_date + relativedelta(years=next_year - last_start.year)
                 elif key == "note":
                     next_timeline[key] = f"From {last_conf['shortname']}: {dates[key]}"
@@ -80,12 +80,12 @@ def estimate_future_conferences(conferences, end_in_years=2, max_approximations=
 if __name__ == "__main__":
     this_folder = os.path.dirname(__file__)
     with open(os.path.join(this_folder, os.pardir, os.pardir, "conferences", "wacv.yaml")) as f:
-        wacvs = yaml.safe_load(f)
+        wacvs = yaml_load(f)
     for conf in wacvs.values():
         for dates in conf["timeline"]:
             for key in dates:
                 if "deadline" in key:
-                    dates[key] = dateparser.parse(dates[key])
+                    dates[key] = parse_datetime(dates[key])
     logger.info(wacvs)
     logger.info(f"Keys: {wacvs.keys()}")
     future = estimate_future_conferences(wacvs, end_in_years=4, max_approximations=4)
@@ -1,5 +1,6 @@
 import re
 
+from ..dates import parse_date_range
 from ..log_config import logger
 from .http import fetch_soup
 
@@ -32,23 +33,6 @@ def _parse_submission_deadlines(soup, data):
             data["timeline"][round_idx]["deadline"] = ":".join(txt.split(":")[1:]).split("(")[0].strip()
 
 
-def _split_session_dates(date_text):
-    """Split a 'Jan 6th - 8th' / 'Feb 28 - Mar 3' range into (start, end), or None.
-
-    The end borrows the start's month when it omits one; the year is appended later by
-    parse_all_times from the conference id.
-    """
-    sep = next((s for s in ("–", "—", "-") if s in date_text), None)
-    if sep is None:
-        return None
-    start, end = (part.strip() for part in date_text.split(sep, 1))
-    if not start or not end:
-        return None
-    if end[:1].isdigit():  # end omits the month -> borrow it from the start
-        end = f"{start.split(' ')[0]} {end}"
-    return start, end
-
-
 def _parse_dates_fallback(year, data):
     """Fall back to the thecvf 'Dates' table, which labels each round explicitly."""
     url = f"https://wacv.thecvf.com/Conferences/{year}/"
@@ -63,7 +47,7 @@ def _parse_dates_fallback(year, data):
         tds = row.find_all("td")
         # The "Main Conference Session(s)" row carries the event dates in the next cell.
         if len(tds) >= 2 and "main conference" in tds[0].get_text().lower():
-            session_dates = _split_session_dates(tds[1].get_text(" ", strip=True))
+            session_dates = parse_date_range(tds[1].get_text(" ", strip=True), year)
             if session_dates is not None:
                 data["conferenceStartDate"], data["conferenceEndDate"] = session_dates
         for i, td in enumerate(tds):
@@ -0,0 +1,138 @@
+"""The update pipeline (update, validate, export) in one process.
+
+``update.py`` used to run ``update_data``, ``validate`` and ``data_to_json`` as three
+``python3 -m`` subprocesses. Each paid for interpreter start-up and its imports (dateparser,
+bs4, requests), and each loaded ``conferences/`` again, parsing the files the previous one had
+just written. A ``Pipeline`` runs the stages as calls and hands their state on:
+
+- ``update`` post-processes and writes the conference files, keeping what it wrote (its own
+  steps run concurrently where they can, see ``update_data.update``);
+- ``validate`` loads the store once, with the written files handed over rather than parsed
+  (see ``ConferenceStore.load``), and validates the change set;
+- ``export`` publishes that same store and change set.
+
+A caller that keeps state between runs (``serve_pipeline``) can hand in its ``store``, which
+is then reloaded rather than loaded (see ``ConferenceStore.reload``), and its CORE table.
+
+Each stage returns whether it succeeded, logging (instead of raising) what made it fail, and
+``timings`` records how long it took. By default every group is post-processed and the whole
+corpus is validated and published, as ``update.py`` does; ``incremental`` and a change set
+(``since``, e.g. ``LAST_PUBLISHED``) restrict a run to what changed. ``python3 -m
+aideadlines.pipeline`` runs all three; it exits non-zero if a stage failed, and it stops
+before exporting when validation fails.
+"""
+
+import argparse
+import sys
+import time
+
+from . import data_to_json, update_data, validate
+from .changeset import add_changeset_args, resolve_changeset
+from .crawl_schedule import DEFAULT_BUDGET
+from .dates import log_stats
+from .log_config import logger
+from .store import load_store
+
+
+class Pipeline:
+    """State shared by the stages of one run."""
+
+    def __init__(self, online=False, incremental=False, changed=None, since=None, compact=False, historic=False,
+                 reestimate=False, load_nino_data=False, pull=None, fetch_budget=DEFAULT_BUDGET, store=None,
+                 core_ranks=None):
+        self.update_args = argparse.Namespace(historic=historic, online=online, write=True, reestimate=reestimate,
+                                              load_nino_data=load_nino_data, incremental=incremental,
+                                              fetch_budget=fetch_budget)
+        self.changeset_args = argparse.Namespace(changed=changed, since=since)
+        self.pull = pull  # e.g. ``git pull``, run by ``update`` alongside the online fetches
+        self.compact = compact
+        self.written = {}  # {group: (sha256, records)} written by ``update``
+        self.warm_store = store
+        self.core_ranks = core_ranks
+        self.store = None
+        self.changed_files = None
+        self.timings = {}
+
+    def _stage(self, name, run):
+        start = time.perf_counter()
+        try:
+            ok = run()
+        except Exception:
+            logger.exception(f"pipeline stage {name} failed")
+            ok = False
+        self.timings[name] = time.perf_counter() - start
+        logger.info(f"pipeline stage {name} {'done' if ok else 'FAILED'} in {self.timings[name]:.2f}s")
+        return ok
+
+    def _load(self):
+        """The store of ``conferences/``, loaded once per run (after ``update`` has written)."""
+        if self.store is None:
+            primed = {f"{group}.yaml": entry for group, entry in self.written.items()}
+            if self.warm_store is not None:
+                self.store = self.warm_store.reload(primed=primed)
+            else:
+                self.store = load_store(primed=primed)
+            self.changed_files = resolve_changeset(self.changeset_args)
+        return self.store
+
+    def update(self):
+        def run():
+            self.written.clear()
+            self.store = None
+            update_data.update(self.update_args, self.written, pull=self.pull, timings=self.timings,
+                               core_ranks=self.core_ranks)
+            return True
+        return self._stage("update", run)
+
+    def validate(self):
+        def run():
+            store = self._load()
+            problems = validate.validate_store(store, self.changed_files)
+            log_stats()
+            return validate.report(problems)
+        return self._stage("validate", run)
+
+    def export(self):
+        def run():
+            store = self._load()
+            return data_to_json.publish(self.changed_files, compact=self.compact, store=store)
+        return self._stage("export", run)
+
+    def run(self):
+        """Every stage in order; returns whether all of them succeeded."""
+        ok = self.update()
+        if not self.validate():
+            logger.error("conference validation failed; not exporting")
+            return False
+        return self.export() and ok
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--online", default=False, action=argparse.BooleanOptionalAction, help="Download data from the internet"
+    )
+    parser.add_argument(
+        "--incremental", default=False, action=argparse.BooleanOptionalAction,
+        help="Only post-process groups that changed since the last write",
+    )
+    add_changeset_args(parser)
+    parser.add_argument(
+        "--compact", default=False, action=argparse.BooleanOptionalAction, help="Also publish the compact encoding"
+    )
+    parser.add_argument(
+        "--fetch-budget", type=int, default=DEFAULT_BUDGET, help="At most this many official-website pages per run"
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    pipeline = Pipeline(online=args.online, incremental=args.incremental, changed=args.changed, since=args.since,
+                        compact=args.compact, fetch_budget=args.fetch_budget)
+    if not pipeline.run():
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+"""Prerender the first screen of ``index.html`` from the published records.
+
+The page used to show a spinner until ``loadInitialData`` in scripts.js had fetched and
+parsed ``conferences.json`` and built every card. The site build (``build_site``) now runs
+this on the template instead of copying it, so the served page already contains:
+
+- the first ``FIRST_SCREEN`` upcoming cards of the default view (minimum rating from the
+  template's ``minRating`` select, estimated deadlines shown, ordered by deadline);
+- the "deadline to watch" block and the hero stats;
+- a ``<script id="initialData" type="application/json">`` holding exactly the records of those
+  cards and the id of the one to watch.
+
+scripts.js hydrates that: it attaches countdowns to the prerendered cards instead of
+rebuilding them, and loads the full data after first paint. The markup mirrors
+``createConferenceCard`` and ``renderNextUp``; dates are written in en-US and the card's
+timezone, and replaced with the visitor's locale once the full data has loaded.
+
+The template marks each filled region with ``<!-- prerender:name -->...<!-- /prerender:name -->``.
+
+    python3 -m aideadlines.prerender html/index.html
+"""
+
+import argparse
+import html
+import math
+import os
+import re
+import sys
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from .codec import json_dumps, json_load
+from .data_to_json import DATA_FOLDER, FUTURE_FILE, RATING_ORDINALS
+from .log_config import logger
+
+TEMPLATE = os.path.join(os.path.dirname(__file__), "index.html")
+FIRST_SCREEN = 12  # cards; matches the entrance-animation stagger cap in scripts.js
+DAY_MS = 24 * 60 * 60 * 1000
+WATCH_TAU_DAYS = 30  # WATCH_TAU_DAYS in scripts.js
+
+_US_ZONE_NAMES = frozenset(("UTC", "EST", "EDT", "CST", "CDT", "MST", "MDT", "PST", "PDT", "AKST", "AKDT", "HST"))
+_MIN_RATING_RE = re.compile(r'<select id="minRating".*?<option value="([^"]*)" selected>', re.S)
+_LOADING = '<div id="loadingState" class="loading-container"'
+_NEXT_UP_TOP = """
+          <div class="next-up-top">
+            <span class="next-up-label"><span class="led" aria-hidden="true"></span> Deadline to watch</span>
+          </div>"""
+ICON_PIN = ('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 20 20" fill="currentColor"><path fill-rule="evenodd" '
+            'd="M9.69 18.933l.003.001C9.89 19.02 10 19 10 19s.11.02.308-.066l.002-.001.006-.003.018-.008a5.741 5.741 0 '
+            '00.281-.145l.002-.001L10 18.43l-5.192-5.192a6.875 6.875 0 010-9.719l.001-.001c2.7-2.7 7.075-2.7 9.774 0l.001.001a6.875 '
+            '6.875 0 010 9.719L10 18.43zM10 11a2 2 0 100-4 2 2 0 000 4z" clip-rule="evenodd" /></svg>')
+ICON_CAL = ('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 20 20" fill="currentColor"><path fill-rule="evenodd" '
+            'd="M5.75 3A2.25 2.25 0 003.5 5.25v9.5A2.25 2.25 0 005.75 17h8.5A2.25 2.25 0 0016.5 14.75v-9.5A2.25 2.25 0 0014.25 '
+            '3h-8.5zM5 5.25c0-.414.336-.75.75-.75h8.5c.414 0 .75.336.75.75v9.5c0 .414-.336.75-.75.75h-8.5a.75.75 0 '
+            '01-.75-.75v-9.5z" clip-rule="evenodd" /><path d="M7 8.5h2v2H7v-2zm0 3h2v2H7v-2zm4-3h2v2h-2v-2z" /></svg>')
+
+
+def escape(value):
+    """``escapeHtml`` in scripts.js."""
+    return "" if value is None else html.escape(str(value), quote=True).replace("&#x27;", "&#39;")
+
+
+def safe_href(url):
+    """``safeHref`` in scripts.js: the URL if it is http(s), else None."""
+    if not isinstance(url, str) or not re.match(r"https?://", url.strip(), re.I):
+        return None
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return None
+    if parts.scheme.lower() not in ("http", "https") or not parts.netloc:
+        return None
+    return parts._replace(path=parts.path or "/").geturl()  # like URL.href: 'http://a.org' -> 'http://a.org/'
+
+
+def _zone(name):
+    try:
+        return ZoneInfo(name or "UTC")
+    except (ZoneInfoNotFoundError, ValueError):
+        return timezone.utc
+
+
+def _zone_name(moment, tz):
+    """``timeZoneName: 'short'`` in en-US: US abbreviations and UTC by name, other zones as 'GMT+1'."""
+    if tz == "Etc/GMT+12":  # Anywhere on Earth
+        return "AoE"
+    name = moment.tzname()
+    if name in _US_ZONE_NAMES:
+        return name
+    minutes = round(moment.utcoffset().total_seconds() / 60)
+    if not minutes:
+        return "UTC"
+    hours, rest = divmod(abs(minutes), 60)
+    return f"GMT{'+' if minutes > 0 else '-'}{hours}{f':{rest:02d}' if rest else ''}"
+
+
+def format_date(value, tz="UTC", include_time=False, month_year_only=False):
+    """``formatDate`` in scripts.js, in en-US."""
+    if not value:
+        return "N/A"
+    text = value if ("T" in value or value.endswith("Z")) else value + "T00:00:00Z"
+    try:
+        moment = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        return "Invalid Date"
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    moment = moment.astimezone(_zone(tz))
+    if month_year_only:
+        return f"{moment:%b} {moment.year}"
+    out = f"{moment:%b} {moment.day}, {moment.year}"
+    if include_time:
+        out += f", {moment:%I:%M %p} {_zone_name(moment, tz)}"
+    return out
+
+
+def _urgency(time_left_ms):
+    """``urgencyClassFor`` in scripts.js."""
+    if time_left_ms <= 0:
+        return "is-past"
+    days = time_left_ms / DAY_MS
+    return "is-critical" if days < 1 else "is-soon" if days < 7 else "is-upcoming" if days < 30 else ""
+
+
+def _urgency_badge(record, now_ms):
+    """``getUrgencyBadge`` in scripts.js."""
+    days = (record["deadlineMs"] - now_ms) / DAY_MS
+    if days <= 0:
+        return ""
+    label = "Less than 24h" if days < 1 else "Due this week" if days < 7 else "Due this month" if days < 30 else None
+    return f'<span class="urgency-badge">{label}</span>' if label else ""
+
+
+def card(record, now_ms):
+    """The markup ``createConferenceCard`` builds for ``record``, without the countdowns."""
+    approx = bool(record.get("isApproximateDeadline"))
+    tz = record.get("timezone") or "UTC"
+    classes = ["conf-card", "no-enter"] + (["is-approx"] if approx else [_urgency(record["deadlineMs"] - now_ms)])
+
+    eyebrow = []
+    if record.get("rating"):
+        top = " rank-top" if record.get("ratingOrdinal", 0) >= RATING_ORDINALS["A"] else ""
+        eyebrow.append(f'<span class="conf-rank{top}">CORE&nbsp;<b>{escape(record["rating"])}</b></span>')
+    if "h5Index" in record:
+        eyebrow.append(f'<span class="conf-rank">h5&nbsp;<b>{escape(record["h5Index"])}</b></span>')
+    eyebrow_html = f'<div class="conf-eyebrow">{"".join(eyebrow)}</div>' if eyebrow else ""
+
+    shortname, title = escape(record.get("shortname")), escape(record.get("title"))
+    if shortname and title:
+        title_html = f'<h2 class="conf-title">{shortname}<span class="full">{title}</span></h2>'
+    else:
+        title_html = f'<h2 class="conf-title">{shortname or title}</h2>' if shortname or title else ""
+
+    if approx:
+        dates = f"~{format_date(record.get('conferenceStartDate'), tz, month_year_only=True)}"
+    else:
+        dates = format_date(record.get("conferenceStartDate"), tz)
+        end = record.get("conferenceEndDate")
+        if end and end != record.get("conferenceStartDate"):
+            dates += f" – {format_date(end, tz)}"
+    meta = ""
+    if record.get("location"):
+        meta += f'<div class="conf-meta-row">{ICON_PIN}<span>{escape(record["location"])}</span></div>'
+    if record.get("conferenceStartDate"):
+        meta += f'<div class="conf-meta-row">{ICON_CAL}<span>{dates}</span></div>'
+    meta_html = f'<div class="conf-meta">{meta}</div>' if meta else ""
+
+    badge = "" if approx else _urgency_badge(record, now_ms)
+    tags = record.get("tags") or []
+    tags_html = ""
+    if tags or badge:
+        spans = "".join(f'<span class="conf-tag">{escape(tag)}</span>' for tag in tags)
+        tags_html = f'<div class="conf-tags">{spans}{badge}</div>'
+    note_html = f'<p class="conf-note">{escape(record["note"])}</p>' if record.get("note") else ""
+
+    def deadline_text(value):
+        if approx:
+            return f"~{format_date(value, tz, month_year_only=True)} (est.)"
+        return format_date(value, tz, include_time=True)
+
+    record_id = escape(record["id"])
+    abstract_html = ""
+    if record.get("abstractDeadline"):
+        abstract_text = deadline_text(record["abstractDeadline"])
+        abstract_html = f"""
+      <div id="countdown-abstract-{record_id}" class="deadline-section"></div>
+      <p class="deadline-date-text">Abstract: <b>{abstract_text}</b></p>"""
+    href = safe_href(record.get("website"))
+    if approx:
+        cta = '<span class="conf-cta disabled">Estimated — no site yet</span>'
+    elif not href:
+        cta = '<span class="conf-cta disabled">Site not available</span>'
+    else:
+        cta = f'<a href="{escape(href)}" target="_blank" rel="noopener noreferrer" class="conf-cta">Visit site <span class="arrow">→</span></a>'
+
+    class_names = " ".join(name for name in classes if name)
+    main_text = deadline_text(record.get("deadline"))
+    return f"""<div id="card-{record_id}" class="{class_names}" tabindex="0">
+    <div>
+      {eyebrow_html}
+      {title_html}
+      {meta_html}
+      {tags_html}
+      {note_html}
+    </div>
+    <div class="conf-foot">
+      <div id="countdown-deadline-{record_id}" class="deadline-section"></div>
+      <p class="deadline-date-text">Deadline: <b>{main_text}</b></p>
+      {abstract_html}
+      {cta}
+    </div></div>"""
+
+
+def first_screen(records, now_ms, min_rating="", count=FIRST_SCREEN):
+    """The records of the first ``count`` cards of the default view (``renderConferences``)."""
+    threshold = RATING_ORDINALS.get(min_rating, 0)
+    shown = [record for record in records if record.get("ratingOrdinal", 0) >= threshold]
+    shown.sort(key=lambda record: (record["deadlineMs"] < now_ms, record["deadlineMs"]))
+    return shown[:count]
+
+
+def next_deadline(records, now_ms):
+    """``pickNextDeadline`` in scripts.js: the confirmed deadline most worth watching."""
+    best, best_score = None, -math.inf
+    for record in records:
+        if record.get("isApproximateDeadline") or not record.get("deadline"):
+            continue
+        days = (record["deadlineMs"] - now_ms) / DAY_MS
+        if days <= 0:
+            continue
+        score = record.get("importance", 1) * math.exp(-days / WATCH_TAU_DAYS)
+        if score > best_score:
+            best, best_score = record, score
+    return best
+
+
+def next_up(record):
+    """The inner markup ``renderNextUp`` builds for ``record`` (None: nothing to watch)."""
+    if record is None:
+        return (f"{_NEXT_UP_TOP}\n          <p class=\"next-up-empty\">No upcoming confirmed deadlines right now. "
+                "Enable “Show estimated” to see what's coming.</p>\n        ")
+    name = escape(record.get("shortname") or record.get("title") or "Conference")
+    when = format_date(record["deadline"], record.get("timezone") or "UTC", include_time=True)
+    return (f'{_NEXT_UP_TOP}\n          <div class="next-up-name">{name}</div>\n'
+            f'          <div class="next-up-sub">Paper submission · {when}</div>\n'
+            '          <div class="next-up-clock" id="nextUpClock" aria-hidden="true"></div>\n        ')
+
+
+def _fill(page, name, content):
+    start, end = f"<!-- prerender:{name} -->", f"<!-- /prerender:{name} -->"
+    before, found, rest = page.partition(start)
+    _, found_end, after = rest.partition(end)
+    if not found or not found_end:
+        raise ValueError(f"the template has no {start}...{end} region")
+    return f"{before}{start}{content}{end}{after}"
+
+
+def inline_json(value):
+    """``value`` as JSON that is safe inside a ``<script>`` element."""
+    return json_dumps(value).decode().replace("<", "\\u003c").replace("\u2028", "\\u2028").replace("\u2029", "\\u2029")
+
+
+def prerender(template, records, now_ms):
+    """The page ``template`` with the first screen rendered from the upcoming ``records``."""
+    match = _MIN_RATING_RE.search(template)
+    shown = first_screen(records, now_ms, match.group(1) if match else "")
+    watch = next_deadline(records, now_ms)
+    week = sum(1 for record in records if not record.get("isApproximateDeadline") and record.get("deadline")
+               and 0 < record["deadlineMs"] - now_ms < 7 * DAY_MS)
+
+    page = _fill(template, "grid", "".join(card(record, now_ms) for record in shown))
+    page = _fill(page, "nextUp", next_up(watch))
+    page = _fill(page, "initialData", '<script id="initialData" type="application/json">' + inline_json({
+        "records": shown,
+        "nextUp": watch["id"] if watch else None,
+    }) + "</script>")
+    for stat, value in (("statTracked", len(records)), ("statWeek", week)):
+        placeholder = f'<span class="n" id="{stat}">—</span>'
+        if placeholder not in page:
+            raise ValueError(f"the template has no {stat} placeholder")
+        page = page.replace(placeholder, f'<span class="n" id="{stat}">{value}</span>')
+    if _LOADING not in page:
+        raise ValueError("the template has no loadingState element")
+    return page.replace(_LOADING, f'{_LOADING} style="display:none"')
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("output", help="Where to write the prerendered page")
+    parser.add_argument("--template", default=TEMPLATE, help="The page to prerender")
+    parser.add_argument("--data", default=os.path.join(DATA_FOLDER, FUTURE_FILE), help="The upcoming deadlines")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    with open(args.template, encoding="utf-8") as f:
+        template = f.read()
+    try:
+        with open(args.data, "rb") as f:
+            records = json_load(f)
+    except OSError as e:
+        logger.error(f"can't prerender without the data: {e}")
+        sys.exit(1)
+    if records and "deadlineMs" not in records[0]:
+        logger.error(f"{args.data} predates the precomputed record fields; rerun data_to_json")
+        sys.exit(1)
+    now_ms = round(datetime.now(timezone.utc).timestamp() * 1000)
+    page = prerender(template, records, now_ms)
+    tmp = args.output + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(page)
+    os.replace(tmp, args.output)
+    logger.info(f"prerendered {min(len(records), FIRST_SCREEN)} of {len(records)} upcoming deadlines "
+                f"into {args.output} ({len(page.encode())} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,11 @@ import os
 import re
 from datetime import datetime, timedelta
 
-import dateparser
 import requests
-import yaml
 from bs4 import BeautifulSoup
 
+from .codec import yaml_dump, yaml_load
+from .dates import parse_datetime
 from .log_config import logger
 
 this_folder = os.path.dirname(__file__)
@@ -16,7 +16,7 @@ def make_conf_rank_function():
     # Google Scholar blocks scraping, so h5 values are read from the committed YAML only.
     h5_file = os.path.join(this_folder, os.pardir, "rank", "h5index.yaml")
     with open(h5_file, "r") as f:
-        _short_to_h5 = yaml.safe_load(f)
+        _short_to_h5 = yaml_load(f)
     logger.info(f"got {len(_short_to_h5)} conference h5 values", flush=True)
 
     def add_h5(conf):
@@ -49,43 +49,46 @@ def _get_core_rank(shortname):
     return None
 
 
-def make_core_rank_function(conference_groups, online=True, force_update=False):
-    core_save_file = os.path.join(this_folder, os.pardir, "rank", "core.yaml")
-    if os.path.isfile(core_save_file):
-        with open(core_save_file, "r") as f:
-            core_ranks = yaml.safe_load(f)
-        if core_ranks is None:
-            core_ranks = {}
-    else:
-        core_ranks = {}
-        force_update = True
-
-    last_update_file = os.path.join(this_folder, "data", ".last_core_update")
-    if not os.path.isfile(last_update_file):
-        force_update = True
-    else:
-        with open(last_update_file, "r") as f:
-            last_update = dateparser.parse(f.read().strip())
-
-        if last_update is None:
-            force_update = True
-        else:
-            force_update = force_update or last_update + timedelta(days=1) < datetime.now()
-
-    if force_update and online:
-        logger.info(f"Updating core ranks for {len(conference_groups)} conferences")
-
-        for i, group in enumerate(conference_groups):
-            rank = _get_core_rank(group)
-            if rank is not None:
-                core_ranks[group] = rank
-                logger.info(f"{i+1}/{len(conference_groups)}: {group} -> {rank}")
-
-        with open(core_save_file, "w") as f:
-            yaml.safe_dump(core_ranks, f)
-        with open(last_update_file, "w") as f:
-            f.write(datetime.now().isoformat())
+CORE_SAVE_FILE = os.path.join(this_folder, os.pardir, "rank", "core.yaml")
+LAST_CORE_UPDATE_FILE = os.path.join(this_folder, "data", ".last_core_update")
+
+
+def load_core_ranks():
+    """``{group: CORE rank}`` as last saved; empty if there is no table yet."""
+    if not os.path.isfile(CORE_SAVE_FILE):
+        return {}
+    with open(CORE_SAVE_FILE, "r") as f:
+        return yaml_load(f) or {}
+
+
+def core_update_due(force_update=False):
+    """Whether the CORE table is missing or more than a day old."""
+    if force_update or not os.path.isfile(CORE_SAVE_FILE) or not os.path.isfile(LAST_CORE_UPDATE_FILE):
+        return True
+    with open(LAST_CORE_UPDATE_FILE, "r") as f:
+        last_update = parse_datetime(f.read().strip())
+    return last_update is None or last_update + timedelta(days=1) < datetime.now()
+
+
+def update_core_ranks(conference_groups, core_ranks):
+    """Look ``conference_groups`` up on the CORE portal and save the updated table."""
+    conference_groups = list(conference_groups)
+    logger.info(f"Updating core ranks for {len(conference_groups)} conferences")
 
+    for i, group in enumerate(conference_groups):
+        rank = _get_core_rank(group)
+        if rank is not None:
+            core_ranks[group] = rank
+            logger.info(f"{i+1}/{len(conference_groups)}: {group} -> {rank}")
+
+    with open(CORE_SAVE_FILE, "w") as f:
+        yaml_dump(core_ranks, f)
+    with open(LAST_CORE_UPDATE_FILE, "w") as f:
+        f.write(datetime.now().isoformat())
+    return core_ranks
+
+
+def core_rank_function(core_ranks):
     def add_core_rank(conf):
         conf_id = conf["id"][:-4]
 
@@ -95,3 +98,10 @@ def make_core_rank_function(conference_groups, online=True, force_update=False):
         return conf
 
     return add_core_rank
+
+
+def make_core_rank_function(conference_groups, online=True, force_update=False):
+    core_ranks = load_core_ranks()
+    if online and core_update_due(force_update):
+        update_core_ranks(conference_groups, core_ranks)
+    return core_rank_function(core_ranks)
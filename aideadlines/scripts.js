@@ -63,6 +63,9 @@ if (themeToggle) {
 // --- Application State ---
 let upcomingConferencesData = [];
 let archiveConferencesData = null;
+// Prebuilt search indexes (data/*.index.json), resolved against the loaded records.
+let upcomingSearchIndex = null;
+let archiveSearchIndex = null;
 let nextUpConference = null;
 
 // Live (non-approximate) cards currently in the DOM. A single global ticker updates all
@@ -70,6 +73,11 @@ let nextUpConference = null;
 // meant ~100 timers each rewriting innerHTML every second).
 let liveCards = [];
 
+// Set while the grid shows prerendered cards (see aideadlines/prerender.py): the first
+// render from the full data replaces cards that are already on screen, so it skips the
+// entrance animation.
+let suppressCardEntrance = false;
+
 let currentFilterSettings = {
   selectedTags: new Set(["ALL"]),
   showPast: false,
@@ -81,6 +89,30 @@ let currentFilterSettings = {
 
 const ratingOrder = { "A*": 5, "A": 4, "B": 3, "C": 2, "D": 1 };
 
+// Records of schema 2 (see `precompute` in aideadlines/data_to_json.py) carry epoch
+// milliseconds, a rating ordinal and a static importance score, so filtering and sorting
+// compare integers. Older data falls back to parsing.
+function deadlineMs(c) {
+  return c.deadlineMs ?? new Date(c.deadline).getTime();
+}
+
+function abstractDeadlineMs(c) {
+  return c.abstractDeadlineMs ?? new Date(c.abstractDeadline).getTime();
+}
+
+function ratingOrdinal(c) {
+  return c.ratingOrdinal ?? (ratingOrder[c.rating] || 0);
+}
+
+// When the event ends: its last day, or the deadline when there's no end date.
+function eventEndMs(c) {
+  if (c.conferenceEndMs !== undefined) return c.conferenceEndMs;
+  if (!c.conferenceEndDate && c.deadline) return deadlineMs(c);
+  const dateStr = c.conferenceEndDate || c.conferenceStartDate;
+  if (!dateStr) return null;
+  return new Date(dateStr.includes('T') ? dateStr : dateStr + 'T23:59:59Z').getTime();
+}
+
 // --- Utility Functions ---
 // Conference data is community-contributed and scraped from arbitrary sites, so every
 // value interpolated into innerHTML must be escaped, and any URL used in an href must be
@@ -150,10 +182,10 @@ function urgencyClassFor(timeLeftMs) {
   return ''; // far away → calm "cool" default
 }
 
-function applyUrgency(card, deadlineStr) {
+function applyUrgency(card, targetMs) {
   // Only swap the urgency modifier so the entrance animation never restarts.
   card.classList.remove(...URGENCY_CLASSES);
-  const u = urgencyClassFor(new Date(deadlineStr).getTime() - Date.now());
+  const u = urgencyClassFor(targetMs - Date.now());
   if (u) card.classList.add(u);
 }
 
@@ -164,7 +196,7 @@ function proximityPercent(timeLeftMs) {
 }
 
 function getUrgencyBadge(conference) {
-  const timeLeft = new Date(conference.deadline).getTime() - Date.now();
+  const timeLeft = deadlineMs(conference) - Date.now();
   if (timeLeft <= 0) return '';
   const days = timeLeft / DAY_MS;
   if (days < 1) return '<span class="urgency-badge">Less than 24h</span>';
@@ -185,11 +217,11 @@ function breakdown(timeLeftMs) {
   };
 }
 
-function updateSpecificCountdown(targetDateStr, countdownElementId, label, isApproximate = false) {
+function updateSpecificCountdown(targetMs, countdownElementId, label, isApproximate = false) {
   const el = document.getElementById(countdownElementId);
   if (!el) return;
 
-  const timeLeft = new Date(targetDateStr).getTime() - Date.now();
+  const timeLeft = targetMs - Date.now();
 
   if (timeLeft <= 0) {
     const passedLabel = isApproximate ? `${label} (est.) passed` : `${label} passed`;
@@ -221,11 +253,11 @@ function updateSpecificCountdown(targetDateStr, countdownElementId, label, isApp
     </div>`;
 }
 
-function updateSmallCountdown(targetDateStr, countdownElementId, label) {
+function updateSmallCountdown(targetMs, countdownElementId, label) {
   const el = document.getElementById(countdownElementId);
   if (!el) return;
 
-  const timeLeft = new Date(targetDateStr).getTime() - Date.now();
+  const timeLeft = targetMs - Date.now();
   if (timeLeft <= 0) {
     el.innerHTML = `<div class="ended-banner">${label} passed</div>`;
     return;
@@ -286,7 +318,7 @@ const ICON_CAL = `<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 20 20" fi
 function createConferenceCard(conference, index = 0) {
   const card = document.createElement('div');
   card.id = `card-${conference.id}`;
-  card.className = 'conf-card' + (conference.isApproximateDeadline ? ' is-approx' : '');
+  card.className = 'conf-card' + (conference.isApproximateDeadline ? ' is-approx' : '') + (suppressCardEntrance ? ' no-enter' : '');
   card.style.animationDelay = `${Math.min(index, 12) * 45}ms`;
   card.tabIndex = 0;
 
@@ -298,7 +330,7 @@ function createConferenceCard(conference, index = 0) {
   // eyebrow: CORE rating + h5-index
   let eyebrowParts = [];
   if (conference.rating) {
-    const top = ratingOrder[conference.rating] >= ratingOrder['A'];
+    const top = ratingOrdinal(conference) >= ratingOrder['A'];
     eyebrowParts.push(`<span class="conf-rank${top ? ' rank-top' : ''}">CORE&nbsp;<b>${escapeHtml(conference.rating)}</b></span>`);
   }
   if (conference.h5Index !== undefined) {
@@ -351,7 +383,6 @@ function createConferenceCard(conference, index = 0) {
   const noteHTML = conference.note ? `<p class="conf-note">${escapeHtml(conference.note)}</p>` : '';
 
   // ---- foot: countdown + deadline line + abstract + CTA ----
-  const deadlineLabel = isApprox ? 'Est. paper deadline' : 'Paper deadline';
   const mainDeadlineFmt = isApprox ? approxDateFormatting : preciseDeadlineFormat;
   const mainDeadlineText = (isApprox ? '~' : '') + formatDate(conference.deadline, mainDeadlineFmt);
   const deadlineLineHTML =
@@ -391,25 +422,31 @@ function createConferenceCard(conference, index = 0) {
       ${ctaHTML}
     </div>`;
   conferenceGrid.appendChild(card);
+  activateCard(card, conference);
+}
 
-  if (!isApprox) applyUrgency(card, conference.deadline);
+// Fills a card's countdowns and registers it for the global ticker (instead of spinning up
+// a per-card interval). Also used for the prerendered cards, which arrive without countdowns.
+function activateCard(card, conference) {
+  const isApprox = conference.isApproximateDeadline || false;
+  const deadlineLabel = isApprox ? 'Est. paper deadline' : 'Paper deadline';
+  if (!isApprox) applyUrgency(card, deadlineMs(conference));
 
-  updateSpecificCountdown(conference.deadline, `countdown-deadline-${conference.id}`, deadlineLabel, isApprox);
+  updateSpecificCountdown(deadlineMs(conference), `countdown-deadline-${conference.id}`, deadlineLabel, isApprox);
   if (conference.abstractDeadline && !isApprox) {
-    updateSmallCountdown(conference.abstractDeadline, `countdown-abstract-${conference.id}`, 'Abstract');
+    updateSmallCountdown(abstractDeadlineMs(conference), `countdown-abstract-${conference.id}`, 'Abstract');
   }
 
-  // Register for the global ticker instead of spinning up a per-card interval.
   if (!isApprox) liveCards.push({ card, conference, deadlineLabel });
 }
 
 // One timer drives every live card's countdown + urgency colour.
 function tickLiveCards() {
   for (const { card, conference, deadlineLabel } of liveCards) {
-    applyUrgency(card, conference.deadline);
-    updateSpecificCountdown(conference.deadline, `countdown-deadline-${conference.id}`, deadlineLabel, false);
+    applyUrgency(card, deadlineMs(conference));
+    updateSpecificCountdown(deadlineMs(conference), `countdown-deadline-${conference.id}`, deadlineLabel, false);
     if (conference.abstractDeadline) {
-      updateSmallCountdown(conference.abstractDeadline, `countdown-abstract-${conference.id}`, 'Abstract');
+      updateSmallCountdown(abstractDeadlineMs(conference), `countdown-abstract-${conference.id}`, 'Abstract');
     }
   }
 }
@@ -423,13 +460,14 @@ const RATING_WEIGHT = { "A*": 8, "A": 5, "B": 3, "C": 1, "D": 0.5 };
 const WATCH_TAU_DAYS = 30; // patience for prestige — larger looks further ahead
 
 function conferenceImportance(c) {
+  if (c.importance !== undefined) return c.importance;
   let score = RATING_WEIGHT[c.rating] ?? 1; // unrated → treat as ~C
   if (typeof c.h5Index === 'number') score += c.h5Index / 120;
   return score;
 }
 
 function watchScore(c, now) {
-  const days = (new Date(c.deadline).getTime() - now) / DAY_MS;
+  const days = (deadlineMs(c) - now) / DAY_MS;
   if (days <= 0) return -Infinity;
   return conferenceImportance(c) * Math.exp(-days / WATCH_TAU_DAYS);
 }
@@ -474,7 +512,7 @@ function renderNextUp() {
 
 function updateNextUp() {
   if (!nextUpConference || !nextUpEl) return;
-  const timeLeft = new Date(nextUpConference.deadline).getTime() - Date.now();
+  const timeLeft = deadlineMs(nextUpConference) - Date.now();
 
   if (timeLeft <= 0) { renderNextUp(); return; }
 
@@ -509,7 +547,7 @@ function updateHeroStats() {
     const now = Date.now();
     const count = upcomingConferencesData.filter(c => {
       if (c.isApproximateDeadline || !c.deadline) return false;
-      const t = new Date(c.deadline).getTime() - now;
+      const t = deadlineMs(c) - now;
       return t > 0 && t < 7 * DAY_MS;
     }).length;
     statWeekEl.textContent = count;
@@ -584,6 +622,73 @@ function setActiveTagButtons() {
   });
 }
 
+// --- Search Indexes ---
+// Each index (built by aideadlines/search_index.py) lists its file's record ids in deadline
+// order (`byDeadline`); tokens, tags and ratings map to ascending positions in that list.
+// Filtering intersects those position lists, and positions come out already sorted.
+async function fetchSearchIndex(url) {
+  try {
+    return await fetchJson(url);
+  } catch (error) {
+    console.warn(`Search index ${url} unavailable, filtering by scanning:`, error);
+    return null;
+  }
+}
+
+// Attach the records to an index; null when they don't match (e.g. one of them was cached).
+function resolveSearchIndex(index, records) {
+  if (!index || index.version !== 1) return null;
+  const byId = new Map(records.map(record => [record.id, record]));
+  const resolved = index.byDeadline.map(id => byId.get(id));
+  if (resolved.length !== records.length || resolved.some(record => record === undefined)) return null;
+  return { ...index, records: resolved, tokenKeys: Object.keys(index.tokens) };
+}
+
+function intersectSorted(a, b) {
+  const result = [];
+  let i = 0, j = 0;
+  while (i < a.length && j < b.length) {
+    if (a[i] < b[j]) i++;
+    else if (a[i] > b[j]) j++;
+    else { result.push(a[i]); i++; j++; }
+  }
+  return result;
+}
+
+function unionSorted(lists) {
+  return [...new Set(lists.flat())].sort((x, y) => x - y);
+}
+
+// The lower-cased words of a text, as search_index.py splits titles and shortnames into tokens.
+function searchWords(text) {
+  return (text || '').toLowerCase().match(/[\p{L}\p{N}_]+/gu) || [];
+}
+
+// Records of one index passing the name, rating and tag filters, in deadline order.
+function searchIndexed(index, nameFilterVal, minRatingVal, selectedTags) {
+  let positions = null;
+  const narrow = list => { positions = positions === null ? list : intersectSorted(positions, list); };
+  for (const word of searchWords(nameFilterVal)) {
+    narrow(unionSorted(index.tokenKeys.filter(token => token.includes(word)).map(token => index.tokens[token])));
+  }
+  if (minRatingVal && ratingOrder[minRatingVal]) {
+    const ratings = Object.keys(index.ratings).filter(r => ratingOrder[r] >= ratingOrder[minRatingVal]);
+    narrow(unionSorted(ratings.map(r => index.ratings[r])));
+  }
+  if (!selectedTags.has("ALL")) {
+    narrow(unionSorted([...selectedTags].map(tag => index.tags[tag] || [])));
+  }
+  return positions === null ? index.records : positions.map(p => index.records[p]);
+}
+
+// Filtered records, ordered by deadline, or null when an index the view needs is missing.
+function indexedConferences(shouldShowPast, nameFilterVal, minRatingVal, selectedTags) {
+  // Archive deadlines all precede upcoming ones, so archive + upcoming is in deadline order.
+  const indexes = shouldShowPast && archiveConferencesData ? [archiveSearchIndex, upcomingSearchIndex] : [upcomingSearchIndex];
+  if (indexes.some(index => index === null)) return null;
+  return indexes.flatMap(index => searchIndexed(index, nameFilterVal, minRatingVal, selectedTags));
+}
+
 // --- Main Filtering and Rendering Logic ---
 function applyAllFilters() {
   let baseData = [...upcomingConferencesData];
@@ -600,7 +705,13 @@ function applyAllFilters() {
     currentFilterSettings.showApproxFuture,
     currentFilterSettings.minH5,
     currentFilterSettings.minRating,
-    currentFilterSettings.nameFilter
+    currentFilterSettings.nameFilter,
+    indexedConferences(
+      currentFilterSettings.showPast,
+      currentFilterSettings.nameFilter,
+      currentFilterSettings.minRating,
+      currentFilterSettings.selectedTags
+    )
   );
 }
 
@@ -611,7 +722,8 @@ function renderConferences(
   shouldShowApproxFuture,
   minH5,
   minRatingVal,
-  nameFilterVal
+  nameFilterVal,
+  indexedResult = null
 ) {
   if (!conferenceGrid) return;
 
@@ -621,27 +733,26 @@ function renderConferences(
 
   if (loadingState) loadingState.style.display = 'none';
 
-  let filteredConferences = [...sourceConferenceData];
-  const now = new Date();
-
-  if (nameFilterVal) {
-    const lowerCaseFilter = nameFilterVal.toLowerCase().trim();
-    if (lowerCaseFilter) {
-      filteredConferences = filteredConferences.filter(conf =>
-        (conf.title && conf.title.toLowerCase().includes(lowerCaseFilter)) ||
-        (conf.shortname && conf.shortname.toLowerCase().includes(lowerCaseFilter))
-      );
+  // With the search indexes, the name, rating and tag filters are already applied and the
+  // records are in deadline order; otherwise scan and sort.
+  let filteredConferences = indexedResult || [...sourceConferenceData];
+  const nowTimestamp = Date.now();
+
+  if (nameFilterVal && !indexedResult) {
+    // Same matching as the index: every query word is part of a word of the title or shortname.
+    const queryWords = searchWords(nameFilterVal);
+    if (queryWords.length) {
+      filteredConferences = filteredConferences.filter(conf => {
+        const words = searchWords(`${conf.title || ''} ${conf.shortname || ''}`);
+        return queryWords.every(word => words.some(token => token.includes(word)));
+      });
     }
   }
 
   if (!shouldShowApproxFuture) {
     filteredConferences = filteredConferences.filter(conf => {
-      const eventEndDateStr = conf.conferenceEndDate || conf.deadline || conf.conferenceStartDate;
-      let isConsideredFuture = true;
-      if (eventEndDateStr) {
-        const eventEndDate = new Date(eventEndDateStr.includes('T') ? eventEndDateStr : eventEndDateStr + 'T23:59:59Z');
-        isConsideredFuture = eventEndDate >= now;
-      }
+      const endMs = eventEndMs(conf);
+      const isConsideredFuture = endMs === null || endMs >= nowTimestamp;
       return !(isConsideredFuture && conf.isApproximateDeadline);
     });
   }
@@ -655,29 +766,35 @@ function renderConferences(
     }
   }
 
-  if (minRatingVal && ratingOrder[minRatingVal]) {
+  if (minRatingVal && ratingOrder[minRatingVal] && !indexedResult) {
     const minRatingNumeric = ratingOrder[minRatingVal];
     filteredConferences = filteredConferences.filter(conf =>
-      conf.rating && ratingOrder[conf.rating] && ratingOrder[conf.rating] >= minRatingNumeric
+      ratingOrdinal(conf) >= minRatingNumeric
     );
   }
 
-  if (!currentFilterSettings.selectedTags.has("ALL")) {
+  if (!currentFilterSettings.selectedTags.has("ALL") && !indexedResult) {
     filteredConferences = filteredConferences.filter(conf =>
       conf.tags && conf.tags.some(t => currentFilterSettings.selectedTags.has(t))
     );
   }
 
-  const nowTimestamp = now.getTime();
-  filteredConferences.sort((a, b) => {
-    const deadlineA = new Date(a.deadline).getTime();
-    const deadlineB = new Date(b.deadline).getTime();
-    const aIsPastDeadline = deadlineA < nowTimestamp;
-    const bIsPastDeadline = deadlineB < nowTimestamp;
-    if (aIsPastDeadline && !bIsPastDeadline) return 1;
-    if (!aIsPastDeadline && bIsPastDeadline) return -1;
-    return deadlineA - deadlineB;
-  });
+  if (indexedResult) {
+    // Already in deadline order: just move deadlines that passed since publishing to the end.
+    const upcoming = [], past = [];
+    filteredConferences.forEach(conf => (deadlineMs(conf) < nowTimestamp ? past : upcoming).push(conf));
+    filteredConferences = upcoming.concat(past);
+  } else {
+    filteredConferences.sort((a, b) => {
+      const deadlineA = deadlineMs(a);
+      const deadlineB = deadlineMs(b);
+      const aIsPastDeadline = deadlineA < nowTimestamp;
+      const bIsPastDeadline = deadlineB < nowTimestamp;
+      if (aIsPastDeadline && !bIsPastDeadline) return 1;
+      if (!aIsPastDeadline && bIsPastDeadline) return -1;
+      return deadlineA - deadlineB;
+    });
+  }
 
   if (filteredConferences.length === 0) {
     conferenceGrid.innerHTML = `
@@ -688,17 +805,88 @@ function renderConferences(
         <h3>Nothing matches those filters</h3>
         <p>Widen the rating, clear the search, or turn on “Show estimated”.</p>
       </div>`;
+    suppressCardEntrance = false;
     return;
   }
   filteredConferences.forEach((conf, i) => createConferenceCard(conf, i));
+  suppressCardEntrance = false;
 }
 
 // --- Data Loading ---
+
+// Decodes the compact format written by `data_to_json --compact` (documented in
+// aideadlines/compact.py) back into the usual one-object-per-deadline records.
+// Both tables are column-oriented: a column is a plain array (null = field absent) or
+// {dict, index}, where each distinct value is stored once in `dict` and `index` points into it.
+// Deadline rows reference their conference by row number; `deadline` and `abstractDeadline`
+// are epoch seconds (or verbatim strings when they weren't stored as ISO timestamps).
+const COMPACT_TIME_FIELDS = new Set(['deadline', 'abstractDeadline']);
+
+function decodeCompactTable(table) {
+  const rows = Array.from({ length: table.count }, () => ({}));
+  for (const [field, column] of Object.entries(table.columns)) {
+    if (Array.isArray(column)) {
+      column.forEach((value, row) => { if (value !== null) rows[row][field] = value; });
+    } else {
+      column.index.forEach((i, row) => { if (i !== null) rows[row][field] = column.dict[i]; });
+    }
+  }
+  return rows;
+}
+
+function compactTime(value) {
+  return typeof value === 'number' ? new Date(value * 1000).toISOString().replace('.000Z', 'Z') : value;
+}
+
+function decodeCompact(data) {
+  if (data.version !== 1) throw new Error(`unsupported compact format version ${data.version}`);
+  const conferences = decodeCompactTable(data.conferences);
+  return decodeCompactTable(data.deadlines).map(({ conference, number, ...fields }) => {
+    const record = { ...conferences[conference] };
+    for (const [field, value] of Object.entries(fields)) {
+      record[field] = COMPACT_TIME_FIELDS.has(field) ? compactTime(value) : value;
+    }
+    record.id = `${record.id}-${number}`;
+    return record;
+  });
+}
+
+// The upcoming deadlines, as plain records: the file is small enough that the compact
+// encoding saves less than decoding it costs (see `python -m aideadlines.compact`).
+async function fetchUpcoming() {
+  const response = await fetch('data/conferences.json');
+  if (!response.ok) throw new Error(`HTTP error! status: ${response.status} for upcoming conferences`);
+  return response.json();
+}
+
+// The first screen prerendered into index.html (see aideadlines/prerender.py), with the
+// records of its cards inlined as #initialData. Hydrating only attaches the countdowns and
+// the "deadline to watch" ticker; the grid is rebuilt once the full data has loaded.
+function hydratePrerendered() {
+  const el = document.getElementById('initialData');
+  if (!el) return false;
+  let initial;
+  try {
+    initial = JSON.parse(el.textContent);
+  } catch (error) {
+    console.warn("Ignoring unreadable prerendered data:", error);
+    return false;
+  }
+  for (const conference of initial.records) {
+    const card = document.getElementById(`card-${conference.id}`);
+    if (card) activateCard(card, conference);
+  }
+  nextUpConference = initial.records.find(c => c.id === initial.nextUp) || null;
+  updateNextUp();
+  suppressCardEntrance = true;
+  return true;
+}
+
 async function loadInitialData() {
   try {
-    const response = await fetch('data/conferences.json');
-    if (!response.ok) throw new Error(`HTTP error! status: ${response.status} for upcoming conferences`);
-    upcomingConferencesData = await response.json();
+    const [records, index] = await Promise.all([fetchUpcoming(), fetchSearchIndex('data/conferences.index.json')]);
+    upcomingConferencesData = records;
+    upcomingSearchIndex = resolveSearchIndex(index, records);
     updateHeroStats();
     renderNextUp();
     applyAllFilters();
@@ -708,12 +896,58 @@ async function loadInitialData() {
   }
 }
 
+async function fetchJson(url) {
+  const response = await fetch(url);
+  if (!response.ok) throw new Error(`HTTP error! status: ${response.status} for ${url}`);
+  return response.json();
+}
+
+// data/manifest.json, or null when there is none.
+async function fetchManifest() {
+  try {
+    return await fetchJson('data/manifest.json');
+  } catch (error) {
+    return null;
+  }
+}
+
+// The URL of a file listed in the manifest, with its content hash as the cache-buster.
+function versionedUrl(entry) {
+  return `data/${entry.path}?v=${entry.sha256.slice(0, 12)}`;
+}
+
+// The archive in the compact encoding when data/manifest.json lists it: for the archive it
+// is a net win (see `python -m aideadlines.compact`). Otherwise the archive is read per year.
+// "Show past" shows every year, so every shard is fetched; each URL carries its content
+// hash, so whatever hasn't changed since the last visit comes from the browser cache.
+// Falls back to the monolithic archive file when there's no manifest.
+async function fetchArchive(manifest) {
+  if (!manifest) return fetchJson('data/conferences_archive.json');
+  const compact = manifest.compact && manifest.compact.archive;
+  if (compact) {
+    try {
+      return decodeCompact(await fetchJson(versionedUrl(compact)));
+    } catch (error) {
+      console.warn("Compact archive unavailable, loading the yearly records:", error);
+    }
+  }
+  const shards = await Promise.all(
+    manifest.archiveByYear.map(shard => fetchJson(versionedUrl(shard)))
+  );
+  return shards.flat();
+}
+
 async function loadArchiveDataIfNeededAndRender() {
   if (currentFilterSettings.showPast && archiveConferencesData === null) {
     try {
-      const response = await fetch('data/conferences_archive.json');
-      if (!response.ok) throw new Error(`HTTP error! status: ${response.status} for archive conferences`);
-      archiveConferencesData = await response.json();
+      const manifest = await fetchManifest();
+      const indexEntry = manifest && manifest.index && manifest.index.archive;
+      const [records, index] = await Promise.all([
+        fetchArchive(manifest),
+        fetchSearchIndex(indexEntry ? versionedUrl(indexEntry) : 'data/conferences_archive.index.json'),
+      ]);
+      archiveConferencesData = records;
+      archiveSearchIndex = resolveSearchIndex(index, records);
     } catch (error) {
       console.error("Failed to load archive conferences:", error);
       archiveConferencesData = [];
@@ -807,5 +1041,10 @@ document.addEventListener('DOMContentLoaded', () => {
   }, 1000);
 
   setupEventListeners();
-  loadInitialData();
+  if (hydratePrerendered()) {
+    // First paint is already complete: fetch the rest once the browser is idle.
+    (window.requestIdleCallback || setTimeout)(loadInitialData);
+  } else {
+    loadInitialData();
+  }
 });
@@ -0,0 +1,73 @@
+"""Prebuilt search and filter indexes for the published records.
+
+``renderConferences`` in scripts.js used to filter by scanning every record, lower-casing
+each title and shortname on every keystroke, and parse dates inside the sort comparator.
+With the archive loaded that is thousands of records per keystroke. ``data_to_json`` now
+writes an index next to each of ``conferences.json`` and ``conferences_archive.json``:
+
+    {
+      "version": 1,
+      "byDeadline": ["abc2025-1", "xyz2025-1", ...],
+      "tokens": {"abc": [0], "conference": [0, 1], "xyz": [1], ...},
+      "tags": {"CV": [0, 1], ...},
+      "ratings": {"A*": [1], ...}
+    }
+
+``byDeadline`` lists the record ids ordered by deadline (then id); every other list holds
+positions in it, ascending. A position is both a compact reference and the record's rank
+in deadline order, so the client filters by intersecting sorted integer lists and never
+sorts. ``tokens`` maps the lower-cased words of each title and shortname to the records
+that contain them; the client matches each word of the query against the token keys
+(substring match, like the old scan) and intersects the results.
+"""
+
+import re
+
+INDEX_VERSION = 1
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokens(record):
+    """The distinct lower-cased words of a record's title and shortname."""
+    text = f"{record.get('title') or ''} {record.get('shortname') or ''}".lower()
+    return set(_TOKEN_RE.findall(text))
+
+
+class SearchIndex:
+    """Collects ``(deadline epoch, record)`` pairs and builds their index."""
+
+    def __init__(self):
+        self.entries = []
+
+    def add(self, epoch, record):
+        self.entries.append((epoch, record["id"], tokens(record), record.get("tags") or (), record.get("rating")))
+
+    def build(self):
+        entries = sorted(self.entries, key=lambda entry: entry[:2])
+        token_ids, tag_ids, rating_ids = {}, {}, {}
+        for position, (_, _, words, tags, rating) in enumerate(entries):
+            for word in words:
+                token_ids.setdefault(word, []).append(position)
+            for tag in dict.fromkeys(tags):
+                tag_ids.setdefault(tag, []).append(position)
+            if rating:
+                rating_ids.setdefault(rating, []).append(position)
+        return {
+            "version": INDEX_VERSION,
+            "byDeadline": [record_id for _, record_id, *_ in entries],
+            "tokens": token_ids,
+            "tags": tag_ids,
+            "ratings": rating_ids,
+        }
+
+
+def search(index, query):
+    """Positions (ascending) of the records whose words contain every word of ``query``."""
+    result = None
+    for word in _TOKEN_RE.findall(query.lower()):
+        matches = set()
+        for token, positions in index["tokens"].items():
+            if word in token:
+                matches.update(positions)
+        result = matches if result is None else result & matches
+    return sorted(range(len(index["byDeadline"])) if result is None else result)
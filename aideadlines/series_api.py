@@ -0,0 +1,76 @@
+"""The static per-series JSON API under ``data/series/``.
+
+Integrations that follow one series (CVPR, say) used to download all of ``conferences.json``
+and filter it. ``data_to_json`` now also writes, from the same records:
+
+- ``series/index.json``: every series with its title and tags (from its latest instance),
+  and the path, sha256 and deadline count of its file and of each instance's file;
+- ``series/<series>.json``: ``{"series": "cvpr", "instances": [{"id": "cvpr2025",
+  "deadlines": [...records...]}, ...]}``, upcoming and past deadlines together;
+- ``series/<series>/<instance>.json``: ``{"id": "cvpr2025", "series": "cvpr",
+  "deadlines": [...]}``.
+
+A series is a ``store`` group and file names are ``store.slug``-ified; names that slugify
+alike get numbered apart (``store.unique_slugs``), and no series takes ``index``. Instances are
+ordered by id and deadlines by their timeline position, so the files are the same whichever
+way the records were built. Only files whose content changed are rewritten (see
+``Exporter.commit``), so a web server or CDN can cache them by their hash.
+"""
+
+import hashlib
+
+from .codec import json_dumps
+from .store import group_of, unique_slugs
+
+SERIES_FOLDER = "series"
+SERIES_INDEX = f"{SERIES_FOLDER}/index.json"
+SERIES_VERSION = 1
+
+
+def _number(record):
+    return int(record["id"].rsplit("-", 1)[1])
+
+
+def _sha256(content):
+    return hashlib.sha256(content).hexdigest()
+
+
+class SeriesTree:
+    """Collects records and builds the ``{path: content}`` of the series API."""
+
+    def __init__(self):
+        self.instances = {}  # instance id -> its records
+
+    def add(self, record):
+        self.instances.setdefault(record["id"].rsplit("-", 1)[0], []).append(record)
+
+    def build(self):
+        series = {}
+        for instance, records in sorted(self.instances.items()):
+            series.setdefault(group_of(instance), {})[instance] = sorted(records, key=_number)
+
+        files, index = {}, []
+        series_slugs = unique_slugs(series, taken={"index"})
+        for name, instances in sorted(series.items()):
+            instance_entries = []
+            instance_slugs = unique_slugs(instances)
+            for instance, records in instances.items():
+                path = f"{SERIES_FOLDER}/{series_slugs[name]}/{instance_slugs[instance]}.json"
+                files[path] = json_dumps({"id": instance, "series": name, "deadlines": records})
+                instance_entries.append({"id": instance, "path": path, "deadlines": len(records), "sha256": _sha256(files[path])})
+            path = f"{SERIES_FOLDER}/{series_slugs[name]}.json"
+            files[path] = json_dumps({
+                "series": name,
+                "instances": [{"id": instance, "deadlines": records} for instance, records in instances.items()],
+            })
+            latest = instances[max(instances)][0]  # the newest instance's first deadline
+            index.append({
+                "series": name,
+                "title": latest.get("title") or latest.get("shortname"),
+                "tags": latest.get("tags") or [],
+                "path": path,
+                "sha256": _sha256(files[path]),
+                "instances": instance_entries,
+            })
+        files[SERIES_INDEX] = json_dumps({"version": SERIES_VERSION, "series": index})
+        return files
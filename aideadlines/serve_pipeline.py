@@ -0,0 +1,203 @@
+"""A long-running pipeline that keeps its state warm: ``aideadlines-serve-pipeline``.
+
+Every ``update.py`` run starts cold. It imports dateparser and bs4, opens new HTTP
+connections, loads the parse cache and the rank tables, and loads ``conferences/``. A hand
+edit to one ``conferences/*.yaml`` then waits for the next scheduled run. ``PipelineServer``
+stays up instead, and keeps all of that in memory:
+
+- every ``interval`` seconds it runs the whole ``Pipeline`` (online by default). The HTTP
+  session (``parser.http``), the parse cache and the CORE table are reused from one run to
+  the next. The run reloads the server's warm store, parsing only the files whose content
+  changed, and its store becomes the new warm store;
+- between runs it polls ``conferences/`` a few times a second. A file whose content changed,
+  and which has stopped changing (an editor may still be writing it), is rebuilt on its own:
+  it is swapped into the warm store (``ConferenceStore.with_file``) and validated; then every
+  group it holds records of is post-processed with all of that group's records and written
+  as ``update_data`` would, and the files are published as a change set. That takes well under a second. The files the server writes itself are
+  recognized by their hash and not rebuilt again. An edit that fails validation is left out
+  of the warm store, and is rebuilt again once it is saved again.
+
+    python3 -m aideadlines.serve_pipeline --interval 3600 --site html
+"""
+
+import argparse
+import os
+import time
+from copy import deepcopy
+
+from . import build_site, data_to_json, update_data, validate
+from .codec import YAMLError, sha256_of_file, yaml_load
+from .log_config import logger
+from .changeset import LAST_PUBLISHED
+from .pipeline import Pipeline
+from .ranking import core_rank_function, load_core_ranks
+from .store import CONFERENCE_FOLDER, group_of, load_store
+from .utils import parse_all_times
+
+POLL_SECONDS = 0.2
+REFRESH_SECONDS = 3600
+
+
+def scan(folder=CONFERENCE_FOLDER):
+    """``{file name: (mtime_ns, size)}`` of the conference files in ``folder``."""
+    files = {}
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.name.endswith((".yaml", ".yml")) and entry.is_file():
+                stat = entry.stat()
+                files[entry.name] = (stat.st_mtime_ns, stat.st_size)
+    return files
+
+
+class PipelineServer:
+    """The warm state between runs, and the loop that schedules them."""
+
+    def __init__(self, interval=REFRESH_SECONDS, online=True, compact=True, site=None, folder=CONFERENCE_FOLDER):
+        self.interval = interval
+        self.online = online
+        self.compact = compact
+        self.site = site
+        self.folder = folder
+        self.update_args = argparse.Namespace(historic=False, online=False, write=True, reestimate=False,
+                                              load_nino_data=False, incremental=True)
+        self.seen = scan(folder)
+        self.known = {name: self._sha256(name) for name in self.seen}  # content last built, by file
+        self.unsettled = set()
+        self.store = None
+        self.core_ranks = None  # the CORE table, refreshed in place by the runs
+        self.add_core_rank = None
+
+    def _sha256(self, name):
+        path = os.path.join(self.folder, name)
+        return sha256_of_file(path) if os.path.exists(path) else None
+
+    def _ranks(self):
+        if self.core_ranks is None:
+            self.core_ranks = load_core_ranks()
+            self.add_core_rank = core_rank_function(self.core_ranks)
+        return self.core_ranks
+
+    def _build_site(self):
+        if self.site is not None:
+            build_site.build(self.site)
+
+    def refresh(self):
+        """One run of the whole pipeline; returns whether it succeeded."""
+        pipeline = Pipeline(online=self.online, incremental=True, since=LAST_PUBLISHED, compact=self.compact,
+                            store=self.store, core_ranks=self._ranks())
+        ok = pipeline.run()
+        for group, (sha256, _) in pipeline.written.items():
+            self.known[f"{group}.yaml"] = sha256
+        self.store = pipeline.store if ok else None  # reloaded from disk next time
+        self._build_site()
+        return ok
+
+    def poll(self):
+        """Conference files whose content changed since it was last built, once they stopped changing."""
+        current = scan(self.folder)
+        moving = {name for name in current.keys() | self.seen.keys() if current.get(name) != self.seen.get(name)}
+        settled, self.unsettled, self.seen = self.unsettled - moving, moving, current
+        return {name for name in settled if self._sha256(name) != self.known.get(name)}
+
+    def _read(self, name):
+        """``(records, readable)`` of a conference file; records are ``None`` if it is gone or unreadable."""
+        try:
+            with open(os.path.join(self.folder, name), "rb") as f:
+                return yaml_load(f) or {}, True
+        except FileNotFoundError:
+            return None, True
+        except (OSError, YAMLError) as e:
+            logger.error(f"not rebuilding {name}: {e}")
+            return None, False
+
+    def rebuild(self, names):
+        """Validate, post-process, write and publish the conference files ``names`` after a hand
+        edit. Nothing is written unless the edit validates. Returns whether it was published."""
+        start = time.perf_counter()
+        files = {}
+        for name in sorted(names):
+            records, readable = self._read(name)
+            if readable:
+                files[name] = records
+        if not files:
+            return False
+        before = self.store if self.store is not None else load_store()
+        hashes = {name: self._sha256(name) for name in files}
+        store = before
+        for name, records in files.items():
+            store = store.with_file(name, records, hashes[name])
+        if not validate.report(validate.validate_store(store, set(files))):
+            logger.error(f"hand edit of {sorted(names)} does not validate; not writing or publishing it")
+            return False
+
+        # A group is rewritten from all of its records, wherever they are: an edit that adds
+        # an id of another group to a file must not drop that group's other records.
+        groups = {group_of(key) for name in files for confs in (files[name], before.files.get(name))
+                  for key in (confs or {})}
+        conferences = {key: parse_all_times(deepcopy(conf)) for group in sorted(groups)
+                       for key, conf in store.group(group).items()}
+        self._ranks()
+        update_data.normalize_nips(conferences)
+        update_data.drop_empty_timelines(conferences)
+        written = {}
+        state = update_data.write_groups(conferences, [], self.update_args, written=written,
+                                         add_core_rank=self.add_core_rank)
+        update_data.save_pipeline_state({**update_data.load_pipeline_state(), **state})
+        for group, (sha256, records) in written.items():
+            files[f"{group}.yaml"], hashes[f"{group}.yaml"] = records, sha256
+            store = store.with_file(f"{group}.yaml", records, sha256)
+        self.known.update(hashes)
+        self.store = store
+        ok = data_to_json.publish(set(files), compact=self.compact, store=store)
+        self._build_site()
+        logger.info(f"rebuilt {sorted(files)} after a hand edit in {time.perf_counter() - start:.2f}s")
+        return ok
+
+    def serve(self):
+        """Run forever: the pipeline every ``interval`` seconds (first right away), rebuilds in between."""
+        logger.info(f"serving the pipeline for {self.folder}: full runs every {self.interval}s"
+                    if self.interval else f"serving the pipeline for {self.folder}: rebuilds only")
+        next_run = time.monotonic() if self.interval else None
+        while True:
+            if next_run is not None and time.monotonic() >= next_run:
+                try:
+                    self.refresh()
+                except Exception:
+                    logger.exception("pipeline run failed")
+                next_run = time.monotonic() + self.interval
+            changed = self.poll()
+            if changed:
+                try:
+                    self.rebuild(changed)
+                except Exception:
+                    logger.exception(f"rebuilding {sorted(changed)} failed")
+            time.sleep(POLL_SECONDS)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--interval", type=int, default=REFRESH_SECONDS,
+        help="Seconds between full pipeline runs (0: only rebuild hand-edited files)",
+    )
+    parser.add_argument(
+        "--online", default=True, action=argparse.BooleanOptionalAction, help="Download data from the internet"
+    )
+    parser.add_argument(
+        "--compact", default=True, action=argparse.BooleanOptionalAction, help="Also publish the compact encoding"
+    )
+    parser.add_argument("--site", metavar="FOLDER", help="Also rebuild the served site in FOLDER (see build_site)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    server = PipelineServer(interval=args.interval, online=args.online, compact=args.compact, site=args.site)
+    try:
+        server.serve()
+    except KeyboardInterrupt:
+        logger.info("pipeline server stopped")
+
+
+if __name__ == "__main__":
+    main()
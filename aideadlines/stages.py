@@ -0,0 +1,84 @@
+"""A small executor for pipeline stages that declare their inputs.
+
+``update_data`` used to do everything in sequence: load ``conferences/``, walk each official
+website, fetch the hf and ccf lists, refresh the CORE ranks, merge, write. Most of that is
+waiting on the network, and most of it doesn't depend on the rest until the merge. Here each
+step is a ``Stage`` naming the stages whose results it needs; ``run_stages`` starts a stage on
+a thread as soon as those are done, so the fetches overlap, and it calls each ``run`` with its
+inputs' results in the order they are listed. Whatever has to happen in a fixed order (the
+merge by source priority) is one stage that takes all the fetches as inputs.
+
+Every stage's wall time is logged, and the run ends with one line listing them all. If a
+stage raises, no further stages are started; the running ones are waited for and the first
+exception is re-raised.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, NamedTuple, Tuple
+
+from .log_config import logger
+
+
+class Stage(NamedTuple):
+    name: str
+    run: Callable  # called with the results of ``inputs``, in order
+    inputs: Tuple[str, ...] = ()
+
+
+def _check(stages):
+    names = [stage.name for stage in stages]
+    duplicates = {name for name in names if names.count(name) > 1}
+    if duplicates:
+        raise ValueError(f"duplicate stages: {sorted(duplicates)}")
+    unknown = {name for stage in stages for name in stage.inputs} - set(names)
+    if unknown:
+        raise ValueError(f"unknown stage inputs: {sorted(unknown)}")
+
+
+def run_stages(stages, workers=None, timings=None):
+    """Run ``stages``, each once its inputs are done; returns ``{name: result}``.
+
+    ``timings``, if given, receives ``{name: seconds}``. Raises ``ValueError`` for duplicate
+    names, unknown inputs or a dependency cycle.
+    """
+    _check(stages)
+    spent = {}
+    results, pending, running = {}, list(stages), {}
+    failure = None
+    start = time.perf_counter()
+
+    def timed(stage, args):
+        began = time.perf_counter()
+        try:
+            return stage.run(*args)
+        finally:
+            spent[stage.name] = time.perf_counter() - began
+
+    with ThreadPoolExecutor(max_workers=workers or max(len(stages), 1)) as pool:
+        while pending or running:
+            if failure is None:
+                for stage in [stage for stage in pending if all(name in results for name in stage.inputs)]:
+                    pending.remove(stage)
+                    running[pool.submit(timed, stage, [results[name] for name in stage.inputs])] = stage
+            if not running:
+                if failure is None:
+                    raise ValueError(f"dependency cycle among stages: {sorted(stage.name for stage in pending)}")
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage = running.pop(future)
+                try:
+                    results[stage.name] = future.result()
+                except Exception as e:
+                    logger.error(f"stage {stage.name} failed after {spent[stage.name]:.2f}s: {e}")
+                    failure = failure or e
+                else:
+                    logger.info(f"stage {stage.name} done in {spent[stage.name]:.2f}s")
+    if timings is not None:
+        timings.update(spent)
+    if failure is not None:
+        raise failure
+    logger.info(f"stages done in {time.perf_counter() - start:.2f}s: "
+                + ", ".join(f"{name} {seconds:.2f}s" for name, seconds in spent.items()))
+    return results
@@ -0,0 +1,244 @@
+"""The one loader for ``conferences/*.yaml``.
+
+``update_data``, ``validate`` and ``data_to_json`` each used to carry their own copy of
+``load_conferences``. Two of them merged every file as ``{**file_confs, **conferences}``,
+which re-copies the growing dict once per file (quadratic in the number of files), and all
+three silently let one file's record overwrite another's when an id appeared twice.
+
+``ConferenceStore.load`` reads and parses the files on a thread pool, then inserts them into
+a single dict in sorted file order, so loading is linear and deterministic. The first file
+(alphabetically) to define an id keeps it; every later definition is recorded in
+``duplicates`` and logged. Records are indexed by id and by group (the id without its year).
+
+Parsing the YAML dominates start-up, so ``load_store`` keeps a pickled snapshot of every
+file's parsed content next to ``conferences/``, keyed by the file's mtime, size and sha256.
+A warm start only re-parses files whose content changed; everything else is unpickled.
+A caller that has just written files can also hand over what it wrote (``primed``), so
+they aren't parsed at all (see ``pipeline``), and one that keeps a store in memory can swap a
+single file's records in with ``with_file``, or ``reload`` it, parsing only the files whose
+content changed (see ``serve_pipeline``).
+"""
+
+import hashlib
+import os
+import pickle
+import re
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+
+from .codec import yaml_load
+from .log_config import logger
+
+THIS_FOLDER = os.path.dirname(__file__)
+CONFERENCE_FOLDER = os.path.join(THIS_FOLDER, os.pardir, "conferences")
+SNAPSHOT_FILE = os.path.join(THIS_FOLDER, os.pardir, ".conferences.pickle")
+SNAPSHOT_VERSION = 1
+
+
+def group_of(conf_id):
+    """The conference family of an id: 'cvpr2025' -> 'cvpr'."""
+    return conf_id[:-4]
+
+
+def slug(name):
+    """A file-name-safe form of an id, group or tag: 'ieee cec2025' -> 'ieee-cec2025'."""
+    return re.sub(r"[^a-z0-9]+", "-", str(name).lower()).strip("-") or "untitled"
+
+
+def unique_slugs(names, taken=()):
+    """``{name: slug}`` without collisions: in sorted order, a name whose slug is already used
+    (or in ``taken``) gets the first free ``-2``, ``-3``, ...: 'ieee cec', 'ieee-cec' ->
+    'ieee-cec', 'ieee-cec-2'."""
+    used, slugs = set(taken), {}
+    for name in sorted(names, key=str):
+        slugs[name] = candidate = slug(name)
+        number = 1
+        while candidate in used:
+            number += 1
+            candidate = f"{slugs[name]}-{number}"
+        if candidate != slugs[name]:
+            logger.warning(f"{name!r} and another name both slugify to {slugs[name]!r}, using {candidate!r}")
+        used.add(candidate)
+        slugs[name] = candidate
+    return slugs
+
+
+def group_conferences(conferences):
+    """Index ``{id: conf}`` by group: ``{group: {id: conf}}``, groups in first-seen order."""
+    groups = {}
+    for conf_id, conf in conferences.items():
+        groups.setdefault(group_of(conf_id), {})[conf_id] = conf
+    return groups
+
+
+def _load_snapshot(path):
+    """``{file name: entry}`` from the snapshot at ``path``; empty if missing or unusable."""
+    if path is None or not os.path.isfile(path):
+        return {}
+    try:
+        with open(path, "rb") as f:
+            stored = pickle.load(f)
+    except Exception as e:
+        logger.warning(f"ignoring unreadable conference snapshot {path}: {e}")
+        return {}
+    if not isinstance(stored, dict) or stored.get("version") != SNAPSHOT_VERSION:
+        return {}
+    return stored["files"]
+
+
+def _save_snapshot(path, files):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump({"version": SNAPSHOT_VERSION, "files": files}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def _read_file(path, cached, primed=None):
+    """The snapshot entry for ``path``, reusing ``cached`` when the file is unchanged.
+
+    An unchanged mtime and size are trusted without reading the file; otherwise the content
+    hash decides whether the YAML has to be parsed again. ``primed`` is ``(sha256, records)``
+    of content the caller wrote itself; it is used when the file still has that hash.
+    """
+    stat = os.stat(path)
+    if cached is not None and (cached["mtime_ns"], cached["size"]) == (stat.st_mtime_ns, stat.st_size):
+        return cached
+    with open(path, "rb") as f:
+        content = f.read()
+    sha256 = hashlib.sha256(content).hexdigest()
+    if cached is not None and cached["sha256"] == sha256:
+        confs = cached["conferences"]
+    elif primed is not None and primed[0] == sha256:
+        confs = primed[1]
+    else:
+        confs = yaml_load(content) or {}
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": sha256, "conferences": confs}
+
+
+class ConferenceStore:
+    """All conference records, by id (``conferences``) and by group (``groups``).
+
+    ``sources`` maps each id to the file it was loaded from; ``duplicates`` lists
+    ``(id, kept_file, ignored_file)`` for every id defined in more than one file. ``files``
+    holds each file's records, for stores made by ``load`` or ``from_files``, and ``hashes``
+    the sha256 of each file's content, where it is known to match those records.
+    """
+
+    def __init__(self, conferences=None, sources=None, duplicates=None, files=None, hashes=None):
+        self.conferences = conferences if conferences is not None else {}
+        self.sources = sources if sources is not None else {}
+        self.duplicates = duplicates if duplicates is not None else []
+        self.files = files if files is not None else {}
+        self.hashes = hashes if hashes is not None else {}
+        self.groups = group_conferences(self.conferences)
+
+    @classmethod
+    def from_files(cls, files, hashes=None):
+        """The store of ``{file name: {id: conf}}``; the first file (sorted) to define an id keeps it."""
+        conferences, sources, duplicates = {}, {}, []
+        for name in sorted(files):
+            for conf_id, conf in files[name].items():
+                if conf_id in conferences:
+                    duplicates.append((conf_id, sources[conf_id], name))
+                    logger.warning(f"duplicate conference '{conf_id}' in {name}; keeping the one from {sources[conf_id]}")
+                    continue
+                conferences[conf_id] = conf
+                sources[conf_id] = name
+        return cls(conferences, sources, duplicates, files, hashes)
+
+    @classmethod
+    def load(cls, folder=CONFERENCE_FOLDER, transform=None, workers=None, snapshot=None, primed=None):
+        """Load every ``*.yaml`` file in ``folder``, applying ``transform`` to each record.
+
+        With a ``snapshot`` path, unchanged files come from (and changed ones go back into)
+        that snapshot. The snapshot holds the YAML as parsed; ``transform`` runs after it, on
+        a copy of each record, so it may modify the record in place without touching the
+        snapshot's or ``primed``'s. ``primed`` maps file names to ``(sha256, records)`` the
+        caller just wrote: the records must be exactly what parsing that content gives.
+        """
+        names = sorted(name for name in os.listdir(folder) if name.endswith((".yaml", ".yml")))
+        cached = _load_snapshot(snapshot)
+        primed = primed or {}
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            entries = list(pool.map(
+                lambda name: _read_file(os.path.join(folder, name), cached.get(name), primed.get(name)), names))
+        files = dict(zip(names, entries))
+        if snapshot is not None:
+            reused = sum(name in cached and entry["conferences"] is cached[name]["conferences"]
+                         for name, entry in files.items())
+            handed = sum(name in primed and entry["conferences"] is primed[name][1] for name, entry in files.items())
+            if files.keys() != cached.keys() or any(entry is not cached[name] for name, entry in files.items()):
+                _save_snapshot(snapshot, files)
+            logger.info(f"conference snapshot: {reused} files reused, {handed} handed over, "
+                        f"{len(names) - reused - handed} parsed")
+
+        hashes = None
+        if transform is not None:
+            files = {name: {key: transform(deepcopy(conf)) for key, conf in entry["conferences"].items()}
+                     for name, entry in files.items()}
+        else:
+            hashes = {name: entry["sha256"] for name, entry in files.items()}
+            files = {name: entry["conferences"] for name, entry in files.items()}
+        store = cls.from_files(files, hashes)
+        logger.info(f"loaded {len(store)} conferences from {len(names)} files")
+        return store
+
+    def with_file(self, name, confs, sha256=None):
+        """A new store with file ``name``'s records replaced by ``confs`` (``None``: file removed),
+        parsed from content with hash ``sha256`` (if known)."""
+        files = {key: value for key, value in self.files.items() if key != name}
+        hashes = {key: value for key, value in self.hashes.items() if key != name}
+        if confs is not None:
+            files[name] = confs
+            if sha256 is not None:
+                hashes[name] = sha256
+        return type(self).from_files(files, hashes)
+
+    def reload(self, folder=CONFERENCE_FOLDER, primed=None):
+        """The store of ``folder`` as it is now. A file whose content still has the hash this
+        store holds keeps its records; ``primed`` is used as in ``load``; the rest is parsed."""
+        primed = primed or {}
+        files, hashes, parsed = {}, {}, 0
+        for name in sorted(name for name in os.listdir(folder) if name.endswith((".yaml", ".yml"))):
+            with open(os.path.join(folder, name), "rb") as f:
+                content = f.read()
+            hashes[name] = sha256 = hashlib.sha256(content).hexdigest()
+            if self.hashes.get(name) == sha256:
+                files[name] = self.files[name]
+            elif name in primed and primed[name][0] == sha256:
+                files[name] = primed[name][1]
+            else:
+                files[name] = yaml_load(content) or {}
+                parsed += 1
+        store = type(self).from_files(files, hashes)
+        logger.info(f"reloaded {len(store)} conferences from {len(files)} files, {parsed} parsed")
+        return store
+
+    def __getitem__(self, conf_id):
+        return self.conferences[conf_id]
+
+    def __contains__(self, conf_id):
+        return conf_id in self.conferences
+
+    def __iter__(self):
+        return iter(self.conferences)
+
+    def __len__(self):
+        return len(self.conferences)
+
+    def items(self):
+        return self.conferences.items()
+
+    def group(self, name):
+        """The ``{id: conf}`` records of one group (empty if there is none)."""
+        return self.groups.get(name, {})
+
+
+def load_store(transform=None, primed=None):
+    """The ``ConferenceStore`` of ``CONFERENCE_FOLDER``, warm-started from ``SNAPSHOT_FILE``."""
+    return ConferenceStore.load(CONFERENCE_FOLDER, transform=transform, snapshot=SNAPSHOT_FILE, primed=primed)
+
+
+def load_conferences(transform=None):
+    """``{id: conf}`` for every file in ``CONFERENCE_FOLDER``."""
+    return load_store(transform).conferences
@@ -0,0 +1,141 @@
+"""Timezone resolution for deadline strings and conference ``timezone`` fields.
+
+This replaces the ``TZ_REPLACE`` table that ``_parse_timestr`` used to apply as ~50
+sequential ``str.replace`` calls per string. Besides the cost, plain substring replacement
+corrupted dates ("PT" inside "Sept", "CT" inside "Oct", "ET" inside "CET") and pinned named
+zones to one fixed offset, so ``Europe/Paris`` was GMT+1 even in summer.
+
+Here a single compiled, word-bounded tokenizer finds the timezone in a string, and
+``resolve`` turns it into a tzinfo once (cached): fixed offsets for abbreviations that name
+one, ``zoneinfo`` zones — which apply daylight saving time per date — for region names.
+``iana_name`` gives the spelling the frontend's ``Intl`` API needs.
+"""
+
+import datetime
+import re
+import zoneinfo
+from functools import lru_cache
+
+from .log_config import logger
+
+# alias -> canonical spelling: an IANA zone name or a fixed 'UTC±H[:MM]' offset.
+TZ_ALIASES = {
+    # Generic US names mean local time, daylight saving included
+    "Pacific Time": "America/Los_Angeles",
+    "PT": "America/Los_Angeles",
+    "Eastern Time": "America/New_York",
+    "ET": "America/New_York",
+    "Central Time": "America/Chicago",
+    "CT": "America/Chicago",
+    "Mountain Time": "America/Denver",
+    # US abbreviations name one offset
+    "PST": "UTC-8",
+    "PDT": "UTC-7",
+    "MST": "UTC-7",
+    "MDT": "UTC-6",
+    "CDT": "UTC-5",
+    "EST": "UTC-5",
+    "EDT": "UTC-4",
+    # European timezone abbreviations
+    "CET": "UTC+1",
+    "CEST": "UTC+2",
+    "EET": "UTC+2",
+    "EEST": "UTC+3",
+    # Asian timezone abbreviations
+    "JST": "Asia/Tokyo",
+    "KST": "Asia/Seoul",
+    "CST": "Asia/Shanghai",
+    "China Standard Time": "Asia/Shanghai",
+    "IST": "Asia/Kolkata",
+    # Australian timezone abbreviations
+    "AEST": "UTC+10",
+    "AEDT": "UTC+11",
+    "AWST": "Australia/Perth",
+    # Other common formats
+    "Russia/Moscow": "Europe/Moscow",
+    "Anywhere on Earth": "UTC-12",
+    "AoE": "UTC-12",
+    "AOE": "UTC-12",
+    "UTC": "UTC",
+    "GMT": "UTC",
+}
+
+# Etc/GMT zones only cover whole hours; these DST-free zones stand in for the other offsets.
+_FRACTIONAL_ZONES = {
+    270: "Asia/Kabul",
+    330: "Asia/Kolkata",
+    345: "Asia/Kathmandu",
+    390: "Asia/Yangon",
+    570: "Australia/Darwin",
+    -570: "Pacific/Marquesas",
+}
+
+_OFFSET = r"(?:UTC|GMT)\s?[+\-−]\s?\d{1,2}(?::?\d{2})?"
+_OFFSET_RE = re.compile(r"^(?:UTC|GMT)\s?([+\-−])\s?(\d{1,2})(?::?(\d{2}))?$")
+_TOKEN_RE = re.compile(
+    r"\(?(?<![A-Za-z/])(?P<tz>"
+    + _OFFSET
+    + r"|(?:[A-Z][A-Za-z_]+/)+[A-Za-z][A-Za-z0-9_+\-]*"
+    + "|"
+    + "|".join(re.escape(alias) for alias in sorted(TZ_ALIASES, key=len, reverse=True))
+    + r")(?![A-Za-z/])\)?"
+)
+
+
+@lru_cache(maxsize=None)
+def resolve(tz_str):
+    """Resolve an alias, 'UTC±H[:MM]' offset or IANA name to a tzinfo, or None if unknown."""
+    if not isinstance(tz_str, str):
+        return None
+    name = tz_str.strip().strip("()").strip()
+    name = TZ_ALIASES.get(name, name)
+    if name == "UTC":
+        return datetime.timezone.utc
+    match = _OFFSET_RE.match(name)
+    if match:
+        sign, hours, minutes = match.groups()
+        offset = datetime.timedelta(hours=int(hours), minutes=int(minutes or 0))
+        if offset > datetime.timedelta(hours=14):
+            return None
+        return datetime.timezone(-offset if sign in "-−" else offset)
+    try:
+        return zoneinfo.ZoneInfo(name)
+    except (zoneinfo.ZoneInfoNotFoundError, ValueError):
+        return None
+
+
+def split_timezone(text):
+    """Split the first resolvable timezone token off ``text``: ``(rest, tzinfo)``.
+
+    Returns ``(text, None)`` when the string names no timezone we know.
+    """
+    for match in _TOKEN_RE.finditer(text):
+        tzinfo = resolve(match["tz"])
+        if tzinfo is not None:
+            rest = text[: match.start()] + " " + text[match.end():]
+            return " ".join(rest.split()), tzinfo
+    return text, None
+
+
+@lru_cache(maxsize=None)
+def iana_name(tz_str):
+    """The IANA zone name the frontend's ``Intl`` API accepts for ``tz_str``.
+
+    Fixed offsets become 'Etc/GMT∓N' (note the POSIX sign flip), so AoE is 'Etc/GMT+12'.
+    Strings that don't resolve are returned unchanged.
+    """
+    tzinfo = resolve(tz_str)
+    if tzinfo is None:
+        logger.warning(f"unknown timezone '{tz_str}'")
+        return tz_str
+    if isinstance(tzinfo, zoneinfo.ZoneInfo):
+        return tzinfo.key
+    minutes = int(tzinfo.utcoffset(None).total_seconds()) // 60
+    if minutes == 0:
+        return "UTC"
+    if minutes % 60 == 0:
+        return f"Etc/GMT{-minutes // 60:+d}"
+    if minutes in _FRACTIONAL_ZONES:
+        return _FRACTIONAL_ZONES[minutes]
+    logger.warning(f"no IANA zone for timezone '{tz_str}'")
+    return tz_str
@@ -1,23 +1,38 @@
 import argparse
 import datetime
+import functools
+import hashlib
 import os
 import traceback
+from copy import deepcopy
 
-import yaml
-
+from . import crawl_schedule, parse_cache
+from .codec import json_dumps, json_loads, sha256_of_file, write_if_changed, yaml_dump
+from .dates import log_stats
 from .log_config import logger
-from .merge import merge_one, merge_source
+from .merge import merge_one, merge_order, merge_source
 from .parser.ccf_deadlines import get_ccf_list
 from .parser.common_website import PARSER
 from .parser.hf_list import get_hf_list
 from .parser.ninoduarte_list import get_nino_list
 from .parser.see_future import estimate_future_conferences
 from .parser.wacv import parse_wacv
-from .ranking import make_conf_rank_function, make_core_rank_function
+from .ranking import (
+    core_rank_function,
+    core_update_due,
+    load_core_ranks,
+    make_conf_rank_function,
+    make_core_rank_function,
+    update_core_ranks,
+)
+from .stages import Stage, run_stages
+from .store import CONFERENCE_FOLDER, group_conferences, load_conferences
 from .utils import _parse_timestr, join_conferences, parse_all_times, parse_stuff, unite_tags
 
 THIS_FOLDER = os.path.dirname(__file__)
-CONFERENCE_FOLDER = os.path.join(THIS_FOLDER, os.pardir, "conferences")
+# What the last write left on disk per group, so --incremental can skip unchanged groups.
+PIPELINE_STATE_FILE = os.path.join(THIS_FOLDER, "data", ".pipeline_state.json")
+PIPELINE_STATE_VERSION = 1
 
 
 def parse_args():
@@ -35,49 +50,92 @@ def parse_args():
     parser.add_argument(
         "--load-nino-data", default=False, action=argparse.BooleanOptionalAction, help="Load data from ninoduartes github"
     )
+    parser.add_argument(
+        "--fetch-budget", type=int, default=crawl_schedule.DEFAULT_BUDGET,
+        help="At most this many official-website pages per run, the most in need of a refresh first",
+    )
+    parser.add_argument(
+        "--incremental",
+        default=False,
+        action=argparse.BooleanOptionalAction,
+        help="Only post-process groups that changed since the last write",
+    )
     return parser.parse_args()
 
 
-def load_conferences():
-    """Load every conferences/*.yaml file, parsing all timestamps."""
-    conferences = {}
-    for conf_file in os.listdir(CONFERENCE_FOLDER):
-        with open(os.path.join(CONFERENCE_FOLDER, conf_file), "r") as f:
-            file_confs = yaml.safe_load(f)
-        file_confs = {key: parse_all_times(conf) for key, conf in file_confs.items()}
-        conferences = {**file_confs, **conferences}
-    return conferences
+WEBSITE_PARSERS = PARSER + [parse_wacv]
+
+
+def website_of(conf_parser):
+    """The group an official-website parser fetches: ``parse_cvpr`` -> ``cvpr``."""
+    return conf_parser.__name__[len("parse_"):]
+
+
+def _recent_years():
+    """The years an online run looks at, newest first: last year to two years ahead."""
+    current_year = datetime.datetime.now().year
+    return range(current_year + 2, current_year - 2, -1)
+
+
+def fetch_year(conf_parser, year):
+    """One year of an official website, dates parsed; ``{}`` if there is none, None if it failed."""
+    logger.info(f"{conf_parser} {year}")
+    try:
+        yearly_data = conf_parser(year)
+    except Exception as e:
+        logger.warning(f"Error while parsing conference: {e}")
+        return None
+    logger.info("no data" if len(yearly_data) == 0 else "loaded data")
+    if len(yearly_data) == 0:
+        return {}
+    try:
+        return parse_all_times(yearly_data)
+    except Exception as e:
+        logger.warning(f"Error while parsing dates for conference {conf_parser} {year} (data={yearly_data}): {e}")
+        return None
+
+
+def walk_official_website(conf_parser, args):
+    """Walk one official-website parser backwards through years; returns ``[(year, data)]``, newest first.
 
+    ``data`` is None for a year whose fetch failed.
+    """
+    fetched = []
+    current_year = datetime.datetime.now().year
+    year = current_year + 2
+    no_data_years = 0
+    while no_data_years < 5 and (year >= current_year - 1 or args.historic):
+        yearly_data = fetch_year(conf_parser, year)
+        fetched.append((year, yearly_data))
+        if yearly_data is not None:
+            no_data_years = 0 if yearly_data else no_data_years + 1
+        year -= 1
+    return fetched
 
-def scrape_official_websites(conferences, args, reestimate_groups):
-    """Walk each official-website parser backwards through years, merging what it finds."""
-    for conf_parser in PARSER + [parse_wacv]:
-        current_year = datetime.datetime.now().year
-        year = current_year + 2
-        no_data_years = 0
-        while no_data_years < 5 and (year >= current_year - 1 or args.historic):
-            logger.info(f"{conf_parser} {year}")
-            try:
-                yearly_data = conf_parser(year)
-            except Exception as e:
-                logger.warning(f"Error while parsing conference: {e}")
-                year -= 1
-                continue
-            logger.info("no data" if len(yearly_data) == 0 else "loaded data")
-            try:
-                yearly_data = parse_all_times(yearly_data)
-            except Exception as e:
-                logger.warning(
-                    f"Error while parsing dates for conference {conf_parser} {year} (data={yearly_data}): {e}"
-                )
-                year -= 1
-                continue
-            if len(yearly_data) == 0:
-                no_data_years += 1
-            else:
-                no_data_years = 0
-                merge_one(conferences, yearly_data, yearly_data["id"], "off-website", reestimate_groups)
-            year -= 1
+
+def crawl_candidates():
+    """``(group, instance id)`` of every recent official-website instance its site can have."""
+    return [
+        (website_of(conf_parser), f"{website_of(conf_parser)}{year}")
+        for conf_parser in WEBSITE_PARSERS
+        for year in _recent_years()
+        if getattr(conf_parser, "year_filter", lambda year: True)(year)
+    ]
+
+
+def fetch_official_website(conf_parser, args, planned):
+    """``[(year, data)]`` of the years of one website in the crawl plan, newest first.
+
+    ``planned`` is the set of instance ids to fetch; ``None`` (``--historic``) walks every year.
+    ``data`` is None for a year whose fetch failed, so the crawl state can back off from it.
+    """
+    if planned is None:
+        return walk_official_website(conf_parser, args)
+    fetched = []
+    for year in _recent_years():
+        if f"{website_of(conf_parser)}{year}" in planned:
+            fetched.append((year, fetch_year(conf_parser, year)))
+    return fetched
 
 
 def _safe_fetch(label, fetch):
@@ -92,29 +150,66 @@ def _safe_fetch(label, fetch):
     return items
 
 
-def scrape_online(conferences, args, reestimate_groups):
-    """Fetch and merge every online source in ascending priority order."""
-    scrape_official_websites(conferences, args, reestimate_groups)
-
+def fetch_hf():
     logger.info("load hf data")
-    hf_conferences = _safe_fetch("hf-repo", get_hf_list)
-    merge_source(conferences, [parse_all_times(c) for c in hf_conferences], "hf-repo", reestimate_groups)
+    return [parse_all_times(c) for c in _safe_fetch("hf-repo", get_hf_list)]
+
+
+def fetch_nino():
+    logger.info("load nino duarte data")
+    nino_items = []
+    for conf in _safe_fetch("ninoduarte-git", get_nino_list):
+        conf = parse_all_times(conf)
+        conf["id"] = conf["id"].replace("nips", "neurips")
+        nino_items.append(conf)
+    return nino_items
 
-    if args.load_nino_data:
-        logger.info("load nino duarte data")
-        nino_items = []
-        for conf in _safe_fetch("ninoduarte-git", get_nino_list):
-            conf = parse_all_times(conf)
-            conf["id"] = conf["id"].replace("nips", "neurips")
-            nino_items.append(conf)
-        merge_source(conferences, nino_items, "ninoduarte-git", reestimate_groups, overwrite_equal=False)
-    else:
-        logger.info("skipping ninoduarte-git (not that reliable)")
 
+def fetch_ccf():
     logger.info("load ccf-deadlines")
     ccf_conferences = _safe_fetch("ccf-deadlines", get_ccf_list)
     logger.info(f"got {len(ccf_conferences)} ccf conferences")
-    merge_source(conferences, [parse_all_times(c) for c in ccf_conferences], "ccf-deadlines", reestimate_groups)
+    return [parse_all_times(c) for c in ccf_conferences]
+
+
+def online_fetches(args):
+    """``[(source, website, stage)]`` for every online source. An official website's stage takes
+    the crawl plan and returns ``[(year, data)]``; the others return parsed records.
+
+    Each official website is fetched by its own stage, so the websites overlap too.
+    """
+    fetches = [
+        ("off-website", website_of(conf_parser),
+         Stage(f"fetch:{conf_parser.__name__}", functools.partial(fetch_official_website, conf_parser, args),
+               ("crawl-plan",)))
+        for conf_parser in WEBSITE_PARSERS
+    ]
+    fetches.append(("hf-repo", None, Stage("fetch:hf-repo", fetch_hf)))
+    if args.load_nino_data:
+        fetches.append(("ninoduarte-git", None, Stage("fetch:ninoduarte-git", fetch_nino)))
+    else:
+        logger.info("skipping ninoduarte-git (not that reliable)")
+    fetches.append(("ccf-deadlines", None, Stage("fetch:ccf-deadlines", fetch_ccf)))
+    return fetches
+
+
+def merge_fetched(conferences, fetched, reestimate_groups):
+    """Merge ``[(source, records)]`` into ``conferences``, source by source in ``merge_order``.
+
+    Records of one source are merged in the order given, so the result doesn't depend on which
+    fetch finished first. Official-website records skip WACV round tagging, and ninoduarte-git
+    doesn't overwrite same-priority data, as before.
+    """
+    by_source = {}
+    for source, records in fetched:
+        by_source.setdefault(source, []).extend(records)
+    for source in merge_order(by_source):
+        if source == "off-website":
+            for conf in by_source[source]:
+                merge_one(conferences, conf, conf["id"], source, reestimate_groups)
+        else:
+            merge_source(conferences, by_source[source], source, reestimate_groups,
+                         overwrite_equal=source != "ninoduarte-git")
 
 
 def normalize_nips(conferences):
@@ -152,53 +247,213 @@ def drop_empty_timelines(conferences):
     return conferences
 
 
-def write_groups(conferences, reestimate_groups, args):
-    """Group by conference family, estimate future instances, attach ranks, and write YAML."""
+def group_path(group):
+    return os.path.join(CONFERENCE_FOLDER, f"{group}.yaml")
+
+
+def write_group(group, group_confs):
+    """Write ``conferences/<group>.yaml`` if its canonical YAML differs from the file on disk.
+
+    Returns ``(written, sha256 of the canonical YAML)``.
+    """
+    content = yaml_dump(group_confs).encode()
+    return write_if_changed(group_path(group), content), hashlib.sha256(content).hexdigest()
+
+
+def load_pipeline_state():
+    """``{group: {"sha256", "year", "ranks"}}`` as of the last write; empty if unusable."""
+    try:
+        with open(PIPELINE_STATE_FILE, "rb") as f:
+            stored = json_loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    if stored.get("version") != PIPELINE_STATE_VERSION:
+        return {}
+    return stored["groups"]
+
+
+def save_pipeline_state(groups):
+    write_if_changed(PIPELINE_STATE_FILE, json_dumps({"version": PIPELINE_STATE_VERSION, "groups": groups}))
+
+
+def changed_groups(before, after):
+    """Groups whose records differ between two ``{id: conf}`` snapshots."""
+    before, after = group_conferences(before), group_conferences(after)
+    return {group for group in before.keys() | after.keys() if before.get(group) != after.get(group)}
+
+
+def _rank_key(group, add_conf_rank, add_core_rank):
+    """The h5-index and CORE rating the rank tables currently give ``group``."""
+    probe = add_core_rank(add_conf_rank({"id": f"{group}0000"}))
+    return [probe.get("h5Index"), probe.get("rating")]
+
+
+def _is_current(entry, group, year, ranks):
+    """Whether the file on disk is what post-processing the (unchanged) group would write.
+
+    That holds if we wrote this exact file, with the same rank table values, in the same
+    calendar year: the estimation horizon in see_future moves with the current year.
+    """
+    return (
+        entry is not None
+        and entry["year"] == year
+        and entry["ranks"] == ranks
+        and sha256_of_file(group_path(group)) == entry["sha256"]
+    )
+
+
+def postprocess_group(group, group_confs, reestimate, add_conf_rank, add_core_rank, args):
+    """Estimate future instances, attach ranks, and unite tags for one group."""
+    if reestimate or args.reestimate:
+        group_confs = {key: conf for key, conf in group_confs.items() if not conf["isApproximateDeadline"]}
+    try:
+        future_conferences = estimate_future_conferences(group_confs)
+        future_conferences = {key: parse_all_times(conf) for key, conf in future_conferences.items()}
+    except Exception as e:
+        logger.error(f"ERROR estimating future conferences of group {group}: {e}")
+        if args.reestimate:
+            raise e
+        future_conferences = {}
+
+    group_confs = {**future_conferences, **group_confs}
+    group_confs = {key: add_conf_rank(conf) for key, conf in group_confs.items()}
+    group_confs = {key: add_core_rank(conf) for key, conf in group_confs.items()}
+    group_confs = unite_tags(group_confs)
+    return parse_stuff(group_confs)
+
+
+def write_groups(conferences, reestimate_groups, args, dirty_groups=None, state=None, written=None,
+                 add_core_rank=None):
+    """Post-process every group and write the YAML files that changed.
+
+    With ``dirty_groups`` (incremental mode), a group outside it is reused as-is when
+    ``state`` shows its file is still current. Returns the new ``{group: state entry}``.
+    A ``written`` dict receives ``{group: (sha256 of its YAML, records)}`` for every group
+    post-processed and written, so a caller in the same process needn't parse the files again.
+    ``add_core_rank`` is made here (refreshing the CORE table if due) unless given.
+    """
     reestimate_groups = set(reestimate_groups)
+    state = state or {}
     add_conf_rank = make_conf_rank_function()
 
-    conf_groups = {}
-    for key, val in conferences.items():
-        conf_groups.setdefault(key[:-4], {})[key] = val
+    conf_groups = group_conferences(conferences)
 
-    add_core_rank = make_core_rank_function(conf_groups.keys(), online=args.online)
+    if add_core_rank is None:
+        add_core_rank = make_core_rank_function(conf_groups.keys(), online=args.online)
 
     if not args.reestimate:
         logger.info(f"Will reestimate futures for: {reestimate_groups}")
+    year = datetime.datetime.now().year
+    new_state, written_count, reused = {}, 0, 0
     for group, group_confs in conf_groups.items():
+        ranks = _rank_key(group, add_conf_rank, add_core_rank)
+        if (
+            dirty_groups is not None
+            and group not in dirty_groups
+            and not args.reestimate
+            and _is_current(state.get(group), group, year, ranks)
+        ):
+            new_state[group] = state[group]
+            reused += 1
+            continue
         logger.info(f"write out group {group}: {list(group_confs.keys())}")
-        if group in reestimate_groups or args.reestimate:
-            group_confs = {key: conf for key, conf in group_confs.items() if not conf["isApproximateDeadline"]}
-        try:
-            future_conferences = estimate_future_conferences(group_confs)
-            future_conferences = {key: parse_all_times(conf) for key, conf in future_conferences.items()}
-        except Exception as e:
-            logger.error(f"ERROR estimating future conferences of group {group}: {e}")
-            if args.reestimate:
-                raise e
-            future_conferences = {}
-
-        group_confs = {**future_conferences, **group_confs}
-        group_confs = {key: add_conf_rank(conf) for key, conf in group_confs.items()}
-        group_confs = {key: add_core_rank(conf) for key, conf in group_confs.items()}
-        group_confs = unite_tags(group_confs)
-        group_confs = parse_stuff(group_confs)
+        group_confs = postprocess_group(
+            group, group_confs, group in reestimate_groups, add_conf_rank, add_core_rank, args
+        )
         if args.write:
-            with open(os.path.join(CONFERENCE_FOLDER, f"{group}.yaml"), "w") as f:
-                yaml.safe_dump(group_confs, f)
+            changed, sha256 = write_group(group, group_confs)
+            written_count += changed
+            new_state[group] = {"sha256": sha256, "year": year, "ranks": ranks}
+            if written is not None:
+                written[group] = (sha256, group_confs)
         else:
             logger.info(group_confs)
+    logger.info(f"recomputed {len(conf_groups) - reused} groups, reused {reused}")
+    if args.write:
+        logger.info(f"wrote {written_count} of {len(conf_groups)} groups; the rest were unchanged")
+    return new_state
+
+
+def update(args, written=None, pull=None, timings=None, core_ranks=None):
+    """Load, (with ``args.online``) scrape and merge, post-process and write the conference files.
+
+    The steps run as ``stages``: the online fetches and the CORE rank refresh overlap each
+    other and, given a ``pull`` callable (``git pull``), the pull too; loading waits for the
+    pull, and merging for the load and every fetch. The official websites fetch only the
+    instances ``crawl_schedule`` plans for this run, so they wait for the load as well. ``written`` is passed on to
+    ``write_groups``; ``timings`` receives each stage's wall time. ``core_ranks`` is a CORE
+    table already in memory; it is refreshed in place rather than loaded.
+    """
+    def load(*_):  # after the pull, if any
+        conferences = load_conferences(transform=parse_all_times)
+        # Incremental mode diffs against the records as loaded to find the groups that merging,
+        # NIPS normalization or timeline dropping touched.
+        loaded = deepcopy(conferences) if args.incremental else None
+        return conferences, loaded, list(group_conferences(conferences))
+
+    def refresh_core_ranks(loaded):
+        """The CORE table, refreshed for the loaded groups if due; and the groups refreshed."""
+        ranks = load_core_ranks() if core_ranks is None else core_ranks
+        if args.online and core_update_due():
+            return update_core_ranks(loaded[2], ranks), set(loaded[2])
+        return ranks, None
+
+    def plan(loaded):
+        """The official-website instances to fetch, or None to walk every year."""
+        if args.historic:
+            return None
+        chosen = crawl_schedule.plan(crawl_candidates(), loaded[0], crawl_state, budget=args.fetch_budget)
+        return {instance for _, instance in chosen}
+
+    def merge(loaded, *fetched):
+        conferences, reestimate_groups, records = loaded[0], [], []
+        for (source, website, _), result in zip(fetches, fetched):
+            if website is not None:
+                for year, data in result:
+                    crawl_schedule.record(crawl_state, website, f"{website}{year}", data)
+                result = [data for _, data in result if data]
+            records.append((source, result))
+        if args.write and fetches:
+            crawl_schedule.save_state(crawl_state)
+        merge_fetched(conferences, records, reestimate_groups)
+        normalize_nips(conferences)
+        drop_empty_timelines(conferences)
+        return reestimate_groups
+
+    def write(loaded, reestimate_groups, core):
+        conferences, before, _ = loaded
+        ranks, refreshed = core
+        dirty_groups = None
+        if args.incremental:
+            dirty_groups = changed_groups(before, conferences) | set(reestimate_groups)
+            logger.info(f"dirty groups: {sorted(dirty_groups)}")
+        new_groups = [group for group in group_conferences(conferences) if refreshed is not None and group not in refreshed]
+        if new_groups:  # the merge brought groups the refresh didn't know of yet
+            update_core_ranks(new_groups, ranks)
+        state = write_groups(conferences, reestimate_groups, args, dirty_groups, load_pipeline_state(), written,
+                             add_core_rank=core_rank_function(ranks))
+        if args.write:
+            save_pipeline_state(state)
+
+    fetches = online_fetches(args) if args.online else []
+    crawl_state = crawl_schedule.load_state()
+    pulled = ("git-pull",) if pull is not None else ()
+    stages = [Stage("git-pull", pull)] if pull is not None else []
+    stages += [stage for _, _, stage in fetches]  # the bulk feeds don't read conferences/, so start at once
+    stages += [
+        Stage("load", load, pulled),
+        Stage("crawl-plan", plan, ("load",)),
+        Stage("core-ranks", refresh_core_ranks, ("load",)),
+        Stage("merge", merge, ("load", *(stage.name for _, _, stage in fetches))),
+        Stage("write", write, ("load", "merge", "core-ranks")),
+    ]
+    run_stages(stages, timings=timings)
+    log_stats()
+    parse_cache.save()
 
 
 def main():
-    args = parse_args()
-    conferences = load_conferences()
-    reestimate_groups = []
-    if args.online:
-        scrape_online(conferences, args, reestimate_groups)
-    normalize_nips(conferences)
-    drop_empty_timelines(conferences)
-    write_groups(conferences, reestimate_groups, args)
+    update(parse_args())
 
 
 if __name__ == "__main__":
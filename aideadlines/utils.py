@@ -1,95 +1,88 @@
-import dateparser
+from . import parse_cache
+from .dates import parse_datetime
 from .log_config import logger
+from .timezones import TZ_ALIASES, resolve, split_timezone
 from copy import deepcopy
+import hashlib
+import json
 import pytz
 import re
 import datetime
 
-TZ_REPLACE = {
-    # US timezone abbreviations
-    "Pacific Time": "PST",
-    "PT": "PST",
-    "Eastern Time": "EST",
-    "ET": "EST",
-    "Central Time": "CST",
-    "CT": "CST",
-    "Mountain Time": "MST",
-    # Named timezone regions
-    "Russia/Moscow": "GMT+3",
-    "Europe/London": "GMT+0",
-    "Europe/Paris": "GMT+1",
-    "Europe/Berlin": "GMT+1",
-    "Europe/Rome": "GMT+1",
-    "Europe/Madrid": "GMT+1",
-    "Europe/Amsterdam": "GMT+1",
-    "Europe/Zurich": "GMT+1",
-    "Europe/Vienna": "GMT+1",
-    "Asia/Tokyo": "GMT+9",
-    "Asia/Shanghai": "GMT+8",
-    "Asia/Singapore": "GMT+8",
-    "Asia/Seoul": "GMT+9",
-    "Asia/Hong_Kong": "GMT+8",
-    "Asia/Kolkata": "GMT+5:30",
-    "Australia/Sydney": "GMT+11",
-    "Australia/Melbourne": "GMT+11",
-    "Pacific/Honolulu": "UTC-10",
-    # European timezone abbreviations
-    "CET": "GMT+1",
-    "CEST": "GMT+2",
-    "EET": "GMT+2",
-    "EEST": "GMT+3",
-    # Asian timezone abbreviations
-    "JST": "GMT+9",
-    "KST": "GMT+9",
-    "CST": "GMT+8",
-    "China Standard Time": "GMT+8",
-    "IST": "GMT+5:30",
-    # Australian timezone abbreviations
-    "AEST": "GMT+10",
-    "AEDT": "GMT+11",
-    "AWST": "GMT+8",
-    # Other common formats
-    "(Anywhere on Earth)": "AoE",
-    "Anywhere on Earth": "AoE",
-    "AoE": "UTC-12",
-}
+# Bump whenever _parse_timestr can return something different for the same input, so the
+# persistent parse cache (parse_cache.py) is discarded instead of serving stale results.
+PARSER_VERSION = 2
+
+_CACHE_FINGERPRINT = hashlib.sha256(json.dumps([PARSER_VERSION, TZ_ALIASES], sort_keys=True).encode()).hexdigest()
+_year_re = re.compile(r"\d{4}")
+_explicit_time_re = re.compile(r"\d+:\d+")
+_iso_date_re = re.compile(r"\d{4}-\d{2}-\d{2}")
+_iso_deadline_re = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$")
 
 
 def _parse_timestr(timestr, with_time, conf_tz=None):
+    """Parse ``timestr`` to 'YYYY-MM-DD' (or a UTC 'YYYY-MM-DDTHH:MM:SSZ' ``with_time``), or None.
+
+    Results are memoized across runs by ``parse_cache``. Only strings with an explicit year
+    are cached: without one, dateparser fills in the current year, so the result depends on
+    when it runs.
+    """
     if conf_tz is None:
         conf_tz = "AoE"
+    if not isinstance(timestr, str) or not _year_re.search(timestr):
+        return _parse_timestr_uncached(timestr, with_time, conf_tz)
+    cache = parse_cache.get_cache(_CACHE_FINGERPRINT)
+    key = cache.key(timestr, conf_tz, with_time)
+    result = cache.get(key)
+    if result is parse_cache.MISSING:
+        result = _parse_timestr_uncached(timestr, with_time, conf_tz)
+        cache.put(key, result)
+    elif result is None:
+        logger.error(f"NONE: '{timestr}'")  # keep reporting unparseable strings on every run
+    return result
+
+
+def _parse_timestr_uncached(timestr, with_time, conf_tz):
     if isinstance(timestr, str):
-        has_explicit_time = bool(re.search(r"\d+:\d+", timestr))
-        for name, tz in TZ_REPLACE.items():
-            timestr = timestr.replace(name, tz)
-        logger.debug(f"replaced to {timestr}")
-        parsed_time = dateparser.parse(timestr)
+        datestr, tzinfo = split_timezone(timestr)
+        has_explicit_time = bool(_explicit_time_re.search(datestr))
+        parsed_time = parse_datetime(datestr)
         if parsed_time is None:
             logger.error(f"NONE: '{timestr}'")
             return None
+        if tzinfo is not None and parsed_time.tzinfo is None:
+            parsed_time = parsed_time.replace(tzinfo=tzinfo)
     else:
         assert isinstance(timestr, datetime.datetime), f"timestr has to be str or datetime, but got {type(timestr)}"
         parsed_time = timestr
-        timestr = timestr.isoformat()
         has_explicit_time = True
     if not with_time:
         return parsed_time.strftime("%Y-%m-%d")
-    if parsed_time.tzinfo is None and conf_tz is not None:
-        for name, tz in TZ_REPLACE.items():
-            timestr = timestr.replace(name, tz)
-        old_parsed_time = parsed_time
-        parsed_time = dateparser.parse(timestr)
-        if parsed_time is None or parsed_time.tzinfo is None:
-            # Timezone wasn't embedded in the string; append the conference timezone
-            tz_str = conf_tz
-            for name, tz in TZ_REPLACE.items():
-                tz_str = tz_str.replace(name, tz)
-            parsed_time = dateparser.parse(timestr + " " + tz_str) or old_parsed_time
     if not has_explicit_time:
         parsed_time = parsed_time.replace(hour=23, minute=59, second=59)
+    if parsed_time.tzinfo is None:
+        # Timezone wasn't embedded in the string; use the conference timezone. zoneinfo zones
+        # pick the offset (daylight saving or not) for this particular date.
+        tzinfo = resolve(conf_tz)
+        if tzinfo is None:
+            logger.warning(f"unknown conference timezone '{conf_tz}', assuming AoE")
+            tzinfo = resolve("AoE")
+        parsed_time = parsed_time.replace(tzinfo=tzinfo)
     return parsed_time.astimezone(pytz.UTC).isoformat().replace("+00:00", "Z")
 
 
+def deadline_epoch(deadline):
+    """Seconds since the epoch of a deadline; None if it doesn't parse."""
+    deadline = str(deadline)
+    if _iso_deadline_re.match(deadline):
+        try:
+            return datetime.datetime.fromisoformat(deadline[:-1] + "+00:00").timestamp()
+        except ValueError:
+            pass  # e.g. month 13: let the lenient parser have its say
+    parsed = _parse_timestr(deadline, with_time=True)
+    return None if parsed is None else datetime.datetime.fromisoformat(parsed.replace("Z", "+00:00")).timestamp()
+
+
 # month_day_re = re.compile(r"[A-Z][a-z]* \d?\d$")
 month_day_re = re.compile(r"^[A-Z,a-z, ]*\d?\d[a-z]*$")
 month_day_time_re = re.compile(r"^([A-Z,a-z, ,\,]*\d?\d[a-z]*)(,? *\d\d:\d\d[A-Z,a-z, ]*)$")
@@ -107,6 +100,8 @@ def parse_all_times(conference):
     conf_tz = conference.get("timezone", "AoE")
     for timekey in ["conferenceStartDate", "conferenceEndDate"]:
         if timekey in conference:
+            if isinstance(conference[timekey], str) and _iso_date_re.fullmatch(conference[timekey]):
+                continue  # already normalized, e.g. by dates.parse_date_range
             timestr = str(conference[timekey])
             if month_day_re.match(timestr.strip()):
                 timestr += f", {year}"
@@ -172,24 +167,6 @@ def unite_tags(conf_group):
     return conf_group
 
 
-def normalize_timezone_for_js(js_tz):
-    """Normalize a conference timezone string to an IANA 'Etc/GMT±N' zone the frontend uses.
-
-    Handles 'UTC±N' offsets (note the POSIX sign flip in 'Etc/GMT') plus the named cases
-    AoE (UTC−12) and Russia/Moscow.
-    """
-    old_tz = js_tz
-    if "UTC" in js_tz:
-        char = "+" if "+" in js_tz else ("-" if "-" in js_tz else None)
-        if char is not None:
-            offset = int(js_tz.split(char)[-1])
-            js_tz = f"Etc/GMT{'+' if char == '-' else '-'}{offset}"
-    js_tz = js_tz.replace("AoE", "Etc/GMT+12").replace("Russia/Moscow", "Etc/GMT+3")
-    if old_tz != js_tz:
-        logger.debug(f"Parsing timezone for json: {old_tz} -> {js_tz}")
-    return js_tz
-
-
 def parse_stuff(conferences):
     # parse GMT timezone strings for use with js
     for conf in conferences.values():
@@ -2,63 +2,177 @@
 
 Run before the auto-commit (see update.py) so a malformed scrape can't silently land in the
 repository. ``validate_conferences`` is pure and unit-tested; ``main`` exits non-zero when
-any problem is found.
+any error is found.
+
+Each problem is a ``Problem`` with the file, conference key and timeline index it concerns,
+so ``--format json`` output can be consumed by tools. The checks are a table built once at
+import. Deadlines in the stored 'YYYY-MM-DDTHH:MM:SSZ' form are checked with one compiled
+regex and ``fromisoformat``; only other strings go through ``_parse_timestr``. The checks
+are CPU-bound, so files are validated one after another. Cross-record checks run over the
+store's id index afterwards:
+an id defined in several files is an error, and a deadline after the conference start is a
+warning (it usually means a stale estimate or a typo in the year).
+
+``--changed`` / ``--since`` (see ``changeset``) restrict validation to the changed files.
 """
 
-import os
+import argparse
+import datetime
+import re
 import sys
+from typing import NamedTuple, Optional
 
-import dateparser
-import yaml
-
+from . import parse_cache
+from .changeset import add_changeset_args, resolve_changeset
+from .codec import json_dumps
+from .dates import log_stats
 from .log_config import logger
-
-THIS_FOLDER = os.path.dirname(__file__)
-CONFERENCE_FOLDER = os.path.join(THIS_FOLDER, os.pardir, "conferences")
+from .store import load_store
+from .utils import _parse_timestr
 
 REQUIRED_KEYS = ("id", "timeline")
 
+_ISO_DEADLINE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$")
+_ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
-def validate_conferences(conferences):
-    """Return a list of human-readable problems; an empty list means the data is valid."""
-    errors = []
+
+class Problem(NamedTuple):
+    file: Optional[str]
+    key: str
+    index: Optional[int]  # timeline index, or None for record-level problems
+    message: str
+    severity: str = "error"
+
+    def __str__(self):
+        where = f"timeline[{self.index}] " if self.index is not None else ""
+        return f"{self.key}: {where}{self.message}"
+
+
+def _normalized_deadline(conf, deadline):
+    """The deadline as 'YYYY-MM-DDTHH:MM:SSZ', or None if it doesn't parse."""
+    deadline = str(deadline)
+    if _ISO_DEADLINE_RE.match(deadline):
+        try:
+            datetime.datetime.fromisoformat(deadline[:-1])
+            return deadline
+        except ValueError:
+            pass  # e.g. month 13: let the lenient parser have its say
+    return _parse_timestr(deadline, with_time=True, conf_tz=conf.get("timezone"))
+
+
+def _check_required_keys(conf):
+    for req in REQUIRED_KEYS:
+        if req not in conf:
+            yield None, f"missing required key '{req}'"
+
+
+def _check_name(conf):
+    if not conf.get("shortname") and not conf.get("title"):
+        yield None, "needs a shortname or title"
+
+
+def _check_timeline(conf):
+    timeline = conf.get("timeline")
+    if not isinstance(timeline, list) or len(timeline) == 0:
+        yield None, "timeline must be a non-empty list"
+        return
+    for i, entry in enumerate(timeline):
+        if not isinstance(entry, dict):
+            yield i, "is not a mapping"
+        elif "deadline" not in entry:
+            yield i, "missing 'deadline'"
+        elif _normalized_deadline(conf, entry["deadline"]) is None:
+            yield i, f"has unparseable deadline {entry['deadline']!r}"
+
+
+# (check, severity): each check yields (timeline index or None, message) per problem.
+RECORD_CHECKS = (
+    (_check_required_keys, "error"),
+    (_check_name, "error"),
+    (_check_timeline, "error"),
+)
+
+
+def _validate_records(conferences, file=None):
+    problems = []
     for key, conf in conferences.items():
         if not isinstance(conf, dict):
-            errors.append(f"{key}: not a mapping")
+            problems.append(Problem(file, key, None, "not a mapping"))
             continue
-        for req in REQUIRED_KEYS:
-            if req not in conf:
-                errors.append(f"{key}: missing required key '{req}'")
-        if not conf.get("shortname") and not conf.get("title"):
-            errors.append(f"{key}: needs a shortname or title")
-        timeline = conf.get("timeline")
-        if not isinstance(timeline, list) or len(timeline) == 0:
-            errors.append(f"{key}: timeline must be a non-empty list")
+        for check, severity in RECORD_CHECKS:
+            problems.extend(Problem(file, key, index, message, severity) for index, message in check(conf))
+    return problems
+
+
+def validate_conferences(conferences):
+    """Return a list of human-readable problems; an empty list means the data is valid."""
+    return [str(problem) for problem in _validate_records(conferences)]
+
+
+def _deadlines_after_start(store, keys):
+    """Warn about deadlines later than the conference's start date."""
+    for key in keys:
+        conf = store[key]
+        start = str(conf.get("conferenceStartDate", ""))
+        if not isinstance(conf.get("timeline"), list) or not _ISO_DATE_RE.match(start):
             continue
-        for i, entry in enumerate(timeline):
-            if "deadline" not in entry:
-                errors.append(f"{key}: timeline[{i}] missing 'deadline'")
-            elif dateparser.parse(str(entry["deadline"])) is None:
-                errors.append(f"{key}: timeline[{i}] has unparseable deadline {entry['deadline']!r}")
-    return errors
+        for i, entry in enumerate(conf["timeline"]):
+            if not isinstance(entry, dict) or "deadline" not in entry:
+                continue
+            deadline = _normalized_deadline(conf, entry["deadline"])
+            if deadline is not None and deadline[:10] > start:
+                yield Problem(store.sources.get(key), key, i, f"deadline {deadline} is after the start {start}", "warning")
 
 
-def load_conferences():
-    conferences = {}
-    for conf_file in os.listdir(CONFERENCE_FOLDER):
-        with open(os.path.join(CONFERENCE_FOLDER, conf_file)) as f:
-            conferences.update(yaml.safe_load(f) or {})
-    return conferences
+def validate_store(store, files=None):
+    """All problems in ``store``: per-file record checks, then cross-record checks.
 
+    ``files`` restricts validation to the records of those files (and their duplicates).
+    """
+    by_file = {}
+    for key, conf in store.items():
+        if files is None or store.sources.get(key) in files:
+            by_file.setdefault(store.sources.get(key), {})[key] = conf
+    duplicates = [dup for dup in store.duplicates if files is None or {dup[1], dup[2]} & files]
+    problems = [p for file, confs in by_file.items() for p in _validate_records(confs, file)]
+    problems.extend(Problem(ignored, conf_id, None, f"defined in both {kept} and {ignored}")
+                    for conf_id, kept, ignored in duplicates)
+    problems.extend(_deadlines_after_start(store, [key for confs in by_file.values() for key in confs]))
+    return problems
 
-def main():
-    errors = validate_conferences(load_conferences())
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    add_changeset_args(parser)
+    parser.add_argument("--format", choices=("text", "json"), default="text",
+                        help="json prints one problem object per line to stdout")
+    return parser.parse_args()
+
+
+def report(problems, output_format="text"):
+    """Print or log every problem; returns whether validation passed (no errors)."""
+    errors = [p for p in problems if p.severity == "error"]
+    for p in problems:
+        if output_format == "json":
+            sys.stdout.write(json_dumps(p._asdict()).decode() + "\n")
+        elif p.severity == "error":
+            logger.error(f"VALIDATION: {p.file}: {p}")
+        else:
+            logger.warning(f"VALIDATION: {p.file}: {p}")
     if errors:
-        for e in errors:
-            logger.error(f"VALIDATION: {e}")
         logger.error(f"conference validation failed with {len(errors)} problem(s)")
+        return False
+    logger.info(f"conference validation passed ({len(problems)} warning(s))")
+    return True
+
+
+def main():
+    args = parse_args()
+    problems = validate_store(load_store(), resolve_changeset(args))
+    log_stats()
+    parse_cache.save()
+    if not report(problems, args.format):
         sys.exit(1)
-    logger.info("conference validation passed")
 
 
 if __name__ == "__main__":
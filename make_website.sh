@@ -9,22 +9,16 @@ python3 update.py 2>&1 | tee status.ansi
 # echo "2. update tailwindcss"
 # ./update_tailwind.sh
 
-echo "2. copy files over"
-mkdir -p html/data html/fonts
-cp aideadlines/*.html aideadlines/*.js aideadlines/*.css html/
-cp aideadlines/data/*.json html/data/
-cp aideadlines/fonts/*.woff2 html/fonts/
-cp aideadlines/*.ico aideadlines/*.svg aideadlines/*.png aideadlines/site.webmanifest aideadlines/robots.txt aideadlines/sitemap.xml html/
-
 # Render the colored run into the served status page (served at /status.html).
 # The plain "=== PIPELINE OK ===" marker survives verbatim for the Uptime Kuma keyword check.
-echo "3. render status page"
+echo "2. render status page"
+mkdir -p html
 python3 aideadlines/ansi_to_html.py html/status.html <status.ansi
 
-# Machine-readable freshness + health for the Uptime Kuma JSON-query monitor (served at /status.json).
+# Copy, prerender, fingerprint and compress (gzip, plus brotli when installed) whatever changed,
+# and write html/assets.json. Also writes the machine-readable freshness + health for the
+# Uptime Kuma JSON-query monitor (served at /status.json), which names the live asset manifest.
 # Monitor: expression `ok and ($millis()/1000 - updated < 7200)`, expected `true` (down if failed OR >2h stale).
-grep -q '=== PIPELINE OK ===' status.ansi && ok=true || ok=false
-printf '{"updated": %s, "ok": %s}\n' "$(date +%s)" "$ok" >html/status.json
-
-echo "4. compress files: gzip"
-find html -type f \( -name '*.json' -o -name '*.html' -o -name '*.js' -o -name '*.css' -o -name '*.ttf' -o -name '*.woff2' -o -name '*.xml' -o -name '*.svg' -o -name '*.jpg' -o -name '*.webp' \) -exec gzip -v -k -f --best {} \;
+echo "3. build site"
+grep -q '=== PIPELINE OK ===' status.ansi && status=ok || status=failed
+python3 -m aideadlines.build_site html --status "$status"
@@ -11,6 +11,8 @@ from copy import deepcopy
 
 import pytest
 
+from aideadlines import parse_cache, store
+
 
 @pytest.fixture
 def real_conf_pair():
@@ -45,3 +47,16 @@ def real_conf_pair():
 def clone():
     """Return a deepcopy helper so tests never mutate fixtures in place."""
     return deepcopy
+
+
+@pytest.fixture(autouse=True)
+def in_memory_parse_cache(monkeypatch):
+    """Keep the persistent parse cache off disk so tests never read or write data/."""
+    monkeypatch.setattr(parse_cache, "CACHE_FILE", None)
+    monkeypatch.setattr(parse_cache, "_cache", None)
+
+
+@pytest.fixture(autouse=True)
+def no_conference_snapshot(monkeypatch):
+    """Never read or write the real conference snapshot next to conferences/."""
+    monkeypatch.setattr(store, "SNAPSHOT_FILE", None)
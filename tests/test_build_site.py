@@ -0,0 +1,99 @@
+"""Tests for aideadlines.build_site — the incremental, fingerprinted site build."""
+
+import gzip
+import hashlib
+import json
+import os
+
+import pytest
+
+from aideadlines.build_site import ASSET_MANIFEST, build, fingerprint, write_status
+
+FILES = {
+    "index.html": '<link rel="stylesheet" href="styles.css"><link rel="preload" href="fonts/a.woff2">'
+                  '<script src="scripts.js" defer></script>',
+    "styles.css": 'src: url("fonts/a.woff2");',
+    "scripts.js": "fetch('data/conferences.json');",
+    "robots.txt": "User-agent: *",
+    "fonts/a.woff2": "font",
+    "data/manifest.json": "{}",
+    "data/archive/2024.json": "[]",
+    "data/.parse_cache.json": "{}",
+}
+
+
+def _write(root, files):
+    for name, content in files.items():
+        path = os.path.join(root, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(content)
+
+
+def _read(path):
+    with open(path) as f:
+        return f.read()
+
+
+@pytest.fixture
+def site(tmp_path):
+    source, output = tmp_path / "src", tmp_path / "html"
+    _write(source, FILES)
+    return str(source), str(output)
+
+
+def test_assets_are_fingerprinted_and_references_rewritten(site):
+    source, output = site
+    assets = build(output, source)["assets"]
+    font, css, js = assets["fonts/a.woff2"]["path"], assets["styles.css"]["path"], assets["scripts.js"]["path"]
+    assert font == fingerprint("fonts/a.woff2", assets["fonts/a.woff2"]["sha256"]) and font.startswith("fonts/a.")
+    assert _read(os.path.join(output, css)) == f'src: url("{font}");'
+    index = _read(os.path.join(output, "index.html"))
+    assert f'href="{css}"' in index and f'src="{js}"' in index and f'href="{font}"' in index
+    assert assets["data/archive/2024.json"]["path"] == "data/archive/2024.json"
+    assert "data/.parse_cache.json" not in assets
+    assert gzip.decompress(open(os.path.join(output, js + ".gz"), "rb").read()) == FILES["scripts.js"].encode()
+    assert not os.path.exists(os.path.join(output, "robots.txt.gz"))
+
+
+def test_unchanged_build_writes_nothing(site):
+    source, output = site
+    build(output, source)
+    files = {os.path.join(d, f) for d, _, fs in os.walk(output) for f in fs}
+    mtimes = {path: os.stat(path).st_mtime_ns for path in files}
+    build(output, source)
+    assert {os.path.join(d, f) for d, _, fs in os.walk(output) for f in fs} == files
+    assert {path: os.stat(path).st_mtime_ns for path in files} == mtimes
+
+
+def test_a_changed_font_refingerprints_the_stylesheet(site):
+    source, output = site
+    before = build(output, source)["assets"]
+    _write(source, {"fonts/a.woff2": "new font"})
+    after = build(output, source)["assets"]
+    assert after["fonts/a.woff2"]["path"] != before["fonts/a.woff2"]["path"]
+    assert after["styles.css"]["path"] != before["styles.css"]["path"]
+    assert after["scripts.js"] == before["scripts.js"]
+
+
+def test_removed_files_go_and_old_fingerprints_stay_one_build(site):
+    source, output = site
+    old_js = build(output, source)["assets"]["scripts.js"]["path"]
+    os.remove(os.path.join(source, "data/archive/2024.json"))
+    _write(source, {"scripts.js": "changed();"})
+    build(output, source)
+    assert not os.path.exists(os.path.join(output, "data/archive/2024.json"))
+    assert not os.path.exists(os.path.join(output, "data/archive/2024.json.gz"))
+    assert os.path.exists(os.path.join(output, old_js))  # pages loaded before the deploy still work
+    build(output, source)
+    assert not os.path.exists(os.path.join(output, old_js)) and not os.path.exists(os.path.join(output, old_js + ".gz"))
+
+
+def test_status_names_the_live_manifest(site):
+    source, output = site
+    build(output, source)
+    write_status(output, True, now=1700000000)
+    status = json.loads(_read(os.path.join(output, "status.json")))
+    assert status["ok"] is True and status["updated"] == 1700000000
+    with open(os.path.join(output, ASSET_MANIFEST), "rb") as f:
+        assert status["assets"] == hashlib.sha256(f.read()).hexdigest()[:12]
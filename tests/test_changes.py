@@ -0,0 +1,59 @@
+"""Tests for aideadlines.changes — applying the feed's deltas must reproduce the published records."""
+
+from copy import deepcopy
+
+from aideadlines import changes
+
+OLD = {
+    "abc2025-1": {"id": "abc2025-1", "deadline": "2025-01-15T23:59:59Z", "note": "Papers"},
+    "old2024-1": {"id": "old2024-1", "deadline": "2024-01-15T23:59:59Z"},
+}
+NEW = {
+    "abc2025-1": {"id": "abc2025-1", "deadline": "2025-01-22T23:59:59Z", "website": "https://abc.org"},
+    "xyz2025-1": {"id": "xyz2025-1", "deadline": "2025-05-01T23:59:59Z"},
+}
+
+
+def test_diff_has_field_level_changes():
+    delta = changes.diff_records(OLD, NEW)
+    assert list(delta["added"]) == ["xyz2025-1"] and delta["removed"] == ["old2024-1"]
+    assert delta["modified"] == {
+        "abc2025-1": {
+            "deadline": {"from": "2025-01-15T23:59:59Z", "to": "2025-01-22T23:59:59Z"},
+            "note": {"from": "Papers"},
+            "website": {"to": "https://abc.org"},
+        }
+    }
+    assert changes.apply_delta(deepcopy(OLD), delta) == NEW
+
+
+def test_sequence_only_advances_on_changes(tmp_path):
+    path = str(tmp_path / "changes.json")
+    assert changes.publish(path, changes.diff_records(OLD, NEW), "2025-03-01T00:00:00Z") == 1
+    assert changes.publish(path, changes.diff_records(NEW, NEW), "2025-03-02T00:00:00Z") == 1
+    assert changes.publish(path, changes.diff_records(NEW, OLD), "2025-03-03T00:00:00Z") == 2
+    feed = changes.load_feed(path)
+    assert [delta["sequence"] for delta in feed["deltas"]] == [1, 2]
+    assert feed["deltas"][1]["published"] == "2025-03-03T00:00:00Z"
+
+
+def test_bounded_history_and_catch_up(tmp_path):
+    path = str(tmp_path / "changes.json")
+    versions = [OLD, NEW, OLD, NEW, OLD]
+    for before, after in zip(versions, versions[1:]):
+        changes.publish(path, changes.diff_records(before, after), "2025-03-01T00:00:00Z", history=2)
+    feed = changes.load_feed(path)
+    assert feed["sequence"] == 4 and [delta["sequence"] for delta in feed["deltas"]] == [3, 4]
+
+    assert changes.catch_up(feed, 4) == []
+    assert changes.catch_up(feed, 1) is None  # delta 2 is gone: download everything
+    records = deepcopy(versions[2])
+    for delta in changes.catch_up(feed, 2):
+        changes.apply_delta(records, delta)
+    assert records == versions[4]
+
+
+def test_unreadable_feed_starts_over(tmp_path):
+    path = tmp_path / "changes.json"
+    path.write_bytes(b"{not json")
+    assert changes.load_feed(str(path)) == {"version": changes.CHANGES_VERSION, "sequence": 0, "deltas": []}
@@ -0,0 +1,40 @@
+"""Tests for aideadlines.changeset."""
+
+import argparse
+
+from aideadlines import changeset
+
+
+def _args(*argv):
+    parser = argparse.ArgumentParser()
+    changeset.add_changeset_args(parser)
+    return parser.parse_args(argv)
+
+
+def test_conference_files():
+    paths = ["conferences/cvpr.yaml", "ieee cec.yaml", "./conferences/../conferences/aaai.yaml", "rank/core.yaml",
+             "README.md"]
+    assert changeset.conference_files(paths) == {"cvpr.yaml", "ieee cec.yaml", "aaai.yaml"}
+
+
+def test_resolve_changeset(monkeypatch):
+    assert changeset.resolve_changeset(_args()) is None
+    assert changeset.resolve_changeset(_args("--changed", "conferences/cvpr.yaml")) == {"cvpr.yaml"}
+
+    monkeypatch.setattr(changeset, "last_published_commit", lambda: None)
+    assert changeset.resolve_changeset(_args("--since")) is None
+
+    monkeypatch.setattr(changeset, "last_published_commit", lambda: "abc123")
+    monkeypatch.setattr(changeset, "git_changed_files", lambda since: {f"{since}.yaml"})
+    assert changeset.resolve_changeset(_args("--since")) == {"abc123.yaml"}
+    assert changeset.resolve_changeset(_args("--since", "HEAD~1")) == {"HEAD~1.yaml"}
+
+
+def test_code_changes_mean_everything(monkeypatch):
+    outputs = {"diff": "conferences/cvpr.yaml\0aideadlines/utils.py\0", "ls-files": ""}
+    monkeypatch.setattr(changeset, "_git", lambda cmd, *args: outputs[cmd])
+    assert changeset.git_changed_files("HEAD") is None
+
+    outputs["diff"] = "conferences/cvpr.yaml\0README.md\0"
+    outputs["ls-files"] = "conferences/new.yaml\0"
+    assert changeset.git_changed_files("HEAD") == {"cvpr.yaml", "new.yaml"}
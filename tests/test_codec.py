@@ -0,0 +1,58 @@
+"""Tests for aideadlines.codec — every backend must produce the same data and bytes."""
+
+import datetime
+
+import pytest
+import yaml
+
+from aideadlines import codec
+
+RECORD = {
+    "id": "abc2025",
+    "title": "Conférence ABC",
+    "timeline": [{"deadline": "2025-01-15T23:59:59Z", "note": "abstract"}],
+    "h5Index": 42,
+    "score": 0.1,
+    "isApproximateDeadline": False,
+    "rating": None,
+}
+
+
+def test_json_is_compact_sorted_utf8():
+    assert codec.json_dumps({"b": 1, "a": "é"}) == '{"a":"é","b":1}'.encode()
+
+
+def test_json_backends_agree(monkeypatch):
+    fast = codec.json_dumps([RECORD])
+    monkeypatch.setattr(codec, "orjson", None)
+    assert codec.json_dumps([RECORD]) == fast
+    assert codec.json_loads(fast) == [RECORD]
+
+
+def test_json_decode_error_is_shared(monkeypatch):
+    with pytest.raises(codec.JSONDecodeError):
+        codec.json_loads("[1,")
+    monkeypatch.setattr(codec, "orjson", None)
+    with pytest.raises(codec.JSONDecodeError):
+        codec.json_loads("[1,")
+
+
+def test_yaml_round_trip_keeps_sorted_keys_and_anchors():
+    tags = ["CV", "ML"]
+    data = {"b2025": {"tags": tags, "start": datetime.date(2025, 6, 1)}, "a2025": {"tags": tags}}
+    text = codec.yaml_dump(data)
+    assert text.index("a2025") < text.index("b2025")
+    assert "&id001" in text and "*id001" in text
+    assert codec.yaml_load(text) == data
+    assert text == codec.yaml_dump(data, dumper=yaml.SafeDumper)
+
+
+def test_write_if_changed(tmp_path):
+    path = str(tmp_path / "abc.yaml")
+    assert codec.write_if_changed(path, b"a: 1\n") is True
+    mtime = (tmp_path / "abc.yaml").stat().st_mtime_ns
+    assert codec.write_if_changed(path, b"a: 1\n") is False
+    assert (tmp_path / "abc.yaml").stat().st_mtime_ns == mtime
+    assert codec.write_if_changed(path, b"a: 2\n") is True
+    assert (tmp_path / "abc.yaml").read_bytes() == b"a: 2\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["abc.yaml"]
@@ -0,0 +1,47 @@
+"""Tests for aideadlines.compact — decoding must give back exactly the encoded records."""
+
+import pytest
+
+from aideadlines.codec import json_dumps, json_loads
+from aideadlines.compact import decode, encode
+
+RECORDS = [
+    {"id": "abc2025-1", "title": "ABC", "tags": ["CV", "ML"], "timezone": "UTC", "location": None,
+     "deadline": "2025-01-15T23:59:59Z", "abstractDeadline": "2025-01-08T23:59:59Z", "note": "Papers"},
+    {"id": "abc2025-2", "title": "ABC", "tags": ["CV", "ML"], "timezone": "UTC", "location": None,
+     "deadline": "2025-04-01T23:59:59Z", "note": "Workshops"},
+    {"id": "xyz2024-1", "title": "XYZ", "tags": ["CV", "ML"], "timezone": "UTC", "h5Index": 42,
+     "deadline": "Jan 15, 2024 23:59 PST"},
+]
+
+
+def _round_trip(records):
+    return decode(json_loads(json_dumps(encode(records))))
+
+
+def test_round_trip_is_lossless():
+    assert json_dumps(_round_trip(RECORDS)) == json_dumps(RECORDS)
+    assert _round_trip([]) == []
+
+
+def test_conferences_and_repeated_values_are_stored_once():
+    document = encode(RECORDS)
+    assert document["conferences"]["count"] == 2 and document["deadlines"]["count"] == 3
+    assert document["conferences"]["columns"]["tags"] == {"dict": [["CV", "ML"]], "index": [0, 0]}
+    assert document["conferences"]["columns"]["h5Index"] == [None, 42]
+
+
+def test_deadlines_are_epoch_seconds_unless_not_iso():
+    deadlines = encode(RECORDS)["deadlines"]["columns"]["deadline"]
+    assert deadlines == [1736985599, 1743551999, "Jan 15, 2024 23:59 PST"]
+
+
+def test_records_that_differ_from_their_conference_get_their_own_row():
+    records = [RECORDS[0], {**RECORDS[1], "title": "ABC (renamed)"}]
+    assert encode(records)["conferences"]["count"] == 2
+    assert json_dumps(_round_trip(records)) == json_dumps(records)
+
+
+def test_unknown_version_is_rejected():
+    with pytest.raises(ValueError):
+        decode({**encode(RECORDS), "version": 99})
@@ -0,0 +1,76 @@
+"""Tests for aideadlines.crawl_schedule — which official-website instances a run fetches."""
+
+from aideadlines.crawl_schedule import DAY, SETTLED_INTERVAL, plan, record, score, settled
+
+NOW = 1_700_000_000  # 2023-11-14
+
+
+def _conf(conf_id, deadline, approximate=False, end="2024-06-20"):
+    return {"id": conf_id, "isApproximateDeadline": approximate, "timeline": [{"deadline": deadline}],
+            "conferenceEndDate": end}
+
+
+def _state(*instances, polled=NOW - 2 * DAY, changed=NOW - 400 * DAY):
+    return {"instances": {instance: {"polled": polled, "changed": changed, "sha256": "x"} for instance in instances},
+            "sites": {}}
+
+
+def test_closer_and_estimated_deadlines_score_higher():
+    soon, later = _conf("abc2024", "2023-11-20T23:59:59Z"), _conf("abc2024", "2024-03-01T23:59:59Z")
+    assert score(soon, None, {}, NOW) > score(later, None, {}, NOW)
+    assert score(_conf("abc2024", "2024-03-01T23:59:59Z", approximate=True), None, {}, NOW) > score(later, None, {}, NOW)
+    volatile = {"refetches": 10, "changes": 8}
+    assert score(later, None, volatile, NOW) > score(later, None, {"refetches": 10, "changes": 0}, NOW)
+    recent = {"polled": NOW, "changed": NOW - DAY, "sha256": "x"}
+    assert score(later, recent, {}, NOW) > score(later, {**recent, "changed": NOW - 200 * DAY}, {}, NOW)
+
+
+def test_settled_past_instances_are_polled_rarely():
+    past = _conf("abc2022", "2021-11-01T23:59:59Z", end="2022-06-20")
+    assert settled(past, NOW)
+    assert not settled({**past, "isApproximateDeadline": True}, NOW)
+    assert not settled(_conf("abc2023", "2023-01-01T23:59:59Z", end="2023-12-01"), NOW)  # still to take place
+
+    conferences = {"abc2022": past}
+    assert plan([("abc", "abc2022")], conferences, _state("abc2022", polled=NOW - 20 * DAY), NOW) == []
+    stale = _state("abc2022", polled=NOW - SETTLED_INTERVAL - 1)
+    assert plan([("abc", "abc2022")], conferences, stale, NOW) == [("abc", "abc2022")]
+
+
+def test_the_budget_goes_to_the_highest_priority_first():
+    conferences = {
+        "near2024": _conf("near2024", "2023-11-16T23:59:59Z"),
+        "far2024": _conf("far2024", "2024-09-01T23:59:59Z"),
+    }
+    candidates = [("far", "far2024"), ("near", "near2024"), ("new", "new2025")]
+    state = _state("near2024", "far2024")
+    assert plan(candidates, conferences, state, NOW, budget=2) == [("new", "new2025"), ("near", "near2024")]
+    assert plan(candidates, conferences, state, NOW, budget=None)[-1] == ("far", "far2024")
+
+
+def test_record_tracks_changes_per_site():
+    state = {"instances": {}, "sites": {}}
+    record(state, "abc", "abc2024", {"id": "abc2024"}, now=NOW)
+    record(state, "abc", "abc2024", {"id": "abc2024"}, now=NOW + DAY)
+    assert state["instances"]["abc2024"]["changed"] == NOW and state["instances"]["abc2024"]["polled"] == NOW + DAY
+    record(state, "abc", "abc2024", {"id": "abc2024", "note": "new"}, now=NOW + 2 * DAY)
+    assert state["instances"]["abc2024"]["changed"] == NOW + 2 * DAY
+    assert state["sites"]["abc"] == {"refetches": 2, "changes": 1}
+
+
+def test_a_failing_instance_backs_off_instead_of_crowding_out_the_others():
+    conferences = {f"ok{n}2024": _conf(f"ok{n}2024", "2023-12-01T23:59:59Z") for n in range(3)}
+    candidates = [("broken", "broken2024")] + [(f"ok{n}", f"ok{n}2024") for n in range(3)]
+    state = _state(*conferences)
+    picks = {instance: 0 for _, instance in candidates}
+    for day in range(30):
+        now = NOW + day * DAY
+        for group, instance in plan(candidates, conferences, state, now, budget=1):
+            picks[instance] += 1
+            record(state, group, instance, None if group == "broken" else conferences[instance], now=now)
+    assert state["instances"]["broken2024"]["failures"] == picks["broken2024"] <= 6
+    assert all(picks[instance] >= 6 for instance in conferences)
+
+    record(state, "broken", "broken2024", {"id": "broken2024"}, now=NOW + 30 * DAY)
+    assert "failures" not in state["instances"]["broken2024"]
+    assert state["instances"]["broken2024"]["changed"] == NOW + 30 * DAY and "broken" in state["sites"]
@@ -0,0 +1,198 @@
+"""Tests for aideadlines.data_to_json — patching a change set must equal a full build."""
+
+import hashlib
+from copy import deepcopy
+from datetime import datetime, timezone
+
+from aideadlines import changes
+from aideadlines.codec import json_dumps, json_loads
+from aideadlines.compact import decode
+from aideadlines.data_to_json import (
+    ARCHIVE_FILE,
+    FUTURE_FILE,
+    MANIFEST_FILE,
+    JsonArrayWriter,
+    export,
+    precompute,
+    iter_records,
+    patch_future_past,
+    split_future_past,
+)
+from aideadlines.store import ConferenceStore
+
+NOW = datetime(2025, 3, 1, tzinfo=timezone.utc)
+
+
+def _conf(conf_id, *deadlines):
+    return {"id": conf_id, "title": conf_id, "timezone": "UTC", "timeline": [{"deadline": d} for d in deadlines]}
+
+
+def _store(conferences, sources):
+    return ConferenceStore(deepcopy(conferences), sources=sources)
+
+
+def _full(conferences, sources, now=NOW):
+    future, past = split_future_past(_store(conferences, sources).conferences, now)
+    return json_loads(json_dumps(list(future.values()))), json_loads(json_dumps(list(past.values())))
+
+
+def test_split_future_past_explodes_timelines():
+    future, past = split_future_past({"abc2025": _conf("abc2025", "2025-01-15T23:59:59Z", "2025-04-01T23:59:59Z")}, NOW)
+    assert list(future) == ["abc2025-2"] and list(past) == ["abc2025-1"]
+    assert future["abc2025-2"]["deadline"] == "2025-04-01T23:59:59Z"
+    assert "timeline" not in future["abc2025-2"]
+
+
+def test_patch_matches_full_build():
+    before = {
+        "abc2025": _conf("abc2025", "2025-04-01T23:59:59Z"),
+        "old2024": _conf("old2024", "2024-04-01T23:59:59Z"),
+        "xyz2025": _conf("xyz2025", "2025-02-01T23:59:59Z", "2025-05-01T23:59:59Z"),
+    }
+    sources = {"abc2025": "abc.yaml", "old2024": "old.yaml", "xyz2025": "xyz.yaml"}
+    published = _full(before, sources, now=datetime(2025, 1, 1, tzinfo=timezone.utc))
+
+    # xyz.yaml is edited, old.yaml deleted, and time has moved on past xyz2025's first deadline.
+    after = {"abc2025": before["abc2025"], "xyz2025": _conf("xyz2025", "2025-06-01T23:59:59Z")}
+    after_sources = {"abc2025": "abc.yaml", "xyz2025": "xyz.yaml"}
+    patched = patch_future_past(_store(after, after_sources), {"xyz.yaml"}, *published, now=NOW)
+
+    assert json_dumps(list(patched)) == json_dumps(list(_full(after, after_sources)))
+
+
+def test_records_share_conference_fields_without_copying():
+    conf = _conf("abc2025", "2025-01-15T23:59:59Z", "2025-04-01T23:59:59Z")
+    conf["tags"] = ["ML"]
+    (_, first), (_, second) = iter_records({"abc2025": conf})
+    assert first["tags"] is second["tags"] is conf["tags"]
+    assert conf["timezone"] == "UTC" and "timeline" in conf  # the conference itself is untouched
+
+
+def test_json_array_writer_matches_one_shot_dump(tmp_path):
+    items = [{"b": 1, "a": [1, 2]}, {"id": "x"}]
+    for content in ([], items):
+        writer = JsonArrayWriter(str(tmp_path / "out.json"))
+        for item in content:
+            writer.append(item)
+        writer.close()
+        writer.commit()
+        assert (tmp_path / "out.json").read_bytes() == json_dumps(content)
+    assert [p.name for p in tmp_path.iterdir()] == ["out.json"]
+
+
+def test_export_shards_the_archive_by_year(tmp_path):
+    confs = {
+        "abc2024": _conf("abc2024", "2024-04-01T23:59:59Z"),
+        "abc2025": _conf("abc2025", "2025-01-15T23:59:59Z", "2025-04-01T23:59:59Z"),
+    }
+    confs["abc2025"]["tags"] = ["ML", "Computer Vision"]
+    exporter = export(iter_records(confs), NOW, folder=str(tmp_path))
+    (tmp_path / "archive").mkdir(exist_ok=True)
+    (tmp_path / "archive" / "1999.json").write_bytes(b"[]")  # a shard no longer produced
+    (tmp_path / "upcoming").mkdir(exist_ok=True)
+    (tmp_path / "upcoming" / "ml.json").write_bytes(b"[]")  # per-tag shards aren't produced any more
+    exporter.commit()
+
+    def ids(path):
+        return [record["id"] for record in json_loads((tmp_path / path).read_bytes())]
+
+    assert ids(FUTURE_FILE) == ["abc2025-2"] and ids(ARCHIVE_FILE) == ["abc2024-1", "abc2025-1"]
+    assert ids("archive/2024.json") == ["abc2024-1"] and ids("archive/2025.json") == ["abc2025-1"]
+    assert not (tmp_path / "archive" / "1999.json").exists() and not (tmp_path / "upcoming" / "ml.json").exists()
+    assert not list(tmp_path.rglob("*.tmp"))
+
+    manifest = json_loads((tmp_path / MANIFEST_FILE).read_bytes())
+    assert [entry["year"] for entry in manifest["archiveByYear"]] == [2024, 2025]
+    assert "upcomingByTag" not in manifest
+    for entry in [manifest["upcoming"], manifest["archive"], *manifest["archiveByYear"]]:
+        content = (tmp_path / entry["path"]).read_bytes()
+        assert entry["bytes"] == len(content) and entry["count"] == len(json_loads(content))
+        assert entry["sha256"] == hashlib.sha256(content).hexdigest()
+
+
+def test_in_memory_export_matches_written_files(tmp_path):
+    confs = {"abc2025": _conf("abc2025", "2025-01-15T23:59:59Z", "2025-04-01T23:59:59Z")}
+    written = export(iter_records(confs), NOW, folder=str(tmp_path))
+    written.commit()
+    in_memory = export(iter_records(confs), NOW, in_memory=True)
+    assert in_memory.contents() == {path: (tmp_path / path).read_bytes() for path in written.contents()}
+
+
+def test_compact_outputs_decode_to_the_plain_files(tmp_path):
+    confs = {"abc2025": _conf("abc2025", "2025-01-15T23:59:59Z", "2025-04-01T23:59:59Z")}
+    exporter = export(iter_records(confs), NOW, folder=str(tmp_path), compact=True)
+    exporter.commit()
+    compact = json_loads((tmp_path / MANIFEST_FILE).read_bytes())["compact"]
+    for kind, plain in (("upcoming", FUTURE_FILE), ("archive", ARCHIVE_FILE)):
+        content = (tmp_path / compact[kind]["path"]).read_bytes()
+        assert json_dumps(decode(json_loads(content))) == (tmp_path / plain).read_bytes()
+        assert compact[kind]["bytes"] == len(content) and compact[kind]["count"] == 1
+
+    export(iter_records(confs), NOW, folder=str(tmp_path)).commit()
+    assert not (tmp_path / compact["upcoming"]["path"]).exists()
+
+
+def test_precomputed_fields():
+    conf = _conf("abc2025", "2025-01-15T23:59:59Z")
+    conf.update(rating="A", h5Index=60, conferenceEndDate="2025-06-20")
+    conf["timeline"][0]["abstractDeadline"] = "2025-01-08T23:59:59Z"
+    ((epoch, record),) = iter_records({"abc2025": conf})
+    assert record["deadlineMs"] == epoch * 1000 == datetime(2025, 1, 15, 23, 59, 59, tzinfo=timezone.utc).timestamp() * 1000
+    assert record["abstractDeadlineMs"] == datetime(2025, 1, 8, 23, 59, 59, tzinfo=timezone.utc).timestamp() * 1000
+    assert record["conferenceEndMs"] == datetime(2025, 6, 20, 23, 59, 59, tzinfo=timezone.utc).timestamp() * 1000
+    assert record["ratingOrdinal"] == 4 and record["importance"] == 5.5
+
+
+def test_precompute_without_rating_or_dates():
+    fields = precompute({"rating": "TBR", "conferenceEndDate": "sometime"}, 1.5)
+    assert fields == {"deadlineMs": 1500, "ratingOrdinal": 0, "importance": 1}
+
+
+def test_commit_only_rewrites_changed_files_and_drops_stale_ones(tmp_path):
+    confs = {
+        "abc2025": _conf("abc2025", "2025-04-01T23:59:59Z"),
+        "xyz2025": _conf("xyz2025", "2025-05-01T23:59:59Z"),
+    }
+    export(iter_records(confs), NOW, folder=str(tmp_path)).commit()
+    abc, xyz = tmp_path / "series" / "abc" / "abc2025.json", tmp_path / "series" / "xyz" / "xyz2025.json"
+    abc_mtime = abc.stat().st_mtime_ns
+
+    del confs["xyz2025"]
+    export(iter_records(confs), NOW, folder=str(tmp_path)).commit()
+    assert abc.stat().st_mtime_ns == abc_mtime
+    assert not xyz.exists() and not xyz.parent.exists()
+
+
+def test_delta_compares_only_changed_records(tmp_path):
+    confs = {
+        "abc2024": _conf("abc2024", "2024-04-01T23:59:59Z"),
+        "abc2025": _conf("abc2025", "2025-01-15T23:59:59Z", "2025-04-01T23:59:59Z"),
+        "xyz2025": _conf("xyz2025", "2025-05-01T23:59:59Z"),
+    }
+    before = export(iter_records(confs), NOW, folder=str(tmp_path))
+    before.commit()
+    old = {record["id"]: record for path in (FUTURE_FILE, ARCHIVE_FILE)
+           for record in json_loads((tmp_path / path).read_bytes())}
+
+    after = deepcopy(confs)
+    del after["xyz2025"]
+    after["abc2024"]["note"] = "Camera-ready"
+    after["abc2025"]["timeline"].append({"deadline": "2025-06-01T23:59:59Z"})
+    exporter = export(iter_records(after), NOW, folder=str(tmp_path), previous=before.record_hashes)
+    assert sorted(exporter.changed) == ["abc2024-1", "abc2025-3"]
+    new = {record["id"]: record for record in json_loads(json_dumps([r for _, r in iter_records(after)]))}
+    assert exporter.delta() == changes.diff_records(old, new)
+
+
+def test_calendar_revisions_move_only_with_the_record():
+    confs = {"abc2025": _conf("abc2025", "2025-05-01T23:59:59Z"), "xyz2025": _conf("xyz2025", "2025-06-01T23:59:59Z")}
+    before = export(iter_records(confs), NOW, in_memory=True)
+    assert before.record_hashes["abc2025-1"][2:] == [int(NOW.timestamp()), 0]
+
+    later = datetime(2025, 3, 2, tzinfo=timezone.utc)
+    confs["abc2025"]["note"] = "Camera-ready"
+    after = export(iter_records(confs), later, in_memory=True, previous=before.record_hashes)
+    assert after.record_hashes["abc2025-1"][2:] == [int(later.timestamp()), 1]
+    assert after.record_hashes["xyz2025-1"][2:] == [int(NOW.timestamp()), 0]
+    assert after.blobs["ics/series/xyz.ics"] == before.blobs["ics/series/xyz.ics"]
+    assert b"DTSTAMP:20250302T000000Z\r\nSEQUENCE:1\r\n" in after.blobs["ics/series/abc.ics"]
@@ -0,0 +1,86 @@
+"""Tests for aideadlines.dates — the fast path must agree with dateparser wherever it answers."""
+
+import datetime
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import dateparser
+import pytest
+
+from aideadlines import dates
+
+
+@pytest.mark.parametrize(
+    "timestr",
+    [
+        "2025-01-16T11:59:00Z",
+        "2025-01-16T11:59:00.123+02:00",
+        "2025-01-16",
+        "2025-01-16 23:59:59",
+        "Sep 5, 2025 23:59 UTC-12",
+        "Sept 5 2025",
+        "September 5, 2025, 11:59 pm GMT+5:30",
+        "5 June 2025",
+        "5, June 2025",
+        "Jan 6th, 2025 12:00 AM PST",
+    ],
+)
+def test_fast_path_matches_dateparser(timestr):
+    fast = dates.fast_parse(timestr)
+    slow = dateparser.parse(timestr, languages=["en"])
+    assert fast is not None
+    assert fast.replace(tzinfo=None) == slow.replace(tzinfo=None)
+    assert fast.utcoffset() == slow.utcoffset()
+
+
+@pytest.mark.parametrize(
+    "timestr",
+    [
+        "Sep 5, 2025 23:59 AoE",  # named zone: dateparser's job
+        "2025-13-01",  # dateparser swaps day/month; the fast path must not guess
+        "2025-01-16T11:59:00-05:30",  # offset no real zone uses
+        "2025-01-16Z",  # 'Z' without a time is not ISO-8601
+        "Foo 5, 2025",
+        "next monday",
+    ],
+)
+def test_fast_path_rejects(timestr):
+    assert dates.fast_parse(timestr) is None
+
+
+def test_parse_datetime_counts_both_paths(monkeypatch):
+    monkeypatch.setattr(dates, "STATS", Counter())
+    assert dates.parse_datetime("2025-01-16") == datetime.datetime(2025, 1, 16)
+    assert dates.parse_datetime("not a date xyz") is None
+    assert dates.STATS == {"fast": 1, "dateparser": 1}
+    assert dates.hit_rate() == 0.5
+
+
+def test_parse_datetime_counts_across_threads(monkeypatch):
+    monkeypatch.setattr(dates, "STATS", Counter())
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(dates.parse_datetime, ["2025-01-16"] * 4000))
+    assert dates.STATS == {"fast": 4000}
+
+
+@pytest.mark.parametrize(
+    "text,year,expected",
+    [
+        ("Jun 19-24, 2025", None, ("2025-06-19", "2025-06-24")),
+        ("Feb 28 - Mar 3", 2025, ("2025-02-28", "2025-03-03")),
+        ("Jan 6th - 8th", 2025, ("2025-01-06", "2025-01-08")),
+        ("Jan 6th – 8th", 2025, ("2025-01-06", "2025-01-08")),  # en dash
+        ("19 - 24 June 2025", None, ("2025-06-19", "2025-06-24")),
+        ("30 June - 4 July 2025", None, ("2025-06-30", "2025-07-04")),
+        ("June 11, 12", 2024, ("2024-06-11", "2024-06-12")),
+        ("June 5 2025", None, ("2025-06-05", "2025-06-05")),
+        ("Dec 30 - Jan 2, 2026", None, ("2025-12-30", "2026-01-02")),
+        ("Jun 19-24", None, None),  # no year anywhere
+        ("Jun 31 - Jul 2", 2025, None),  # no such day
+        ("sometime in January", 2025, None),
+        ("Jun 19 - Foo 24, 2025", None, None),  # not a month: not June 19-24
+        ("Foo 19 - Jun 24, 2025", None, None),
+    ],
+)
+def test_parse_date_range(text, year, expected):
+    assert dates.parse_date_range(text, year) == expected
@@ -0,0 +1,52 @@
+"""Tests for aideadlines.ics — valid, stable iCalendar feeds."""
+
+from aideadlines.ics import UPCOMING_CALENDAR, CalendarFeeds, calendar, escape_text, fold
+
+RECORD = {
+    "id": "cvpr2025-1", "shortname": "CVPR 2025", "title": "Computer Vision; and, Pattern Recognition",
+    "tags": ["CV", "ML"], "website": "https://cvpr.thecvf.com/", "isApproximateDeadline": False,
+    "deadlineMs": 1731542399000, "abstractDeadlineMs": 1730937599000,
+}
+REVISIONS = {"cvpr2025-1": (1700000000, 2)}
+
+
+def _lines(content):
+    return content.decode().split("\r\n")
+
+
+def test_events_have_stable_uids_and_utc_times():
+    lines = _lines(calendar("test", [RECORD], REVISIONS))
+    assert lines[0] == "BEGIN:VCALENDAR" and lines[-2:] == ["END:VCALENDAR", ""]
+    assert "UID:cvpr2025-1@aideadlines.nauen-it.de" in lines
+    assert "UID:cvpr2025-1-abstract@aideadlines.nauen-it.de" in lines
+    assert "DTSTART:20241113T235959Z" in lines and "DTSTART:20241106T235959Z" in lines
+    assert "SUMMARY:CVPR 2025 deadline" in lines and "STATUS:CONFIRMED" in lines
+    assert "DTSTAMP:20231114T221320Z" in lines and "SEQUENCE:2" in lines
+    assert r"DESCRIPTION:Computer Vision\; and\, Pattern Recognition" in lines
+
+
+def test_estimated_deadlines_are_tentative():
+    lines = _lines(calendar("test", [{**RECORD, "isApproximateDeadline": True, "abstractDeadlineMs": None}], REVISIONS))
+    assert "STATUS:TENTATIVE" in lines and "SUMMARY:CVPR 2025 deadline (estimated)" in lines
+    assert sum(line == "BEGIN:VEVENT" for line in lines) == 1
+
+
+def test_escape_and_fold():
+    assert escape_text("a\\b;c,d\ne") == r"a\\b\;c\,d\ne"
+    folded = fold("DESCRIPTION:" + "é" * 100)
+    assert all(len(part.encode()) <= 75 for part in folded.split("\r\n"))
+    assert folded.replace("\r\n ", "") == "DESCRIPTION:" + "é" * 100
+
+
+def test_feeds_do_not_depend_on_record_order():
+    records = [RECORD, {**RECORD, "id": "cvpr2024-1", "shortname": "CVPR 2024", "deadlineMs": 1699999999000}]
+    feeds, reversed_feeds = CalendarFeeds(), CalendarFeeds()
+    for record in records:
+        feeds.add(record, True, 1700000000)
+    for record in reversed(records):
+        reversed_feeds.add(record, True, 1700000000)
+    built = feeds.build()
+    assert built == reversed_feeds.build()
+    assert sorted(built) == ["ics/series/cvpr.ics", "ics/tags/cv.ics", "ics/tags/ml.ics", UPCOMING_CALENDAR]
+    assert "X-WR-CALNAME:AI deadlines: CVPR" in _lines(built["ics/series/cvpr.ics"])
+    assert feeds.counts[UPCOMING_CALENDAR] == 2
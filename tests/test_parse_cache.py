@@ -0,0 +1,72 @@
+"""Tests for aideadlines.parse_cache — the persistent _parse_timestr memo."""
+
+from aideadlines import parse_cache, utils
+from aideadlines.parse_cache import MISSING, ParseCache
+
+
+def test_roundtrip_through_file(tmp_path):
+    path = str(tmp_path / "cache.json")
+    cache = ParseCache(path, "fp")
+    cache.put("k", "2025-01-01")
+    cache.put("bad", None)
+    cache.save()
+    reloaded = ParseCache(path, "fp")
+    assert reloaded.get("k") == "2025-01-01"
+    assert reloaded.get("bad") is None  # unparseable results are cached too
+    assert reloaded.get("other") is MISSING
+
+
+def test_fingerprint_change_discards_entries(tmp_path):
+    path = str(tmp_path / "cache.json")
+    cache = ParseCache(path, "old")
+    cache.put("k", "v")
+    cache.save()
+    assert ParseCache(path, "new").get("k") is MISSING
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = ParseCache(None, "fp", max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")  # 'b' is now the least recently used
+    cache.put("c", 3)
+    cache.evict()
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+
+def test_evicts_by_age(monkeypatch):
+    cache = ParseCache(None, "fp", max_age_days=30)
+    monkeypatch.setattr(parse_cache, "_today", lambda: 100)
+    cache.put("old", 1)
+    monkeypatch.setattr(parse_cache, "_today", lambda: 200)
+    cache.put("new", 2)
+    cache.evict()
+    assert cache.get("old") is MISSING
+    assert cache.get("new") == 2
+
+
+def test_parse_timestr_is_memoized(monkeypatch):
+    calls = []
+    real = utils._parse_timestr_uncached
+
+    def counting(*args):
+        calls.append(args)
+        return real(*args)
+
+    monkeypatch.setattr(utils, "_parse_timestr_uncached", counting)
+    first = utils._parse_timestr("Sep 5, 2025 23:59 AoE", with_time=True)
+    assert utils._parse_timestr("Sep 5, 2025 23:59 AoE", with_time=True) == first
+    assert len(calls) == 1
+    # a different timezone or precision is a different key
+    utils._parse_timestr("Sep 5, 2025 23:59 AoE", with_time=False)
+    assert len(calls) == 2
+
+
+def test_strings_without_year_are_not_cached(monkeypatch):
+    calls = []
+    real = utils._parse_timestr_uncached
+    monkeypatch.setattr(utils, "_parse_timestr_uncached", lambda *args: calls.append(args) or real(*args))
+    utils._parse_timestr("Sep 5 23:59", with_time=True)
+    utils._parse_timestr("Sep 5 23:59", with_time=True)
+    assert len(calls) == 2
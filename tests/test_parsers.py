@@ -3,12 +3,12 @@
 import pytest
 from bs4 import BeautifulSoup
 
-from aideadlines.parser import common_website
+from aideadlines.parser import common_website, wacv
 from aideadlines.parser.ccf_deadlines import conference_from_ccf, parse_ccf_date_range
 from aideadlines.parser.common_website import extract_dates_from_soup
 from aideadlines.parser.hf_list import conference_from_hf
 from aideadlines.parser.ninoduarte_list import conference_from_nino, parse_past_conferences
-from aideadlines.parser.wacv import _split_session_dates
+from aideadlines.parser.wacv import _parse_dates_fallback
 
 
 # --------------------------------------------------------------------------- #
@@ -19,14 +19,16 @@ class TestCcfDateRange:
         assert parse_ccf_date_range("TBD", 2025) is None
 
     def test_single_month_day_range(self):
-        # The trailing comma on the end day is a known quirk dateparser tolerates downstream.
-        assert parse_ccf_date_range("June 1-5, 2025", 2025) == ("1 June 2025", "5, June 2025")
+        assert parse_ccf_date_range("June 1-5, 2025", 2025) == ("2025-06-01", "2025-06-05")
 
     def test_cross_month_range(self):
-        assert parse_ccf_date_range("June 30 - July 4, 2025", 2025) == ("30 June 2025", "4, July 2025")
+        assert parse_ccf_date_range("June 30 - July 4, 2025", 2025) == ("2025-06-30", "2025-07-04")
 
     def test_single_day(self):
-        assert parse_ccf_date_range("June 5 2025", 2025) == ("5 June 2025", "5 June 2025")
+        assert parse_ccf_date_range("June 5 2025", 2025) == ("2025-06-05", "2025-06-05")
+
+    def test_missing_year_uses_fallback(self):
+        assert parse_ccf_date_range("Feb 28 - Mar 3", 2026) == ("2026-02-28", "2026-03-03")
 
     def test_unparseable_raises(self):
         with pytest.raises(ValueError):
@@ -55,7 +57,7 @@ class TestConferenceFromCcf:
         out = conference_from_ccf(self._info(), conf)
         assert out["id"] == "cvpr2025"
         assert out["website"] == "https://cvpr.org"
-        assert out["conferenceStartDate"] == "1 June 2025"
+        assert out["conferenceStartDate"] == "2025-06-01"
         assert out["timeline"] == [{"deadline": "2024-11-01", "note": "paper"}]
 
     def test_3dv_id_is_rewritten(self):
@@ -123,8 +125,8 @@ class TestConferenceFromHf:
             "tags": [],
         }
         out = conference_from_hf(conference)
-        assert out["conferenceStartDate"] == "June 1, 2025"
-        assert out["conferenceEndDate"] == "June 5, 2025"
+        assert out["conferenceStartDate"] == "2025-06-01"
+        assert out["conferenceEndDate"] == "2025-06-05"
 
     def test_unparseable_date_string_returns_none(self):
         conference = {
@@ -137,6 +139,11 @@ class TestConferenceFromHf:
         }
         assert conference_from_hf(conference) is None
 
+    def test_entries_without_a_year_are_skipped(self):
+        conference = {"title": "ABC", "full_name": "A B C", "deadline": "2024-11-01", "date": "June 1 - 5", "tags": []}
+        assert conference_from_hf(conference) is None
+        assert conference_from_hf({**conference, "title": "ABC2025"}) is None  # the date has no year either
+
 
 # --------------------------------------------------------------------------- #
 # ninoduarte_list
@@ -266,17 +273,23 @@ def test_website_parser_returns_empty_without_deadline(monkeypatch):
 
 
 # --------------------------------------------------------------------------- #
-# wacv — conference-session date splitting (from the thecvf 'Dates' table)
+# wacv — conference-session dates from the thecvf 'Dates' table
 # --------------------------------------------------------------------------- #
-class TestWacvSessionDates:
-    def test_same_month_range_borrows_month_for_end(self):
-        assert _split_session_dates("Jan 6th - 8th") == ("Jan 6th", "Jan 8th")
-
-    def test_cross_month_range_keeps_both_months(self):
-        assert _split_session_dates("Feb 28 - Mar 3") == ("Feb 28", "Mar 3")
+def test_wacv_dates_fallback_reads_session_range(monkeypatch):
+    html = """
+    <table>
+      <tr><td>Main Conference Sessions</td><td>Feb 28 - Mar 3</td></tr>
+      <tr><td>Round 1 Paper Submission</td><td>July 12, 2024</td></tr>
+    </table>
+    """
+    monkeypatch.setattr(wacv, "fetch_soup", lambda url, **kw: BeautifulSoup(html, "html.parser"))
+    data = {"timeline": [{}, {}]}
+    _parse_dates_fallback(2025, data)
+    assert (data["conferenceStartDate"], data["conferenceEndDate"]) == ("2025-02-28", "2025-03-03")
+    assert data["timeline"][0]["deadline"] == "July 12, 2024"
 
-    def test_en_dash_separator(self):
-        assert _split_session_dates("Jan 6th – 8th") == ("Jan 6th", "Jan 8th")
 
-    def test_no_range_returns_none(self):
-        assert _split_session_dates("sometime in January") is None
+def test_extract_dates_from_soup_main_conference_range():
+    html = "<table><tr><td>Main Conference</td><td>Jun 11 - 15</td></tr></table>"
+    data = extract_dates_from_soup({"id": "cvpr2025", "timeline": [{}]}, BeautifulSoup(html, "html.parser"))
+    assert (data["conferenceStartDate"], data["conferenceEndDate"]) == ("2025-06-11", "2025-06-15")
@@ -0,0 +1,61 @@
+"""Tests for aideadlines.pipeline — the stages of one run, in one process."""
+
+import pytest
+
+from aideadlines import data_to_json, pipeline, update_data, validate
+from aideadlines.pipeline import Pipeline
+from aideadlines.validate import Problem
+
+
+@pytest.fixture
+def stages(monkeypatch):
+    """Stub out the work of each stage, recording the calls."""
+    calls = []
+
+    def update(args, written, pull=None, timings=None, core_ranks=None):
+        calls.append("update")
+        written["abc"] = ("sha", {"abc2025": {}})
+
+    def load_store(primed=None):
+        calls.append(("load", primed))
+        return "store"
+
+    monkeypatch.setattr(update_data, "update", update)
+    monkeypatch.setattr(pipeline, "load_store", load_store)
+    monkeypatch.setattr(pipeline, "resolve_changeset", lambda args: {"abc.yaml"})
+    monkeypatch.setattr(validate, "validate_store", lambda store, files: calls.append(("validate", store, files)) or [])
+    monkeypatch.setattr(data_to_json, "publish",
+                        lambda files, compact, store: calls.append(("export", store, files, compact)) or True)
+    return calls
+
+
+def test_stages_share_one_store(stages):
+    run = Pipeline()
+    assert run.run() is True
+    assert stages == [
+        "update",
+        ("load", {"abc.yaml": ("sha", {"abc2025": {}})}),  # what update wrote is handed over, not parsed
+        ("validate", "store", {"abc.yaml"}),
+        ("export", "store", {"abc.yaml"}, False),
+    ]
+    assert set(run.timings) == {"update", "validate", "export"}
+
+
+def test_full_runs_by_default():
+    run = Pipeline()
+    assert run.update_args.incremental is False and run.changeset_args.since is None and run.compact is False
+    assert Pipeline(incremental=True, since="last-published").changeset_args.since == "last-published"
+
+
+def test_a_failing_stage_is_reported_not_raised(stages, monkeypatch):
+    monkeypatch.setattr(update_data, "update", lambda args, written, **kwargs: 1 / 0)
+    run = Pipeline()
+    assert run.update() is False
+    assert run.validate() is True and run.export() is True
+    assert run.run() is False  # the export still ran, as it did after a failed update_data process
+
+
+def test_failed_validation_stops_before_export(stages, monkeypatch):
+    monkeypatch.setattr(validate, "validate_store", lambda store, files: [Problem("abc.yaml", "abc2025", None, "broken")])
+    assert Pipeline().run() is False
+    assert not any(call[0] == "export" for call in stages if isinstance(call, tuple))
@@ -0,0 +1,76 @@
+"""Tests for aideadlines.prerender — the first screen baked into index.html."""
+
+import json
+import re
+
+import pytest
+
+from aideadlines.prerender import DAY_MS, FIRST_SCREEN, TEMPLATE, card, format_date, next_deadline, prerender, safe_href
+
+NOW = 1_700_000_000_000
+
+
+def _record(n, days, **fields):
+    return {
+        "id": f"c{n}2024-1", "shortname": f"C{n} 2024", "title": f"Conference {n}", "tags": ["ML"],
+        "deadline": "2023-12-01T00:00:00Z", "deadlineMs": NOW + round(days * DAY_MS), "timezone": "UTC",
+        "rating": "B", "ratingOrdinal": 3, "importance": 3, "website": "https://c.org/", **fields,
+    }
+
+
+@pytest.fixture(scope="module")
+def template():
+    with open(TEMPLATE, encoding="utf-8") as f:
+        return f.read()
+
+
+def _initial_data(page):
+    return json.loads(re.search(r'<script id="initialData" type="application/json">(.*?)</script>', page, re.S).group(1))
+
+
+def test_first_screen_follows_the_default_view(template):
+    records = [_record(n, days=20 - n) for n in range(20)]
+    records.append(_record(99, days=0.5, rating="D", ratingOrdinal=1))  # below the template's default minimum
+    page = prerender(template, records, NOW)
+    initial = _initial_data(page)
+    assert [r["id"] for r in initial["records"]] == [f"c{n}2024-1" for n in range(19, 19 - FIRST_SCREEN, -1)]
+    assert page.count('class="conf-card') == FIRST_SCREEN
+    assert '<span class="n" id="statTracked">21</span>' in page
+    assert '<span class="n" id="statWeek">7</span>' in page  # c14..c19, and the D-rated one that isn't shown
+    assert 'id="loadingState" class="loading-container" style="display:none"' in page
+
+
+def test_next_up_weighs_importance_against_distance():
+    soon = _record(1, days=2, importance=1)
+    big = _record(2, days=10, importance=8)
+    estimated = _record(3, days=1, importance=8, isApproximateDeadline=True)
+    assert next_deadline([soon, big, estimated], NOW)["id"] == "c22024-1"
+    assert next_deadline([estimated], NOW) is None
+
+
+def test_inlined_data_cannot_close_the_script(template):
+    page = prerender(template, [_record(1, days=3, note="</script><script>alert(1)</script>")], NOW)
+    assert "</script><script>alert(1)" not in page
+    assert _initial_data(page)["records"][0]["note"] == "</script><script>alert(1)</script>"
+    assert "&lt;/script&gt;&lt;script&gt;alert(1)" in page  # the rendered note
+
+
+def test_card_escapes_like_scripts_js():
+    html = card(_record(1, days=3, title="A & B's <i>", website="javascript:alert(1)"), NOW)
+    assert "A &amp; B&#39;s &lt;i&gt;" in html
+    assert "javascript:" not in html and "Site not available" in html
+    assert "is-soon" in html and "Due this week" in html
+
+
+def test_format_date_matches_en_us_intl():
+    assert format_date("2024-11-14T07:59:00Z", "America/Los_Angeles", include_time=True) == "Nov 13, 2024, 11:59 PM PST"
+    assert format_date("2024-11-14T11:59:00Z", "Etc/GMT+12", include_time=True) == "Nov 13, 2024, 11:59 PM AoE"
+    assert format_date("2026-07-01T00:00:00Z", "Asia/Kolkata", include_time=True) == "Jul 1, 2026, 05:30 AM GMT+5:30"
+    assert format_date("2025-06-11", "UTC") == "Jun 11, 2025"
+    assert format_date("2025-06-11", "UTC", month_year_only=True) == "Jun 2025"
+    assert safe_href("http://a.org") == "http://a.org/" and safe_href("data:x") is None
+
+
+def test_template_without_regions_is_rejected():
+    with pytest.raises(ValueError):
+        prerender("<html></html>", [], NOW)
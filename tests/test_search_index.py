@@ -0,0 +1,44 @@
+"""Tests for aideadlines.search_index — index lookups must match scanning the records."""
+
+from aideadlines.search_index import SearchIndex, search, tokens
+
+RECORDS = [
+    (300, {"id": "cvpr2025-1", "title": "Computer Vision and Pattern Recognition", "shortname": "CVPR",
+           "tags": ["CV"], "rating": "A*"}),
+    (100, {"id": "icml2025-1", "title": "International Conference on Machine Learning", "shortname": "ICML",
+           "tags": ["ML", "ML"], "rating": "A*"}),
+    (200, {"id": "wacv2025-1", "title": None, "shortname": "WACV", "tags": ["CV"], "rating": "A"}),
+    (200, {"id": "aaai2025-1", "title": "AAAI Conference on Artificial Intelligence", "shortname": "AAAI"}),
+]
+
+
+def _index():
+    index = SearchIndex()
+    for epoch, record in RECORDS:
+        index.add(epoch, record)
+    return index.build()
+
+
+def test_tokens_are_lower_cased_words_of_title_and_shortname():
+    assert tokens(RECORDS[2][1]) == {"wacv"}
+    assert tokens(RECORDS[0][1]) == {"computer", "vision", "and", "pattern", "recognition", "cvpr"}
+
+
+def test_lists_are_positions_in_deadline_order():
+    index = _index()
+    assert index["byDeadline"] == ["icml2025-1", "aaai2025-1", "wacv2025-1", "cvpr2025-1"]  # ties by id
+    assert index["tags"] == {"ML": [0], "CV": [2, 3]}
+    assert index["ratings"] == {"A*": [0, 3], "A": [2]}
+    assert index["tokens"]["conference"] == [0, 1]
+
+
+def test_search_matches_every_word_as_a_substring_of_some_token():
+    index = _index()
+
+    def ids(query):
+        return [index["byDeadline"][position] for position in search(index, query)]
+
+    assert ids("conf") == ["icml2025-1", "aaai2025-1"]
+    assert ids("CONFERENCE learn") == ["icml2025-1"]
+    assert ids("") == index["byDeadline"]
+    assert ids("neurips") == []
@@ -0,0 +1,57 @@
+"""Tests for aideadlines.series_api — one file per series and per instance, plus an index."""
+
+from aideadlines.codec import json_loads
+from aideadlines.series_api import SERIES_INDEX, SeriesTree
+
+
+def _record(record_id, **fields):
+    return {"id": record_id, "title": record_id.rsplit("-", 1)[0].upper(), "tags": ["CV"], **fields}
+
+
+def _build(records):
+    tree = SeriesTree()
+    for record in records:
+        tree.add(record)
+    return {path: json_loads(content) for path, content in tree.build().items()}
+
+
+def test_tree_layout():
+    files = _build([_record("cvpr2025-2"), _record("ieee cec2025-1"), _record("cvpr2024-1"), _record("cvpr2025-1")])
+    assert sorted(files) == [
+        "series/cvpr.json", "series/cvpr/cvpr2024.json", "series/cvpr/cvpr2025.json",
+        "series/ieee-cec.json", "series/ieee-cec/ieee-cec2025.json", SERIES_INDEX,
+    ]
+    cvpr = files["series/cvpr.json"]
+    assert [instance["id"] for instance in cvpr["instances"]] == ["cvpr2024", "cvpr2025"]
+    assert [r["id"] for r in files["series/cvpr/cvpr2025.json"]["deadlines"]] == ["cvpr2025-1", "cvpr2025-2"]
+
+    index = files[SERIES_INDEX]["series"]
+    assert [entry["series"] for entry in index] == ["cvpr", "ieee cec"]
+    assert index[0]["title"] == "CVPR2025" and index[0]["path"] == "series/cvpr.json"
+    assert [(i["id"], i["deadlines"]) for i in index[0]["instances"]] == [("cvpr2024", 1), ("cvpr2025", 2)]
+
+
+def test_output_does_not_depend_on_record_order():
+    records = [_record("cvpr2025-2"), _record("cvpr2024-1"), _record("cvpr2025-1")]
+    tree, reversed_tree = SeriesTree(), SeriesTree()
+    for record in records:
+        tree.add(record)
+    for record in reversed(records):
+        reversed_tree.add(record)
+    assert tree.build() == reversed_tree.build()
+
+
+def test_series_whose_names_slugify_alike_get_their_own_files():
+    files = _build([_record("ieee cec2025-1"), _record("ieee-cec2025-1"), _record("index2025-1")])
+    index = {entry["series"]: entry for entry in files[SERIES_INDEX]["series"]}
+    assert index["ieee cec"]["path"] == "series/ieee-cec.json"
+    assert index["ieee-cec"]["path"] == "series/ieee-cec-2.json"
+    assert index["index"]["path"] == "series/index-2.json"
+    assert files["series/ieee-cec-2.json"]["series"] == "ieee-cec"
+    assert files["series/ieee-cec-2/ieee-cec2025.json"]["id"] == "ieee-cec2025"
+    assert index["ieee cec"]["instances"][0]["path"] == "series/ieee-cec/ieee-cec2025.json"
+
+
+def test_the_index_describes_the_newest_instance():
+    files = _build([_record("abc2024-1", title="Old"), _record("abc2025-2", title="New"), _record("abc2025-1", title="New")])
+    assert files[SERIES_INDEX]["series"][0]["title"] == "New"
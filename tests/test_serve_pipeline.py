@@ -0,0 +1,94 @@
+"""Tests for aideadlines.serve_pipeline — rebuilding hand-edited conference files."""
+
+import os
+
+import pytest
+
+from aideadlines import data_to_json, serve_pipeline, update_data, validate
+from aideadlines.codec import yaml_dump, yaml_load
+from aideadlines.serve_pipeline import PipelineServer
+from aideadlines.store import ConferenceStore
+from aideadlines.validate import Problem
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch, real_conf_pair):
+    folder = tmp_path / "conferences"
+    folder.mkdir()
+    (folder / "abc.yaml").write_text(yaml_dump(real_conf_pair))
+    monkeypatch.setattr(update_data, "CONFERENCE_FOLDER", str(folder))
+    monkeypatch.setattr(update_data, "PIPELINE_STATE_FILE", str(tmp_path / "state.json"))
+    monkeypatch.setattr(update_data, "make_conf_rank_function", lambda: lambda conf: conf)
+    monkeypatch.setattr(serve_pipeline, "load_store", lambda: ConferenceStore.load(folder))
+    monkeypatch.setattr(serve_pipeline, "load_core_ranks", lambda: {})
+    published = []
+    monkeypatch.setattr(data_to_json, "publish", lambda files, compact, store: published.append((files, store)) or True)
+    server = PipelineServer(interval=0, folder=str(folder))
+    server.published = published
+    return server
+
+
+def _edit(server, name, content):
+    path = os.path.join(server.folder, name)
+    with open(path, "w") as f:
+        f.write(content)
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1))  # a new mtime, however coarse the clock
+
+
+def test_a_hand_edit_is_rebuilt_once_it_settles(server, real_conf_pair, clone):
+    assert server.poll() == set()
+    edited = clone(real_conf_pair)
+    edited["abc2024"]["title"] = "Edited by hand"
+    _edit(server, "abc.yaml", yaml_dump(edited))
+    assert server.poll() == set()  # still being written, perhaps
+    assert server.poll() == {"abc.yaml"}
+
+    assert server.rebuild({"abc.yaml"}) is True
+    files, store = server.published[-1]
+    assert files == {"abc.yaml"} and store["abc2024"]["title"] == "Edited by hand"
+    with open(os.path.join(server.folder, "abc.yaml")) as f:
+        assert yaml_load(f)["abc2024"]["title"] == "Edited by hand"
+
+    assert server.poll() == set() and server.poll() == set()  # the server's own write isn't rebuilt
+
+
+def test_unparseable_edits_wait_for_the_next_save(server):
+    _edit(server, "abc.yaml", "abc2024: [unclosed")
+    server.poll()
+    assert server.poll() == {"abc.yaml"}
+    assert server.rebuild({"abc.yaml"}) is False
+    assert server.published == []
+
+
+def test_an_invalid_edit_stays_out_of_the_warm_store(server, real_conf_pair, clone, monkeypatch):
+    known = dict(server.known)
+    edited = clone(real_conf_pair)
+    edited["abc2024"]["title"] = "Broken"
+    _edit(server, "abc.yaml", yaml_dump(edited))
+    monkeypatch.setattr(validate, "validate_store", lambda store, files: [Problem("abc.yaml", "abc2024", None, "bad")])
+    assert server.rebuild({"abc.yaml"}) is False
+    assert server.store is None and server.known == known and server.published == []
+    with open(os.path.join(server.folder, "abc.yaml")) as f:
+        assert f.read() == yaml_dump(edited)  # not post-processed and rewritten either
+    assert not os.path.exists(update_data.PIPELINE_STATE_FILE)
+
+
+def _renamed(confs, group):
+    return {key.replace("abc", group): {**conf, "id": conf["id"].replace("abc", group)} for key, conf in confs.items()}
+
+
+def test_an_id_moved_into_another_file_keeps_its_group_whole(server, real_conf_pair, clone):
+    _edit(server, "xyz.yaml", yaml_dump(_renamed(real_conf_pair, "xyz")))
+    server.store = None  # loaded with xyz.yaml
+    edited = clone(real_conf_pair)
+    edited["xyz2025"] = {**_renamed(real_conf_pair, "xyz")["xyz2024"], "id": "xyz2025",
+                         "timeline": [{"deadline": "2025-01-15"}]}
+    _edit(server, "abc.yaml", yaml_dump(edited))
+
+    assert server.rebuild({"abc.yaml"}) is True
+    with open(os.path.join(server.folder, "xyz.yaml")) as f:
+        assert {"xyz2023", "xyz2024", "xyz2025"} <= set(yaml_load(f))
+    with open(os.path.join(server.folder, "abc.yaml")) as f:
+        assert not any(key.startswith("xyz") for key in yaml_load(f))
+    files, store = server.published[-1]
+    assert files == {"abc.yaml", "xyz.yaml"} and {"xyz2023", "xyz2024", "xyz2025"} <= set(store.group("xyz"))
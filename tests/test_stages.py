@@ -0,0 +1,57 @@
+"""Tests for aideadlines.stages — running stages once their inputs are done."""
+
+import threading
+import time
+
+import pytest
+
+from aideadlines.stages import Stage, run_stages
+
+
+def test_inputs_are_passed_in_order():
+    stages = [
+        Stage("sum", lambda a, b: a + b, ("b", "a")),
+        Stage("a", lambda: "a"),
+        Stage("b", lambda: "b"),
+    ]
+    assert run_stages(stages)["sum"] == "ba"
+
+
+def test_independent_stages_overlap():
+    both_started = threading.Barrier(2, timeout=5)  # breaks (and raises) unless both run at once
+    stages = [Stage("x", both_started.wait), Stage("y", both_started.wait)]
+    run_stages(stages)
+
+
+def test_a_stage_waits_for_its_inputs():
+    order = []
+    stages = [
+        Stage("late", lambda: time.sleep(0.05) or order.append("late")),
+        Stage("after", lambda _: order.append("after"), ("late",)),
+    ]
+    timings = {}
+    run_stages(stages, timings=timings)
+    assert order == ["late", "after"]
+    assert set(timings) == {"late", "after"} and timings["late"] >= 0.05
+
+
+def test_a_failure_stops_the_dependents_and_is_raised():
+    ran = []
+    stages = [
+        Stage("broken", lambda: 1 / 0),
+        Stage("slow", lambda: time.sleep(0.05) or ran.append("slow")),
+        Stage("dependent", lambda _: ran.append("dependent"), ("broken",)),
+    ]
+    with pytest.raises(ZeroDivisionError):
+        run_stages(stages)
+    assert ran == ["slow"]  # already running: finished, not abandoned
+
+
+@pytest.mark.parametrize("stages", [
+    [Stage("a", lambda: 1), Stage("a", lambda: 2)],
+    [Stage("a", lambda _: 1, ("missing",))],
+    [Stage("a", lambda _: 1, ("b",)), Stage("b", lambda _: 1, ("a",))],
+])
+def test_malformed_graphs_are_rejected(stages):
+    with pytest.raises(ValueError):
+        run_stages(stages)
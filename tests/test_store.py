@@ -0,0 +1,158 @@
+"""Tests for aideadlines.store.ConferenceStore."""
+
+import hashlib
+import os
+import pickle
+
+import yaml
+
+from aideadlines import store
+from aideadlines.codec import yaml_dump
+from aideadlines.store import ConferenceStore, group_conferences, group_of, unique_slugs
+from aideadlines.validate import validate_store
+
+
+def _write(folder, name, confs):
+    (folder / name).write_text(yaml.safe_dump(confs))
+
+
+def _conf(conf_id, **extra):
+    return {"id": conf_id, "title": conf_id.upper(), "timeline": [{"deadline": "2025-01-15"}], **extra}
+
+
+def test_load_indexes_by_id_and_group(tmp_path):
+    _write(tmp_path, "abc.yaml", {"abc2024": _conf("abc2024"), "abc2025": _conf("abc2025")})
+    _write(tmp_path, "xyz.yaml", {"xyz2025": _conf("xyz2025")})
+    (tmp_path / "empty.yaml").write_text("")
+    (tmp_path / "README.md").write_text("not a conference file")
+
+    store = ConferenceStore.load(tmp_path)
+
+    assert len(store) == 3
+    assert store["xyz2025"]["title"] == "XYZ2025"
+    assert "abc2024" in store
+    assert list(store.group("abc")) == ["abc2024", "abc2025"]
+    assert store.group("nope") == {}
+    assert store.sources == {"abc2024": "abc.yaml", "abc2025": "abc.yaml", "xyz2025": "xyz.yaml"}
+    assert store.duplicates == []
+
+
+def test_duplicates_keep_first_file_and_are_reported(tmp_path):
+    _write(tmp_path, "b.yaml", {"abc2025": _conf("abc2025", title="from b")})
+    _write(tmp_path, "a.yaml", {"abc2025": _conf("abc2025", title="from a")})
+
+    store = ConferenceStore.load(tmp_path)
+
+    assert store["abc2025"]["title"] == "from a"
+    assert store.duplicates == [("abc2025", "a.yaml", "b.yaml")]
+    assert [str(p) for p in validate_store(store)] == ["abc2025: defined in both a.yaml and b.yaml"]
+
+
+def test_transform_is_applied_to_every_record(tmp_path):
+    _write(tmp_path, "abc.yaml", {"abc2025": _conf("abc2025")})
+    store = ConferenceStore.load(tmp_path, transform=lambda conf: {**conf, "seen": True})
+    assert store["abc2025"]["seen"] is True
+
+
+def test_with_file_swaps_one_file(tmp_path):
+    _write(tmp_path, "a.yaml", {"abc2025": _conf("abc2025", title="from a")})
+    _write(tmp_path, "b.yaml", {"abc2025": _conf("abc2025", title="from b"), "xyz2025": _conf("xyz2025")})
+    loaded = ConferenceStore.load(tmp_path)
+
+    edited = loaded.with_file("b.yaml", {"xyz2025": _conf("xyz2025", title="edited")})
+    assert edited["xyz2025"]["title"] == "edited" and edited.duplicates == []
+    assert loaded["xyz2025"]["title"] == "XYZ2025"  # the original is left alone
+
+    removed = edited.with_file("a.yaml", None)
+    assert "abc2025" not in removed and list(removed.groups) == ["xyz"]
+
+
+def test_reload_parses_only_changed_files(tmp_path):
+    _write(tmp_path, "a.yaml", {"abc2025": _conf("abc2025")})
+    _write(tmp_path, "b.yaml", {"xyz2025": _conf("xyz2025")})
+    loaded = ConferenceStore.load(tmp_path)
+    _write(tmp_path, "b.yaml", {"xyz2025": _conf("xyz2025", title="edited")})
+    _write(tmp_path, "c.yaml", {"new2025": _conf("new2025")})
+
+    reloaded = loaded.reload(tmp_path)
+    assert reloaded.files["a.yaml"] is loaded.files["a.yaml"]
+    assert reloaded["xyz2025"]["title"] == "edited" and "new2025" in reloaded
+    assert reloaded.hashes["b.yaml"] == hashlib.sha256((tmp_path / "b.yaml").read_bytes()).hexdigest()
+
+
+def test_group_conferences():
+    confs = {"abc2024": {}, "xyz2025": {}, "abc2025": {}}
+    assert group_of("neurips2025") == "neurips"
+    assert group_conferences(confs) == {"abc": {"abc2024": {}, "abc2025": {}}, "xyz": {"xyz2025": {}}}
+
+
+def test_snapshot_warm_start_matches_cold_load(tmp_path, monkeypatch):
+    folder, snapshot = tmp_path / "conferences", str(tmp_path / "snapshot.pickle")
+    folder.mkdir()
+    _write(folder, "abc.yaml", {"abc2025": _conf("abc2025", conferenceStartDate="2025-06-01")})
+    _write(folder, "xyz.yaml", {"xyz2025": _conf("xyz2025")})
+
+    cold = ConferenceStore.load(folder, snapshot=snapshot)
+    parsed = []
+    real_yaml_load = store.yaml_load
+    monkeypatch.setattr(store, "yaml_load", lambda content: parsed.append(content) or real_yaml_load(content))
+
+    warm = ConferenceStore.load(folder, snapshot=snapshot)
+    assert parsed == []
+    assert pickle.dumps(warm.conferences) == pickle.dumps(cold.conferences)
+
+    _write(folder, "xyz.yaml", {"xyz2025": _conf("xyz2025", title="changed")})
+    os.utime(folder / "abc.yaml", ns=(0, 0))  # touched but unchanged: hashed, not re-parsed
+    updated = ConferenceStore.load(folder, snapshot=snapshot)
+    assert len(parsed) == 1
+    assert updated["xyz2025"]["title"] == "changed"
+    assert updated["abc2025"] == cold["abc2025"]
+
+
+def test_unreadable_snapshot_is_ignored(tmp_path):
+    folder, snapshot = tmp_path / "conferences", tmp_path / "snapshot.pickle"
+    folder.mkdir()
+    _write(folder, "abc.yaml", {"abc2025": _conf("abc2025")})
+    snapshot.write_bytes(b"not a pickle")
+    assert list(ConferenceStore.load(folder, snapshot=str(snapshot))) == ["abc2025"]
+
+
+def test_primed_files_are_not_parsed(tmp_path, monkeypatch):
+    confs = {"abc2025": _conf("abc2025")}
+    content = yaml_dump(confs).encode()
+    (tmp_path / "abc.yaml").write_bytes(content)
+    parsed = []
+    real_yaml_load = store.yaml_load
+    monkeypatch.setattr(store, "yaml_load", lambda content: parsed.append(content) or real_yaml_load(content))
+
+    primed = {"abc.yaml": (hashlib.sha256(content).hexdigest(), confs)}
+    assert ConferenceStore.load(tmp_path, primed=primed)["abc2025"] is confs["abc2025"]
+    assert parsed == []
+
+    stale = {"abc.yaml": (hashlib.sha256(b"other").hexdigest(), {})}  # the file changed since
+    assert ConferenceStore.load(tmp_path, primed=stale)["abc2025"] == confs["abc2025"]
+    assert len(parsed) == 1
+
+
+def test_transform_leaves_cached_and_primed_records_alone(tmp_path):
+    confs = {"abc2025": _conf("abc2025")}
+    content = yaml_dump(confs).encode()
+    (tmp_path / "abc.yaml").write_bytes(content)
+    snapshot = str(tmp_path / "snapshot.pickle")
+    ConferenceStore.load(tmp_path, snapshot=snapshot)
+
+    def in_place(conf):
+        conf["title"] = "transformed"
+        return conf
+
+    primed = {"abc.yaml": (hashlib.sha256(content).hexdigest(), confs)}
+    assert ConferenceStore.load(tmp_path, transform=in_place, primed=primed)["abc2025"]["title"] == "transformed"
+    assert ConferenceStore.load(tmp_path, transform=in_place, snapshot=snapshot)["abc2025"]["title"] == "transformed"
+    assert confs["abc2025"]["title"] == "ABC2025"
+    assert ConferenceStore.load(tmp_path, snapshot=snapshot)["abc2025"]["title"] == "ABC2025"
+
+
+def test_unique_slugs_number_collisions_apart():
+    assert unique_slugs(["ieee-cec", "ieee cec", "cvpr", "IEEE CEC"], taken={"cvpr"}) == {
+        "IEEE CEC": "ieee-cec", "cvpr": "cvpr-2", "ieee cec": "ieee-cec-2", "ieee-cec": "ieee-cec-3",
+    }
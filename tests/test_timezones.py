@@ -0,0 +1,54 @@
+"""Tests for aideadlines.timezones — tokenizing, resolving and naming timezones."""
+
+import datetime
+
+import pytest
+
+from aideadlines.timezones import iana_name, resolve, split_timezone
+
+
+@pytest.mark.parametrize(
+    "raw,expected",
+    [
+        ("AoE", "Etc/GMT+12"),
+        ("UTC-12", "Etc/GMT+12"),
+        ("UTC+5", "Etc/GMT-5"),  # POSIX sign flip
+        ("UTC-3", "Etc/GMT+3"),
+        ("GMT+2", "Etc/GMT-2"),
+        ("UTC+0", "UTC"),
+        ("UTC+5:30", "Asia/Kolkata"),
+        ("Russia/Moscow", "Europe/Moscow"),
+        ("PT", "America/Los_Angeles"),
+        ("America/Los_Angeles", "America/Los_Angeles"),
+        ("Etc/GMT-2", "Etc/GMT-2"),  # already normalized -> unchanged
+        ("Mars/Olympus", "Mars/Olympus"),  # unknown -> passed through
+    ],
+)
+def test_iana_name(raw, expected):
+    assert iana_name(raw) == expected
+
+
+def test_resolve_fixed_offsets_and_zones():
+    assert resolve("AoE").utcoffset(None) == datetime.timedelta(hours=-12)
+    assert resolve("IST").utcoffset(datetime.datetime(2025, 1, 1)) == datetime.timedelta(hours=5, minutes=30)
+    assert resolve("nowhere") is None
+
+
+@pytest.mark.parametrize(
+    "text,rest,offset_hours",
+    [
+        ("Sep 5, 2025 23:59 AoE", "Sep 5, 2025 23:59", -12),
+        ("Sep 5, 2025 23:59 (Anywhere on Earth)", "Sep 5, 2025 23:59", -12),
+        ("2025-01-15 23:59 UTC+1", "2025-01-15 23:59", 1),
+        ("2025-01-15 23:59 Pacific Time", "2025-01-15 23:59", -8),
+    ],
+)
+def test_split_timezone(text, rest, offset_hours):
+    out, tzinfo = split_timezone(text)
+    assert out == rest
+    assert tzinfo.utcoffset(datetime.datetime(2025, 1, 15)) == datetime.timedelta(hours=offset_hours)
+
+
+@pytest.mark.parametrize("text", ["Sept 5, 2025", "Oct 1, 2025", "2025-01-16T11:59:00Z"])
+def test_split_timezone_respects_word_boundaries(text):
+    assert split_timezone(text) == (text, None)
@@ -0,0 +1,135 @@
+"""Tests for aideadlines.update_data's change-aware, incremental group writes."""
+
+import argparse
+
+import pytest
+
+from aideadlines import update_data
+from aideadlines.codec import yaml_load
+
+
+@pytest.fixture
+def conference_folder(tmp_path, monkeypatch):
+    monkeypatch.setattr(update_data, "CONFERENCE_FOLDER", str(tmp_path))
+    monkeypatch.setattr(update_data, "make_conf_rank_function", lambda: lambda conf: conf)
+    monkeypatch.setattr(update_data, "make_core_rank_function", lambda groups, online: lambda conf: conf)
+    return tmp_path
+
+
+@pytest.fixture
+def postprocessed(monkeypatch):
+    """Record which groups write_groups post-processes."""
+    groups = []
+    real = update_data.postprocess_group
+    monkeypatch.setattr(
+        update_data, "postprocess_group", lambda group, *args: groups.append(group) or real(group, *args)
+    )
+    return groups
+
+
+ARGS = argparse.Namespace(reestimate=False, online=False, write=True)
+
+
+def test_write_group_skips_unchanged_files(conference_folder, real_conf_pair):
+    written, sha256 = update_data.write_group("abc", real_conf_pair)
+    assert written is True
+    assert yaml_load((conference_folder / "abc.yaml").read_text()) == real_conf_pair
+    assert update_data.write_group("abc", real_conf_pair) == (False, sha256)
+
+    real_conf_pair["abc2024"]["rating"] = "A*"
+    assert update_data.write_group("abc", real_conf_pair)[0] is True
+
+
+def test_write_groups_hands_over_what_it_wrote(conference_folder, real_conf_pair, clone):
+    written = {}
+    state = update_data.write_groups(clone(real_conf_pair), [], ARGS, written=written)
+    sha256, records = written["abc"]
+    assert sha256 == state["abc"]["sha256"]
+    assert yaml_load((conference_folder / "abc.yaml").read_text()) == records
+
+
+def test_changed_groups(real_conf_pair, clone):
+    after = clone(real_conf_pair)
+    after["abc2024"]["timeline"].append({"deadline": "2024-02-01"})
+    after["xyz2025"] = {"id": "xyz2025"}
+    assert update_data.changed_groups(real_conf_pair, real_conf_pair) == set()
+    assert update_data.changed_groups(real_conf_pair, after) == {"abc", "xyz"}
+
+
+def test_incremental_run_reuses_clean_groups(conference_folder, postprocessed, real_conf_pair, clone):
+    conferences = {**clone(real_conf_pair), "xyz2025": {**clone(real_conf_pair["abc2024"]), "id": "xyz2025"}}
+    state = update_data.write_groups(clone(conferences), [], ARGS)
+    assert postprocessed == ["abc", "xyz"]
+    assert set(state) == {"abc", "xyz"}
+
+    postprocessed.clear()
+    assert update_data.write_groups(clone(conferences), [], ARGS, dirty_groups=set(), state=state) == state
+    assert postprocessed == []
+
+    update_data.write_groups(clone(conferences), [], ARGS, dirty_groups={"xyz"}, state=state)
+    assert postprocessed == ["xyz"]
+
+
+def test_incremental_run_recomputes_stale_groups(conference_folder, postprocessed, real_conf_pair, clone):
+    state = update_data.write_groups(clone(real_conf_pair), [], ARGS)
+    postprocessed.clear()
+
+    edited = {"abc": {**state["abc"], "year": state["abc"]["year"] - 1}}  # estimation horizon moved
+    update_data.write_groups(clone(real_conf_pair), [], ARGS, dirty_groups=set(), state=edited)
+    assert postprocessed == ["abc"]
+
+    (conference_folder / "abc.yaml").write_text("{}\n")  # hand-edited since the last write
+    update_data.write_groups(clone(real_conf_pair), [], ARGS, dirty_groups=set(), state=state)
+    assert postprocessed == ["abc", "abc"]
+
+
+def test_fetched_sources_merge_by_priority_not_arrival(real_conf_pair, clone):
+    site = {**clone(real_conf_pair["abc2024"]), "title": "From the website"}
+    feed = {**clone(real_conf_pair["abc2024"]), "title": "From the ccf feed", "note": "ccf"}
+    fetched = [("ccf-deadlines", [feed]), ("off-website", [site])]  # ccf finished first
+    results = []
+    for arrival in (fetched, fetched[::-1]):
+        conferences, reestimate = {}, []
+        update_data.merge_fetched(conferences, clone(arrival), reestimate)
+        results.append(conferences)
+    assert results[0] == results[1]
+    assert results[0]["abc2024"]["title"] == "From the website" and results[0]["abc2024"]["dataSrc"] == "off-website"
+
+
+def test_crawl_candidates_skip_years_without_an_instance():
+    candidates = update_data.crawl_candidates()
+    eccv = [instance for group, instance in candidates if group == "eccv"]
+    assert len(eccv) == 2 and all(int(instance[-4:]) % 2 == 0 for instance in eccv)
+    assert len([group for group, _ in candidates if group == "cvpr"]) == 4
+
+
+def test_only_planned_years_are_fetched():
+    years = []
+
+    def parse_abc(year):
+        years.append(year)
+        return {}
+
+    recent = list(update_data._recent_years())
+    planned = {f"abc{recent[0]}", f"abc{recent[-1]}"}
+    assert update_data.fetch_official_website(parse_abc, ARGS, planned) == [(recent[0], {}), (recent[-1], {})]
+    assert years == [recent[0], recent[-1]]
+
+
+def test_a_failed_year_is_kept_for_the_crawl_state():
+    def parse_abc(year):
+        raise ConnectionError("down")
+
+    recent = list(update_data._recent_years())
+    assert update_data.fetch_official_website(parse_abc, ARGS, {f"abc{recent[0]}"}) == [(recent[0], None)]
+
+
+def test_update_refreshes_a_given_core_table_in_place(conference_folder, real_conf_pair, clone, monkeypatch):
+    monkeypatch.setattr(update_data, "PIPELINE_STATE_FILE", str(conference_folder / "state.json"))
+    monkeypatch.setattr(update_data, "load_conferences",
+                        lambda transform: {key: transform(conf) for key, conf in clone(real_conf_pair).items()})
+    monkeypatch.setattr(update_data, "load_core_ranks", lambda: pytest.fail("the given table is reloaded"))
+    args = argparse.Namespace(historic=True, online=False, write=True, reestimate=False, load_nino_data=False,
+                              incremental=False, fetch_budget=None)
+    update_data.update(args, core_ranks={"abc": "A*"})
+    assert {conf["rating"] for conf in yaml_load((conference_folder / "abc.yaml").read_text()).values()} == {"A*"}
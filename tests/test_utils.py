@@ -10,8 +10,8 @@ import pytest
 
 from aideadlines.utils import (
     _parse_timestr,
+    deadline_epoch,
     join_conferences,
-    normalize_timezone_for_js,
     parse_all_times,
     parse_stuff,
     unite_tags,
@@ -36,10 +36,28 @@ class TestParseTimestr:
     def test_unparseable_returns_none(self):
         assert _parse_timestr("not a date xyz", with_time=True) is None
 
-    def test_named_timezone_replacement(self):
-        # CET is mapped via TZ_REPLACE; this pins the *current* observed conversion.
-        # (The exact UTC offset here is suspected buggy and may change in a later phase.)
-        assert _parse_timestr("May 1, 2025 18:00 CET", with_time=True) == "2025-05-01T16:00:00Z"
+    def test_named_timezone_abbreviation(self):
+        # CET is UTC+1. (The old str.replace table turned "CET" into "CEST" and got 16:00.)
+        assert _parse_timestr("May 1, 2025 18:00 CET", with_time=True) == "2025-05-01T17:00:00Z"
+
+    def test_abbreviation_inside_month_name_is_not_replaced(self):
+        # "PT" in "Sept" used to be rewritten to "SePST", leaving an unparseable string.
+        assert _parse_timestr("Sept 5, 2025 12:00 UTC", with_time=True) == "2025-09-05T12:00:00Z"
+
+    def test_named_zone_follows_daylight_saving(self):
+        assert _parse_timestr("Jan 15, 2025 12:00 Europe/Paris", with_time=True) == "2025-01-15T11:00:00Z"
+        assert _parse_timestr("Jul 15, 2025 12:00 Europe/Paris", with_time=True) == "2025-07-15T10:00:00Z"
+
+    def test_iana_conference_timezone(self):
+        # No time -> 23:59:59 local; Los Angeles is on PDT (UTC-7) in July.
+        out = _parse_timestr("2025-07-01", with_time=True, conf_tz="America/Los_Angeles")
+        assert out == "2025-07-02T06:59:59Z"
+
+    def test_deadline_epoch(self):
+        utc = datetime.timezone.utc
+        assert deadline_epoch("2025-01-15T23:59:59Z") == datetime.datetime(2025, 1, 15, 23, 59, 59, tzinfo=utc).timestamp()
+        assert deadline_epoch("Jan 15, 2025 23:59 UTC") == datetime.datetime(2025, 1, 15, 23, 59, tzinfo=utc).timestamp()
+        assert deadline_epoch("not a date") is None
 
     def test_datetime_input_passthrough(self):
         dt = datetime.datetime(2025, 3, 1, 10, 30, tzinfo=datetime.timezone.utc)
@@ -110,20 +128,6 @@ class TestJoinConferences:
 # --------------------------------------------------------------------------- #
 # unite_tags
 # --------------------------------------------------------------------------- #
-@pytest.mark.parametrize(
-    "raw,expected",
-    [
-        ("AoE", "Etc/GMT+12"),
-        ("UTC+5", "Etc/GMT-5"),  # POSIX sign flip
-        ("UTC-3", "Etc/GMT+3"),
-        ("Russia/Moscow", "Etc/GMT+3"),
-        ("Etc/GMT-2", "Etc/GMT-2"),  # already normalized -> unchanged
-    ],
-)
-def test_normalize_timezone_for_js(raw, expected):
-    assert normalize_timezone_for_js(raw) == expected
-
-
 def test_unite_tags_shares_sorted_union_across_group():
     group = {
         "a2025": {"id": "a2025", "tags": ["ML", "CV"], "timeline": []},
@@ -1,6 +1,10 @@
 """Tests for aideadlines.validate.validate_conferences."""
 
-from aideadlines.validate import validate_conferences
+import pytest
+
+from aideadlines import validate
+from aideadlines.store import ConferenceStore
+from aideadlines.validate import Problem, validate_conferences, validate_store
 
 
 def test_valid_conference_has_no_errors():
@@ -43,3 +47,29 @@ def test_missing_name_is_flagged():
         {"abc2025": {"id": "abc2025", "timeline": [{"deadline": "2025-01-15"}]}}
     )
     assert any("shortname or title" in e for e in errors)
+
+
+def test_problems_carry_file_key_and_index():
+    store = ConferenceStore(
+        {"abc2025": {"id": "abc2025", "title": "ABC", "timeline": [{"deadline": "2025-01-15T23:59:59Z"}, {}]}},
+        sources={"abc2025": "abc.yaml"},
+    )
+    assert validate_store(store) == [Problem("abc.yaml", "abc2025", 1, "missing 'deadline'")]
+
+
+def test_iso_deadlines_skip_the_date_parser(monkeypatch):
+    monkeypatch.setattr(validate, "_parse_timestr", lambda *args, **kwargs: pytest.fail("parser called"))
+    conf = {"id": "abc2025", "title": "ABC", "timeline": [{"deadline": "2025-01-15T23:59:59Z"}]}
+    assert validate_conferences({"abc2025": conf}) == []
+
+
+def test_deadline_after_start_is_a_warning():
+    conf = {
+        "id": "abc2025",
+        "title": "ABC",
+        "conferenceStartDate": "2025-06-01",
+        "timeline": [{"deadline": "2025-01-15T23:59:59Z"}, {"deadline": "Sep 18, 2025"}],
+    }
+    problems = validate_store(ConferenceStore({"abc2025": conf}, sources={"abc2025": "abc.yaml"}))
+    assert [(p.index, p.severity) for p in problems] == [(1, "warning")]
+    assert "after the start 2025-06-01" in problems[0].message
@@ -3,6 +3,9 @@ import re
 import subprocess
 from datetime import datetime
 
+from aideadlines.log_config import logger
+from aideadlines.pipeline import Pipeline
+
 THIS_DIR = os.path.dirname(__file__)
 REPO_URL = "https://github.com/tobna/ai-deadlines"
 GIT_USER = "tobna"
@@ -62,20 +65,24 @@ def main():
     failed_steps = 0
     try:
         token = load_token()
-        if token:
-            git_authenticated(["pull", REPO_URL], token)
+        pull = (lambda: git_authenticated(["pull", REPO_URL], token)) if token else None
 
+        # One process for all three stages: `update_data --online`, then `validate`, then
+        # `data_to_json --compact` (see aideadlines/pipeline.py). Every group is post-processed
+        # and the whole corpus validated and published. The pull runs inside the update,
+        # alongside the online fetches; loading waits for it.
+        pipeline = Pipeline(online=True, compact=True, pull=pull)
         print("run update script", flush=True)
-        failed_steps += run(["python3", "-m", "aideadlines.update_data", "--online"]).returncode != 0
+        failed_steps += not pipeline.update()
 
         print("validate conference data", flush=True)
-        if run(["python3", "-m", "aideadlines.validate"]).returncode != 0:
+        if not pipeline.validate():
             print("conference validation failed; aborting before json conversion and commit", flush=True)
             failed_steps += 1
             return
 
         print("convert data to json", flush=True)
-        failed_steps += run(["python3", "-m", "aideadlines.data_to_json"]).returncode != 0
+        failed_steps += not pipeline.export()
 
         if token:
             conferences_tracked = [f for f in os.listdir(os.path.join(THIS_DIR, "conferences")) if f.endswith(".yaml")]
@@ -85,6 +92,7 @@ def main():
             git_authenticated(["push", REPO_URL], token)
     finally:
         # Machine-readable last line for Uptime Kuma: keyword monitor on "=== PIPELINE OK ===".
+        logger.complete()  # the error.log sink is queued: let it catch up before counting
         errors = error_line_count()
         if errors == 0 and failed_steps == 0:
             print("=== PIPELINE OK ===", flush=True)